@@ -4,23 +4,21 @@ Context processor for example app navbar widgets.
 Provides sample notification data for demonstration purposes.
 """
 
+from mvp.context_processors import lazy_context
 
-def navbar_widgets(request):
-    """
-    Provide sample navbar widget data for all example app pages.
 
-    This ensures navbar widgets have demo data even when views don't
-    explicitly provide it.
-    """
-    # Sample notifications for demo purposes
-    notifications = [
+def get_notifications(request):
+    """Sample notifications for demo purposes."""
+    return [
         {"text": "Welcome to Django MVP!", "time": "Just now"},
         {"text": "Check out the navbar widgets demo", "time": "2 mins ago"},
         {"text": "All tests passing ✓", "time": "5 mins ago"},
     ]
 
-    # Sample messages for demo purposes
-    messages = [
+
+def get_messages(request):
+    """Sample messages for demo purposes."""
+    return [
         {
             "sender_name": "Alice Johnson",
             "sender_avatar": "https://i.pravatar.cc/150?img=1",
@@ -43,29 +41,40 @@ def navbar_widgets(request):
         },
     ]
 
-    # User avatar and member_since for user widget
-    user_avatar = None
-    user_member_since = None
 
+def get_user_avatar(request):
+    """Avatar URL from the user's profile, if one exists."""
     # Only access request.user if it exists (may not be available in tests)
-    if hasattr(request, "user") and request.user.is_authenticated:
-        # Try to get user avatar from profile (if exists)
-        if hasattr(request.user, "profile") and hasattr(request.user.profile, "avatar"):
-            user_avatar = (
-                request.user.profile.avatar.url if request.user.profile.avatar else None
-            )
+    user = getattr(request, "user", None)
+    if user is None or not user.is_authenticated:
+        return None
+    if hasattr(user, "profile") and hasattr(user.profile, "avatar"):
+        return user.profile.avatar.url if user.profile.avatar else None
+    return None
+
 
-        # Calculate member_since from date_joined
-        if hasattr(request.user, "date_joined"):
-            user_member_since = (
-                f"Member since {request.user.date_joined.strftime('%b %Y')}"
-            )
+def get_user_member_since(request):
+    """'Member since' label calculated from date_joined."""
+    user = getattr(request, "user", None)
+    if user is None or not user.is_authenticated or not hasattr(user, "date_joined"):
+        return None
+    return f"Member since {user.date_joined.strftime('%b %Y')}"
 
-    return {
-        "notifications_count": len(notifications),
-        "notifications": notifications,
-        "messages_count": len(messages),
-        "messages": messages,
-        "user_avatar": user_avatar,
-        "user_member_since": user_member_since,
-    }
+
+def navbar_widgets(request):
+    """
+    Provide sample navbar widget data for all example app pages.
+
+    This ensures navbar widgets have demo data even when views don't
+    explicitly provide it. Values are lazy, so pages that never render
+    the navbar widgets never build them.
+    """
+    return lazy_context(
+        request,
+        notifications=get_notifications,
+        notifications_count=lambda request: len(get_notifications(request)),
+        messages=get_messages,
+        messages_count=lambda request: len(get_messages(request)),
+        user_avatar=get_user_avatar,
+        user_member_since=get_user_member_since,
+    )
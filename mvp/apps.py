@@ -1,5 +1,9 @@
+import logging
+
 from django.apps import AppConfig
 
+logger = logging.getLogger(__name__)
+
 
 class MvpConfig(AppConfig):
     """Django app configuration for Django MVP."""
@@ -7,3 +11,38 @@ class MvpConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "mvp"
     verbose_name = "Django MVP"
+
+    def ready(self):
+        from mvp import checks  # noqa: F401
+        from mvp.conf import get_config
+        from mvp.tracing import get_configured_tracer
+
+        # Validate and freeze settings.MVP at startup rather than on the first request.
+        config = get_config()
+        # Import the tracer now, so that a wrong path or a missing library fails at startup.
+        get_configured_tracer()
+
+        if config["templates"]["warmup"]:
+            self.warm_templates()
+
+    def warm_templates(self):
+        """Precompile cotton components into the cached template loader.
+
+        django_cotton rebuilds the template engines in its own ready(), which would
+        discard anything compiled before it, so it must be loaded before mvp.
+        """
+        from django.apps import apps
+
+        from mvp.warmup import warm_templates
+
+        app_configs = list(apps.get_app_configs())
+        if apps.is_installed("django_cotton") and app_configs.index(
+            apps.get_app_config("django_cotton")
+        ) > app_configs.index(self):
+            logger.warning(
+                "Template warmup skipped: list 'django_cotton' before 'mvp' in INSTALLED_APPS, "
+                "or call mvp.warmup.warm_templates() from your server's worker startup hook."
+            )
+            return
+
+        warm_templates()
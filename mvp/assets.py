@@ -0,0 +1,172 @@
+"""Vendored third-party assets for django-mvp.
+
+``mvp/base.html`` loads Source Sans, the OverlayScrollbars and Bootstrap Icons
+stylesheets and the Bootstrap JS bundle from cdn.jsdelivr.net. That is the
+default, but the cross-origin requests can dominate page load and are not an
+option in air-gapped deployments. ``manage.py vendor_assets`` copies the pinned
+versions, including the fonts their stylesheets reference, into the static
+files under content-hashed names (safe to serve with ``Cache-Control:
+immutable``) plus a manifest. With ``MVP["assets"]["vendored"]`` enabled,
+``base.html`` links the vendored copies instead.
+
+Assets are downloaded from the CDN, or copied from an npm ``node_modules``
+directory with ``--source``::
+
+    $ npm install @fontsource/source-sans-3@5.0.12 overlayscrollbars@2.11.0 \\
+        bootstrap-icons@1.13.1 bootstrap@5.3.8
+    $ python manage.py vendor_assets --source node_modules
+"""
+
+from __future__ import annotations
+
+import base64
+import functools
+import hashlib
+import json
+import posixpath
+import re
+import urllib.request
+from dataclasses import dataclass
+from pathlib import Path
+
+from django.contrib.staticfiles import finders
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.templatetags.static import static
+
+from mvp.conf import get_config
+from mvp.utils import write_atomic
+
+CDN_URL = "https://cdn.jsdelivr.net/npm/"
+
+# Static path of the manifest mapping each asset to its vendored file.
+ASSETS_MANIFEST = "mvp/vendor/manifest.json"
+
+# References to other files in vendored stylesheets, e.g. fonts.
+CSS_URL_RE = re.compile(r"""url\(\s*(?P<quote>["']?)(?P<url>[^"')]+)(?P=quote)\s*\)""")
+
+
+@dataclass(frozen=True)
+class Asset:
+    """A file of an npm package, as served by the CDN."""
+
+    package: str
+    version: str
+    path: str
+    integrity: str | None = None
+
+    @property
+    def url(self) -> str:
+        return f"{CDN_URL}{self.package}@{self.version}/{self.path}"
+
+
+# The third-party assets base.html loads, by name.
+ASSETS = {
+    "source-sans": Asset(
+        "@fontsource/source-sans-3",
+        "5.0.12",
+        "index.css",
+        integrity="sha256-tXJfXfp6Ewt1ilPzLDtQnJV4hclT9XuaZUKyUvmyr+Q=",
+    ),
+    "overlayscrollbars": Asset("overlayscrollbars", "2.11.0", "styles/overlayscrollbars.min.css"),
+    "bootstrap-icons": Asset("bootstrap-icons", "1.13.1", "font/bootstrap-icons.min.css"),
+    "bootstrap": Asset(
+        "bootstrap",
+        "5.3.8",
+        "dist/js/bootstrap.bundle.min.js",
+        integrity="sha384-FKyoEForCGlyvwx9Hj09JcYn3nv7wiPVlz7YYwJrWVcXK/BmnVDxM+D2scQbITxI",
+    ),
+}
+
+
+def fetch_asset(asset: Asset, source_dir: Path | None = None) -> bytes:
+    """Return the content of ``asset``, from ``source_dir`` (a ``node_modules`` directory) or the CDN."""
+    if source_dir is not None:
+        return (source_dir / asset.package / asset.path).read_bytes()
+    with urllib.request.urlopen(asset.url, timeout=30) as response:  # noqa: S310
+        return response.read()
+
+
+def check_integrity(asset: Asset, content: bytes) -> None:
+    """Check ``content`` against the subresource integrity hash of ``asset``, if it has one.
+
+    Raises:
+        ValueError: If the content does not match.
+    """
+    if asset.integrity is None:
+        return
+    algorithm, expected = asset.integrity.split("-", 1)
+    digest = base64.b64encode(hashlib.new(algorithm, content).digest()).decode()
+    if digest != expected:
+        raise ValueError(f"{asset.package}@{asset.version}/{asset.path} does not match its integrity hash.")
+
+
+def hashed_name(path: str, content: bytes) -> str:
+    """Return the base name of ``path`` with a content hash, e.g. ``bootstrap.bundle.min.3f2a1b4c5d6e.js``."""
+    stem, dot, ext = posixpath.basename(path).rpartition(".")
+    digest = hashlib.sha256(content).hexdigest()[:12]
+    return f"{stem}.{digest}.{ext}" if dot else f"{ext}.{digest}"
+
+
+def vendor_assets(output_dir: Path, source_dir: Path | None = None) -> dict[str, str]:
+    """Copy every asset into ``output_dir`` under a content-hashed name.
+
+    Files referenced by stylesheets with relative ``url()``s are copied to
+    ``mvp/vendor/files/`` and the references rewritten.
+
+    Returns:
+        dict: The manifest, mapping each asset name to its static path.
+    """
+    manifest = {}
+    for name, asset in ASSETS.items():
+        content = fetch_asset(asset, source_dir)
+        check_integrity(asset, content)
+        if asset.path.endswith(".css"):
+            content = _vendor_references(asset, content.decode("utf-8"), output_dir, source_dir).encode("utf-8")
+        relative = f"mvp/vendor/{hashed_name(asset.path, content)}"
+        write_atomic(output_dir / relative, content)
+        manifest[name] = relative
+    write_atomic(output_dir / ASSETS_MANIFEST, json.dumps(manifest, indent=2) + "\n")
+    return manifest
+
+
+def _vendor_references(asset: Asset, css: str, output_dir: Path, source_dir: Path | None) -> str:
+    copied = {}
+
+    def replace(match: re.Match) -> str:
+        url = match["url"].strip()
+        if url.startswith(("data:", "#", "/")) or "://" in url:
+            return match[0]
+        path = posixpath.normpath(posixpath.join(posixpath.dirname(asset.path), url.split("?")[0].split("#")[0]))
+        if path not in copied:
+            content = fetch_asset(Asset(asset.package, asset.version, path), source_dir)
+            copied[path] = f"files/{hashed_name(path, content)}"
+            write_atomic(output_dir / "mvp/vendor" / copied[path], content)
+        return f'url("{copied[path]}")'
+
+    return CSS_URL_RE.sub(replace, css)
+
+
+@functools.cache
+def get_asset(name: str) -> dict[str, str | None]:
+    """Return the ``url``, ``integrity`` and ``crossorigin`` attributes to load asset ``name`` with.
+
+    Raises:
+        ImproperlyConfigured: If vendored assets are enabled but not built.
+    """
+    asset = ASSETS[name]
+    if not get_config()["assets"]["vendored"]:
+        return {"url": asset.url, "integrity": asset.integrity, "crossorigin": "anonymous"}
+    manifest_path = finders.find(ASSETS_MANIFEST)
+    if manifest_path is None:
+        raise ImproperlyConfigured(f"{ASSETS_MANIFEST} not found; run `manage.py vendor_assets`.")
+    with open(manifest_path, encoding="utf-8") as fh:
+        manifest = json.load(fh)
+    return {"url": static(manifest[name]), "integrity": None, "crossorigin": None}
+
+
+@receiver(setting_changed, dispatch_uid="mvp.assets.reset")
+def _on_setting_changed(*, setting, **kwargs) -> None:
+    if setting in {"MVP", "STATIC_URL", "STATICFILES_DIRS", "STORAGES"}:
+        get_asset.cache_clear()
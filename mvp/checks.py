@@ -0,0 +1,69 @@
+"""System checks for django-mvp."""
+
+import contextlib
+
+from django.core import checks
+
+from mvp.conf import get_config
+from mvp.form_renderers import FALLBACK_RENDERER, get_form_renderer
+
+
+def _all_subclasses(cls):
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _all_subclasses(subclass)
+
+
+@checks.register(checks.Tags.urls)
+def check_form_renderers(app_configs=None, **kwargs):
+    """Warn once about form views whose explicit ``form_renderer`` cannot be used.
+
+    Views are discovered through the URLconf, so only views that are importable
+    from it are checked.
+    """
+    from django.urls import get_resolver
+
+    from mvp.views import MVPFormViewMixin
+
+    # Importing the URLconf imports the view modules. URLconf errors are
+    # reported by Django's own checks.
+    with contextlib.suppress(Exception):
+        get_resolver().url_patterns  # noqa: B018
+
+    misconfigured: dict[str, list[str]] = {}
+    for view in _all_subclasses(MVPFormViewMixin):
+        name = view.__dict__.get("form_renderer")
+        if not name:
+            continue
+        renderer = get_form_renderer(name)
+        if renderer is None or not renderer.is_available:
+            misconfigured.setdefault(name, []).append(f"{view.__module__}.{view.__qualname__}")
+
+    warnings = []
+    for name, views in misconfigured.items():
+        renderer = get_form_renderer(name)
+        reason = f"requires '{renderer.requires}', which is not installed" if renderer else "is not registered"
+        warnings.append(
+            checks.Warning(
+                f"form_renderer={name!r} {reason}. Falling back to the {FALLBACK_RENDERER!r} renderer.",
+                hint=f"Affected views: {', '.join(sorted(views))}.",
+                obj=name,
+                id="mvp.W001",
+            )
+        )
+    return warnings
+
+
+@checks.register()
+def check_styles(app_configs=None, **kwargs):
+    """Warn when critical CSS is enabled without the prebuilt styles it is extracted into."""
+    config = get_config()["styles"]
+    if config["critical"] and not config["prebuilt"]:
+        return [
+            checks.Warning(
+                'MVP["styles"]["critical"] requires MVP["styles"]["prebuilt"]; critical CSS is not inlined.',
+                hint='Enable MVP["styles"]["prebuilt"] and run `manage.py build_styles`.',
+                id="mvp.W002",
+            )
+        ]
+    return []
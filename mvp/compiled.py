@@ -0,0 +1,171 @@
+"""Compiled render functions for hot django-mvp components.
+
+Leaf components such as icons, grids, sidebar menu items and card parts are
+rendered hundreds of times per page. For a declared subset of them, a Python
+function produces exactly the HTML the template would, so their body skips the
+template engine (and, for the menu item, the nested ``<c-icon>`` components).
+
+Compiled components are opt-in and require the :class:`mvp.loaders.Loader`
+template loader::
+
+    MVP = {"templates": {"compiled_components": True}}
+
+The loader keeps the component's ``<c-vars>`` so that django_cotton still
+resolves defaults and attributes, and replaces the rest of the template with a
+``{% compiled_component %}`` tag that calls the registered function. A function
+is only used when the template is django-mvp's own; projects overriding a
+component (or a component it renders) keep their template.
+
+Every function must match its template's output exactly, as loaded with
+``MVP["templates"]["compact_whitespace"]`` (the default); ``tests/test_compiled.py``
+renders each one both ways and compares the results.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from django.template.base import render_value_in_context
+from django.utils.html import conditional_escape
+
+from mvp.icons import render_icon as render_cached_icon
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class CompiledComponent:
+    """A component template with an equivalent render function.
+
+    Attributes:
+        template_name: Template the function replaces (e.g. ``cotton/icon.html``).
+        render: Called with the component context; returns the rendered HTML.
+        uses: Templates of nested components the function renders itself. The
+            function is only used if these are django-mvp's own templates too.
+    """
+
+    template_name: str
+    render: Callable
+    uses: tuple[str, ...] = ()
+
+
+_registry: dict[str, CompiledComponent] = {}
+
+
+def register_compiled_component(template_name: str, *, uses: tuple[str, ...] = ()):
+    """Register the decorated function as the compiled version of ``template_name``."""
+
+    def decorator(func):
+        _registry[template_name] = CompiledComponent(template_name, func, uses)
+        return func
+
+    return decorator
+
+
+def get_compiled_component(template_name: str) -> CompiledComponent | None:
+    """Return the compiled component registered for ``template_name``, if any."""
+    return _registry.get(template_name)
+
+
+def lookup(context, name):
+    """Resolve ``name`` like a template variable, returning ``_MISSING`` if undefined."""
+    value = context.get(name, _MISSING)
+    if callable(value) and not getattr(value, "do_not_call_in_templates", False):
+        value = value()
+    return value
+
+
+def var(context, name) -> str:
+    """Render ``{{ name }}``."""
+    value = lookup(context, name)
+    if value is _MISSING:
+        return context.template.engine.string_if_invalid if context.template else ""
+    return render_value_in_context(value, context)
+
+
+def truthy(context, name) -> bool:
+    """Evaluate ``{% if name %}``."""
+    value = lookup(context, name)
+    return value is not _MISSING and bool(value)
+
+
+def render_icon(name, attrs) -> str:
+    """Render ``cotton/icon.html`` for ``name`` and the component attributes."""
+    kwargs = {key: value for key, value in attrs.items() if key != "name"}
+    return f"\n{conditional_escape(render_cached_icon(name, **kwargs))}\n"
+
+
+@register_compiled_component("cotton/icon.html")
+def icon(context) -> str:
+    name = lookup(context, "name")
+    return render_icon("" if name is _MISSING else name, lookup(context, "attrs").dict)
+
+
+@register_compiled_component("cotton/grid.html")
+def grid(context) -> str:
+    # Imported here because the mvp template library imports this module.
+    from mvp.templatetags.mvp import responsive
+
+    row_cols = f" row-cols-{var(context, 'cols')}" if truthy(context, "cols") else ""
+    return (
+        f'\n\n<div class="row{row_cols} {conditional_escape(responsive(context, "row-cols"))} '
+        f'g-{var(context, "gap")} {var(context, "class")}"\n'
+        f"{var(context, 'attrs')}>\n"
+        f"{var(context, 'slot')}\n"
+        f"</div>\n"
+    )
+
+
+@register_compiled_component("cotton/app/sidebar/menu/item.html", uses=("cotton/icon.html",))
+def sidebar_menu_item(context) -> str:
+    has_slot = truthy(context, "slot")
+    label = var(context, "label")
+    active = truthy(context, "active")
+    badge = ""
+    if truthy(context, "badge"):
+        badge = f'<span class="nav-badge badge {var(context, "badge_classes")}">{var(context, "badge")}</span>'
+    arrow = render_icon("chevron_right", {"name": "chevron_right", "class": "nav-arrow"}) if has_slot else ""
+    tree = ""
+    if has_slot:
+        tree = (
+            f'\n<ul class="nav nav-treeview"\nrole="navigation"\naria-label="{label}">\n{var(context, "slot")}\n</ul>\n'
+        )
+    icon_name = var(context, "icon")
+    return (
+        f'\n<li class="nav-item {"menu-open" if has_slot and active else ""}">\n'
+        f'<a href="{"#" if has_slot else var(context, "href")}"\n'
+        f'class="nav-link {"active" if active else ""}">\n'
+        f"{render_icon(icon_name, {'name': icon_name, 'class': 'nav-icon'})}\n"
+        f"<p>\n"
+        f"{label}\n"
+        f"{badge}\n"
+        f"{arrow}\n"
+        f"</p>\n"
+        f"</a>\n"
+        f"{tree}\n"
+        f"</li>\n"
+    )
+
+
+@register_compiled_component("cotton/card/body.html")
+def card_body(context) -> str:
+    tight = "p-0" if truthy(context, "tight") else ""
+    return f'\n<div class="card-body {tight} {var(context, "class")}">{var(context, "slot")}</div>\n'
+
+
+@register_compiled_component("cotton/card/wrapper.html")
+def card_wrapper(context) -> str:
+    fill = lookup(context, "fill")
+    variant = var(context, "variant")
+    classes = f"text-bg-{variant}" if fill == "card" else f"card-{variant}"
+    if fill == "outline":
+        classes += " card-outline"
+    if truthy(context, "collapsible") and truthy(context, "collapsed"):
+        classes += " collapsed-card"
+    return (
+        f'<div class="card {classes} {var(context, "class")}"\n'
+        f"{var(context, 'attrs')}>\n"
+        f"{var(context, 'slot')}\n"
+        f"</div>\n"
+    )
@@ -0,0 +1,144 @@
+"""Per-component render profiles of cotton component trees.
+
+Which ``c-*`` component makes a page slow is hard to tell from the template.
+With :class:`mvp.middleware.ComponentProfileMiddleware` installed, a request
+with ``?mvp_profile`` records every cotton component render as a tree of
+component names, aggregated by position in the tree, with the number of
+calls, the inclusive and exclusive (self) time, and the database queries run
+while rendering::
+
+    request                 calls=1   total=48.2ms  self=12.0ms  queries=2
+      c-app                 calls=1   total=36.2ms  self=1.3ms   queries=2
+        c-app.sidebar       calls=1   total=8.8ms   self=0.4ms   queries=0
+          ...
+
+``?mvp_profile`` appends the tree to HTML responses as a comment;
+``?mvp_profile=json`` returns it as JSON instead of the page. Profiles are only
+recorded with ``DEBUG`` enabled or for staff users.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+
+from django.db import connections
+from django_cotton.templatetags._component import CottonComponentNode
+
+# Query parameter that enables the profiler for a request.
+PROFILE_PARAM = "mvp_profile"
+
+
+class ProfileNode:
+    """Aggregated renders of one component at one position in the tree."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.seconds = 0.0
+        self.own_queries = 0
+        self.children: dict[str, ProfileNode] = {}
+
+    @property
+    def self_seconds(self) -> float:
+        """Time spent in this component, excluding its nested components."""
+        return self.seconds - sum(child.seconds for child in self.children.values())
+
+    @property
+    def queries(self) -> int:
+        """Queries run while rendering this component, including nested components."""
+        return self.own_queries + sum(child.queries for child in self.children.values())
+
+    def as_dict(self) -> dict:
+        """Return the node and its children, slowest first, as JSON-serializable data."""
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "time_ms": round(self.seconds * 1000, 2),
+            "self_ms": round(self.self_seconds * 1000, 2),
+            "queries": self.queries,
+            "children": [child.as_dict() for child in self.sorted_children()],
+        }
+
+    def as_text(self, depth: int = 0) -> str:
+        """Return the node and its children as indented lines, slowest first."""
+        line = (
+            f"{'  ' * depth}{self.name:<{max(40 - 2 * depth, 1)}} calls={self.calls:<5} "
+            f"total={self.seconds * 1000:.1f}ms  self={self.self_seconds * 1000:.1f}ms  queries={self.queries}"
+        )
+        return "\n".join([line, *(child.as_text(depth + 1) for child in self.sorted_children())])
+
+    def sorted_children(self) -> list[ProfileNode]:
+        return sorted(self.children.values(), key=lambda child: child.seconds, reverse=True)
+
+
+class ComponentProfile:
+    """Component render tree of one request."""
+
+    def __init__(self):
+        self.root = ProfileNode("request")
+        self.root.calls = 1
+        self._stack = [self.root]
+        self._started = time.perf_counter()
+
+    def enter(self, name: str) -> ProfileNode:
+        """Start a render of component ``name`` inside the current one."""
+        parent = self._stack[-1]
+        node = parent.children.get(name)
+        if node is None:
+            node = parent.children[name] = ProfileNode(name)
+        node.calls += 1
+        self._stack.append(node)
+        return node
+
+    def exit(self, node: ProfileNode, seconds: float) -> None:
+        """End the render of ``node``, which took ``seconds``."""
+        self._stack.pop()
+        node.seconds += seconds
+
+    def finish(self) -> None:
+        """Set the time of the whole request."""
+        self.root.seconds = time.perf_counter() - self._started
+
+    def count_query(self, execute, sql, params, many, context):
+        """Database execute wrapper attributing each query to the component being rendered."""
+        self._stack[-1].own_queries += 1
+        return execute(sql, params, many, context)
+
+
+_current: ContextVar[ComponentProfile | None] = ContextVar("mvp_component_profile", default=None)
+
+_original_render = CottonComponentNode.render
+
+
+def _profiled_render(self, context):
+    profile = _current.get()
+    if profile is None:
+        return _original_render(self, context)
+    node = profile.enter(f"c-{self.component_name}")
+    start = time.perf_counter()
+    try:
+        return _original_render(self, context)
+    finally:
+        profile.exit(node, time.perf_counter() - start)
+
+
+def install() -> None:
+    """Wrap cotton component rendering; outside a profiled request it only checks a context variable."""
+    CottonComponentNode.render = _profiled_render
+
+
+@contextmanager
+def profile_components():
+    """Record the components rendered inside the block and yield the profile."""
+    profile = ComponentProfile()
+    token = _current.set(profile)
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(profile.count_query))
+            yield profile
+    finally:
+        _current.reset(token)
+        profile.finish()
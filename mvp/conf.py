@@ -0,0 +1,237 @@
+"""Settings-driven configuration for django-mvp.
+
+Projects configure django-mvp through a single ``MVP`` dictionary in their
+settings. It is validated and deep-merged with :data:`DEFAULTS` once, then
+frozen and shared by every request. The configuration is rebuilt automatically
+when the ``MVP`` setting changes (e.g. ``override_settings`` in tests).
+
+Example:
+    # settings.py
+    MVP = {
+        "brand": {"text": "My Portal", "icon": "img/favicon.svg"},
+        "layout": {"fixed_sidebar": True},
+    }
+
+Request-specific values are layered on top of the shared configuration with
+:func:`set_request_config`, which never copies the base configuration.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from types import MappingProxyType
+from typing import Any
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+DEFAULTS: dict[str, Any] = {
+    "brand": {
+        "text": "Django MVP",
+        "logo": None,
+        "icon": None,
+    },
+    "layout": {
+        "fixed_sidebar": False,
+        "sidebar_expand": "lg",
+        "body_class": "sidebar-expand-lg bg-body-tertiary",
+        # Cookie the client stores the theme and sidebar states in, so the server
+        # renders them (see mvp.layout_state). None keeps them client-side.
+        "state_cookie": None,
+    },
+    "sidebar": {
+        "visible": True,
+        "width": "280px",
+    },
+    "footer": {
+        "visible": True,
+        "text": None,
+    },
+    "actions": [],
+    "icons": {
+        # Load the Bootstrap Icons webfont; disable when using the SVG sprite (see mvp.sprites).
+        "webfont": True,
+    },
+    "assets": {
+        # Serve the CDN assets from the static files (see mvp.assets).
+        "vendored": False,
+    },
+    "styles": {
+        # Link the stylesheets compiled by `manage.py build_styles` (see mvp.styles).
+        "prebuilt": False,
+        # Inline the app shell's critical CSS and load the stylesheets asynchronously.
+        # Requires "prebuilt".
+        "critical": False,
+        # SCSS files prepended to the package stylesheets at build time.
+        "overrides": [],
+    },
+    "timing": {
+        # Add the Server-Timing header (see mvp.timing); requires ServerTimingMiddleware.
+        "header": True,
+        # Log the stage timings to the "mvp.timing" logger.
+        "log": True,
+    },
+    "tracing": {
+        # Dotted path to the mvp.tracing.Tracer that stage spans are reported to,
+        # e.g. "mvp.tracing.OpenTelemetryTracer". None disables tracing.
+        "tracer": None,
+    },
+    "profiling": {
+        # Profiler for ?mvp_cprofile (see mvp.request_profile): "cprofile", "pyinstrument"
+        # (sampling, saved as collapsed stacks) or "auto" to use pyinstrument when installed.
+        "profiler": "auto",
+        # Directory profiles are stored in. None uses "mvp-profiles" in the temp directory.
+        "directory": None,
+        # Permission required in addition to staff status, e.g. "auth.view_user".
+        "permission": None,
+        # Profiles larger than this many bytes are discarded.
+        "max_size": 10 * 1024 * 1024,
+        # Maximum number of profiled requests per minute, across processes sharing the cache.
+        "rate": 10,
+        # Number of profiles kept; older ones are deleted.
+        "max_files": 50,
+        # Seconds profiles are kept.
+        "max_age": 24 * 60 * 60,
+    },
+    "templates": {
+        # Compile all cotton components when the app registry is ready (see mvp.warmup).
+        "warmup": False,
+        # Directory for compiled cotton templates shared between processes (see mvp.loaders).
+        "cache_dir": None,
+        # Resolve template names from an in-memory path index (see mvp.loaders).
+        "index": True,
+        # Render hot leaf components with Python functions (see mvp.compiled).
+        "compiled_components": False,
+        # Collapse indentation in django-mvp's own templates when they load (see mvp.loaders).
+        "compact_whitespace": True,
+    },
+}
+
+# Request attribute holding request-specific overrides.
+_REQUEST_ATTR = "_mvp_config_overlay"
+
+_config: Mapping[str, Any] | None = None
+
+
+def validate(overrides: Any, defaults: Mapping[str, Any] = DEFAULTS, path: str = "MVP") -> None:
+    """Validate ``overrides`` against the structure of ``defaults``.
+
+    Raises:
+        ImproperlyConfigured: If a key is unknown or a section has the wrong type.
+    """
+    if not isinstance(overrides, Mapping):
+        raise ImproperlyConfigured(f"{path} must be a dict, got {type(overrides).__name__}.")
+
+    for key, value in overrides.items():
+        if key not in defaults:
+            allowed = ", ".join(sorted(defaults))
+            raise ImproperlyConfigured(f"{path}[{key!r}] is not a recognised option. Allowed keys: {allowed}.")
+        default = defaults[key]
+        if isinstance(default, Mapping):
+            validate(value, default, f"{path}[{key!r}]")
+        elif isinstance(default, list) and not isinstance(value, list | tuple):
+            raise ImproperlyConfigured(f"{path}[{key!r}] must be a list, got {type(value).__name__}.")
+
+
+def deep_merge(base: Mapping[str, Any], overrides: Mapping[str, Any]) -> dict[str, Any]:
+    """Return a new dict with ``overrides`` merged recursively into ``base``."""
+    merged = dict(base)
+    for key, value in overrides.items():
+        if isinstance(value, Mapping) and isinstance(merged.get(key), Mapping):
+            merged[key] = deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list | tuple):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def get_config() -> Mapping[str, Any]:
+    """Return the shared, immutable django-mvp configuration.
+
+    Built from ``settings.MVP`` on first use and cached for the lifetime of the
+    process (or until the setting changes).
+    """
+    global _config
+    if _config is None:
+        overrides = getattr(settings, "MVP", {})
+        validate(overrides)
+        _config = freeze(deep_merge(DEFAULTS, overrides))
+    return _config
+
+
+def reload_config() -> None:
+    """Discard the cached configuration so it is rebuilt on next access."""
+    global _config
+    _config = None
+
+
+@receiver(setting_changed, dispatch_uid="mvp.conf.reload_config")
+def _on_setting_changed(*, setting, **kwargs) -> None:
+    if setting == "MVP":
+        reload_config()
+
+
+class ConfigOverlay(Mapping):
+    """Read-only view of a base configuration with overrides layered on top.
+
+    Lookups check the overrides first and fall back to the base. Nested sections
+    present in both are overlaid lazily, so creating an overlay costs nothing
+    beyond wrapping the two mappings.
+    """
+
+    __slots__ = ("_base", "_overrides")
+
+    def __init__(self, base: Mapping[str, Any], overrides: Mapping[str, Any]):
+        self._base = base
+        self._overrides = overrides
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._overrides:
+            return self._base[key]
+        value = self._overrides[key]
+        base_value = self._base.get(key)
+        if isinstance(value, Mapping) and isinstance(base_value, Mapping):
+            return ConfigOverlay(base_value, value)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._base
+        yield from (key for key in self._overrides if key not in self._base)
+
+    def __len__(self) -> int:
+        return len(self._base) + sum(1 for key in self._overrides if key not in self._base)
+
+    def __repr__(self) -> str:
+        return f"ConfigOverlay({dict(self)!r})"
+
+
+def set_request_config(request, overrides: Mapping[str, Any]) -> None:
+    """Layer request-specific configuration on top of the shared configuration.
+
+    Overrides are validated and merged with any previously set for the request.
+
+    Example:
+        set_request_config(request, {"brand": {"text": tenant.name}})
+    """
+    validate(overrides)
+    current = getattr(request, _REQUEST_ATTR, None)
+    setattr(request, _REQUEST_ATTR, freeze(deep_merge(current, overrides) if current else overrides))
+
+
+def get_request_config(request) -> Mapping[str, Any]:
+    """Return the configuration for ``request``, including any request overrides."""
+    config = get_config()
+    overrides = getattr(request, _REQUEST_ATTR, None)
+    if overrides:
+        return ConfigOverlay(config, overrides)
+    return config
@@ -1,38 +1,112 @@
 """Context processors for django-mvp."""
 
 import logging
+from collections.abc import Callable
+from typing import Any
+
+from mvp.conf import get_request_config
+from mvp.timing import timed
 
 logger = logging.getLogger(__name__)
 
+# Request attribute holding evaluated lazy context values.
+_LAZY_ATTR = "_mvp_lazy_context"
+
+_providers: dict[str, Callable] = {}
+
 
 def mvp_config(request):
     """Provide MVP configuration to all templates.
 
+    The configuration is built once from ``settings.MVP`` (see :mod:`mvp.conf`)
+    and shared between requests as an immutable mapping. Request-specific values
+    set with :func:`mvp.conf.set_request_config` are layered on top without
+    copying the shared configuration.
+
+    Returns:
+        dict: Dictionary containing 'mvp' key with the active configuration.
+    """
+    with timed("config"):
+        return {
+            "mvp": get_request_config(request),
+        }
+
+
+class LazyContextValue:
+    """Context value that is computed the first time a template touches it.
+
+    Django templates call callables when resolving variables, so placing an
+    instance in the context defers ``func(request)`` until the variable is
+    actually rendered, iterated or tested. The result is memoized on the request,
+    so every template rendered during the request shares a single evaluation.
+    Pages and fragments that never reference the variable pay nothing.
+
+    Python code reading the context directly receives the lazy object; call it
+    to obtain the value.
+    """
+
+    __slots__ = ("func", "name", "request")
+
+    def __init__(self, request, name: str, func: Callable):
+        self.request = request
+        self.name = name
+        self.func = func
+
+    def __call__(self) -> Any:
+        values = getattr(self.request, _LAZY_ATTR, None)
+        if values is None:
+            values = {}
+            setattr(self.request, _LAZY_ATTR, values)
+        if self.name not in values:
+            values[self.name] = self.func(self.request)
+        return values[self.name]
+
+    def __repr__(self) -> str:
+        return f"<LazyContextValue: {self.name}>"
+
+
+def lazy_context(request, **providers: Callable) -> dict[str, LazyContextValue]:
+    """Wrap ``provider(request)`` callables as lazy context values.
+
+    Use from any context processor to defer expensive values until a template
+    needs them.
+
+    Example:
+        def navbar_widgets(request):
+            return lazy_context(
+                request,
+                notifications=get_notifications,
+                notifications_count=lambda request: len(get_notifications(request)),
+            )
+    """
+    return {name: LazyContextValue(request, name, func) for name, func in providers.items()}
+
+
+def register_context_provider(name: str) -> Callable[[Callable], Callable]:
+    """Register ``func(request)`` as a named lazy context value.
+
+    Registered providers are exposed to every template by the
+    :func:`lazy_providers` context processor.
+
+    Example:
+        @register_context_provider("unread_messages")
+        def unread_messages(request):
+            return request.user.messages.unread()
+    """
+
+    def decorator(func: Callable) -> Callable:
+        if name in _providers and _providers[name] is not func:
+            logger.warning("Context provider %r is registered more than once; the last registration wins.", name)
+        _providers[name] = func
+        return func
+
+    return decorator
+
+
+def lazy_providers(request):
+    """Expose all registered context providers as lazy values.
+
     Returns:
-        dict: Dictionary containing 'mvp' key with default configuration.
+        dict: One :class:`LazyContextValue` per registered provider.
     """
-    config = {
-        "brand": {
-            "text": "Django MVP",
-            "logo": None,
-            "icon": None,
-        },
-        "layout": {
-            "fixed_sidebar": False,
-            "sidebar_expand": "lg",
-            "body_class": "sidebar-expand-lg bg-body-tertiary",
-        },
-        "sidebar": {
-            "visible": True,
-            "width": "280px",
-        },
-        "footer": {
-            "visible": True,
-            "text": None,
-        },
-        "actions": [],
-    }
-
-    return {
-        "mvp": config,
-    }
+    return lazy_context(request, **_providers)
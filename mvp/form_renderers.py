@@ -0,0 +1,128 @@
+"""Form renderer registry for django-mvp form views.
+
+A form renderer pairs a name (as used by ``MVPFormViewMixin.form_renderer``) with
+the cotton component that renders the form and the Django app it depends on.
+Availability is checked once per renderer and cached, so form views never run
+install detection per request.
+
+The built-in renderers, in auto-detection priority order, are:
+
+- ``crispy``: ``forms/crispy.html`` (requires ``crispy_forms``)
+- ``formset``: ``forms/formset.html`` (requires ``formset``)
+- ``django``: ``forms/django.html`` (always available, used as fallback)
+
+Third-party renderers register alongside them:
+
+    from mvp.form_renderers import register_form_renderer
+
+    register_form_renderer("floppy", component="floppyforms.form", requires="floppyforms", priority=150)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from mvp.utils import app_is_installed
+
+FALLBACK_RENDERER = "django"
+
+
+@dataclass(frozen=True)
+class FormRenderer:
+    """A registered form renderer.
+
+    Attributes:
+        name: Value accepted by ``MVPFormViewMixin.form_renderer``.
+        component: Cotton component used to render the form (e.g. ``forms.crispy``).
+        requires: App that must be installed for the renderer to be used, if any.
+        priority: Higher priorities win during auto-detection.
+    """
+
+    name: str
+    component: str
+    requires: str | None = None
+    priority: int = 0
+
+    @property
+    def is_available(self) -> bool:
+        return self.requires is None or app_is_installed(self.requires)
+
+
+_registry: dict[str, FormRenderer] = {}
+_resolved: dict[str | None, FormRenderer] = {}
+
+
+def register_form_renderer(
+    name: str,
+    *,
+    component: str | None = None,
+    requires: str | None = None,
+    priority: int = 0,
+) -> FormRenderer:
+    """Register (or replace) a form renderer.
+
+    Args:
+        name: Renderer name used by ``form_renderer``.
+        component: Cotton component name. Defaults to ``forms.<name>``.
+        requires: App label or path that must be installed for the renderer to be used.
+        priority: Auto-detection priority; the available renderer with the highest
+            priority is used when a view does not set ``form_renderer``.
+
+    Returns:
+        FormRenderer: The registered renderer.
+    """
+    renderer = FormRenderer(name, component or f"forms.{name}", requires, priority)
+    _registry[name] = renderer
+    _resolved.clear()
+    return renderer
+
+
+def get_form_renderers() -> list[FormRenderer]:
+    """Return all registered renderers, highest priority first."""
+    return sorted(_registry.values(), key=lambda renderer: renderer.priority, reverse=True)
+
+
+def get_form_renderer(name: str) -> FormRenderer | None:
+    """Return the registered renderer called ``name``, if any."""
+    return _registry.get(name)
+
+
+def resolve_form_renderer(requested: str | None = None) -> FormRenderer:
+    """Return the renderer to use for a view, memoized per requested name.
+
+    Args:
+        requested: Explicitly requested renderer name, or None to auto-detect.
+
+    Returns:
+        FormRenderer: The requested renderer if it is registered and available,
+        otherwise the highest-priority available renderer (auto-detection) or
+        the ``django`` fallback (explicit request that cannot be honoured).
+    """
+    try:
+        return _resolved[requested]
+    except KeyError:
+        pass
+
+    if requested:
+        renderer = _registry.get(requested)
+        if renderer is None or not renderer.is_available:
+            renderer = _registry[FALLBACK_RENDERER]
+    else:
+        renderer = next(r for r in get_form_renderers() if r.is_available)
+
+    _resolved[requested] = renderer
+    return renderer
+
+
+@receiver(setting_changed, dispatch_uid="mvp.form_renderers.reset")
+def _on_setting_changed(*, setting, **kwargs) -> None:
+    if setting == "INSTALLED_APPS":
+        _resolved.clear()
+
+
+register_form_renderer("crispy", requires="crispy_forms", priority=200)
+register_form_renderer("formset", requires="formset", priority=100)
+register_form_renderer(FALLBACK_RENDERER, priority=0)
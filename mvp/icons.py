@@ -0,0 +1,64 @@
+"""Memoized icon rendering for django-mvp.
+
+Icons are the most frequently rendered component: every ``<c-icon>`` resolves its
+renderer through easy_icons and builds the same markup again. :func:`render_icon`
+builds the HTML for each name and attribute set once per process and returns the
+cached, safe string afterwards.
+
+The cache is bypassed when ``DEBUG`` is on, so icon setting changes show up
+without a restart, and cleared whenever ``EASY_ICONS`` changes.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import Any
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.safestring import SafeString, mark_safe
+from easy_icons import utils as easy_icons
+
+
+def normalize_attrs(attrs: dict[str, Any]) -> tuple[tuple[str, Any], ...]:
+    """Return ``attrs`` as a cache key, ignoring order and the ``name`` attribute.
+
+    easy_icons sorts attributes when rendering, so the order never affects the output.
+    """
+    return tuple(sorted((key, value) for key, value in attrs.items() if key != "name"))
+
+
+def _render(name: str, renderer: str | None, attrs: tuple[tuple[str, Any], ...]) -> SafeString:
+    return mark_safe(easy_icons.icon(name, renderer=renderer, **dict(attrs)))
+
+
+_render_cached = functools.lru_cache(maxsize=1024)(_render)
+
+
+def render_icon(name: str, /, renderer: str | None = None, **attrs: Any) -> SafeString:
+    """Render an icon with easy_icons, memoized by name, renderer and attributes.
+
+    Args:
+        name: Icon name, as configured in ``EASY_ICONS``.
+        renderer: easy_icons renderer to use (auto-detected if None).
+        **attrs: HTML attributes for the icon. A ``name`` attribute is ignored.
+
+    Returns:
+        SafeString: The icon HTML.
+    """
+    key = normalize_attrs(attrs)
+    if settings.DEBUG:
+        return _render(name, renderer, key)
+    try:
+        hash(key)
+    except TypeError:
+        # Unhashable attribute values cannot be cached.
+        return _render(name, renderer, key)
+    return _render_cached(name, renderer, key)
+
+
+@receiver(setting_changed, dispatch_uid="mvp.icons.clear_cache")
+def _on_setting_changed(*, setting, **kwargs) -> None:
+    if setting.startswith("EASY_ICONS") or setting == "DEBUG":
+        _render_cached.cache_clear()
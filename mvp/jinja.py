@@ -0,0 +1,86 @@
+"""Jinja2 support for django-mvp.
+
+Hot views can be moved to Django's Jinja2 backend without forking the look and
+feel. :func:`environment` registers the django-mvp template helpers, and
+``mvp/components.html`` (in ``mvp/jinja2``) provides macros that render the same
+markup as the layout components:
+
+- ``app`` (``<c-app>``) and ``page`` (``<c-page>``)
+- ``list_grid`` (the object grid of ``mvp/list_view.html``), ``grid`` and ``list_empty``
+- ``footer_pagination`` (``<c-page.footer.pagination>``), ``page_footer`` and ``pagination``
+
+Example:
+    # settings.py
+    TEMPLATES = [
+        {
+            "BACKEND": "django.template.backends.jinja2.Jinja2",
+            "APP_DIRS": True,
+            "OPTIONS": {"environment": "mvp.jinja.environment"},
+        },
+        # ... DjangoTemplates backend for the rest of the site
+    ]
+
+    {# page.html #}
+    {% import "mvp/components.html" as mvp %}
+    {% call mvp.page(fixed_header=True) %}
+      {{ mvp.list_grid(object_list, list_item_template, grid_config) }}
+      {{ mvp.footer_pagination(page_obj, page_info=True) }}
+    {% endcall %}
+
+Requires the ``jinja2`` package.
+"""
+
+from __future__ import annotations
+
+from django.templatetags.static import static
+from django.urls import reverse
+from django.utils import translation
+from django.utils.safestring import SafeString, mark_safe
+from django_cotton.templatetags import Attrs
+from jinja2 import Environment, pass_context
+
+from mvp.templatetags.mvp import (
+    avatar_color,
+    generate_initials,
+    render_list_item,
+    responsive,
+    responsive_classes,
+    slot_exists,
+    slot_is_empty,
+)
+
+
+def html_attrs(attrs) -> SafeString:
+    """Render extra attributes exactly like cotton's ``{{ attrs }}``."""
+    return mark_safe(str(Attrs(dict(attrs))))
+
+
+def environment(**options) -> Environment:
+    """Build a Jinja2 environment with the django-mvp helpers installed."""
+    extensions = list(options.pop("extensions", []))
+    if "jinja2.ext.i18n" not in extensions:
+        extensions.append("jinja2.ext.i18n")
+
+    # Django's Jinja2 backend passes autoescape=True in options.
+    env = Environment(extensions=extensions, **options)  # noqa: S701
+    env.install_gettext_translations(translation, newstyle=True)
+    env.globals.update(
+        {
+            "static": static,
+            "url": reverse,
+            "html_attrs": html_attrs,
+            # The Django versions take the template context first; Jinja passes its own.
+            "render_list_item": pass_context(render_list_item),
+            "responsive": pass_context(responsive),
+            "responsive_classes": responsive_classes,
+            "slot_exists": slot_exists,
+        }
+    )
+    env.filters.update(
+        {
+            "avatar_color": avatar_color,
+            "generate_initials": generate_initials,
+            "slot_is_empty": slot_is_empty,
+        }
+    )
+    return env
@@ -0,0 +1,88 @@
+"""Server-rendered layout state for django-mvp.
+
+By default, the theme and sidebar states are kept in ``localStorage`` and
+``sessionStorage``, and an inline script at the top of ``mvp/base.html`` patches
+them into the page before it is painted. With ``MVP["layout"]["state_cookie"]``
+set, the client scripts also store them in that cookie, and ``<c-app>``,
+``<c-page.sidebar>`` and ``base.html`` render them on the server instead: the
+first response already has the right theme and classes, and the blocking script
+is left out. Until the cookie holds a state, e.g. on a visitor's first request,
+the script still applies the ``localStorage`` state.
+
+The cookie holds ``key=value`` pairs joined by ``&``:
+
+- ``scheme``: the applied color scheme, ``light`` or ``dark``
+- ``sidebar``: the app sidebar, ``collapse`` or ``open``
+- ``sidebar_left``, ``sidebar_right``: the page sidebars, ``collapsed`` or ``shown``
+
+Example:
+    MVP = {"layout": {"state_cookie": "mvp_layout"}}
+"""
+
+from __future__ import annotations
+
+from dataclasses import astuple, dataclass
+from urllib.parse import parse_qsl
+
+from mvp.conf import get_request_config
+
+# Request attribute caching the parsed state.
+_STATE_ATTR = "_mvp_layout_state"
+
+SCHEMES = ("light", "dark")
+SIDEBAR_STATES = ("collapse", "open")
+PAGE_SIDEBAR_STATES = ("collapsed", "shown")
+
+
+@dataclass(frozen=True)
+class LayoutState:
+    """Layout state stored by the client, each value None when not stored.
+
+    The state is false while nothing is stored, e.g. on a visitor's first request.
+    """
+
+    scheme: str | None = None
+    sidebar: str | None = None
+    sidebar_left: str | None = None
+    sidebar_right: str | None = None
+
+    @classmethod
+    def from_cookie(cls, value: str) -> LayoutState:
+        """Parse a cookie value, ignoring unknown keys and invalid values."""
+        allowed = {
+            "scheme": SCHEMES,
+            "sidebar": SIDEBAR_STATES,
+            "sidebar_left": PAGE_SIDEBAR_STATES,
+            "sidebar_right": PAGE_SIDEBAR_STATES,
+        }
+        values = {key: value for key, value in parse_qsl(value) if value in allowed.get(key, ())}
+        return cls(**values)
+
+    def __bool__(self) -> bool:
+        return any(value is not None for value in astuple(self))
+
+    def is_page_sidebar_collapsed(self, side: str, default):
+        """Return whether the page sidebar on ``side`` is collapsed, or ``default`` if not stored."""
+        stored = getattr(self, f"sidebar_{side}", None) if side in ("left", "right") else None
+        if stored is None:
+            return default
+        return stored == "collapsed"
+
+
+def get_layout_state(request) -> LayoutState | None:
+    """Return the layout state stored in the request's cookie.
+
+    Returns:
+        LayoutState | None: The state (empty, and false, if the cookie is not
+        set), or None if the state cookie is not enabled or there is no request.
+    """
+    if request is None:
+        return None
+    cookie = get_request_config(request)["layout"]["state_cookie"]
+    if not cookie:
+        return None
+    state = getattr(request, _STATE_ATTR, None)
+    if state is None:
+        state = LayoutState.from_cookie(request.COOKIES.get(cookie, ""))
+        setattr(request, _STATE_ATTR, state)
+    return state
@@ -0,0 +1,253 @@
+"""Template loaders for django-mvp.
+
+:class:`Loader` is a drop-in replacement for ``django_cotton.cotton_loader.Loader``
+that adds two optimisations:
+
+- An in-memory index from template name to file path, built once by walking the
+  template directories. Lookups, and in particular misses, become dictionary hits
+  instead of one filesystem probe per template directory. In DEBUG the index is
+  rebuilt when a template is not found (at most once per second) and whenever the
+  autoreloader resets the loaders.
+- An optional persistent cache of compiled cotton templates, so that new processes
+  load precompiled components instead of running the cotton compiler again.
+- Optional compiled render functions for hot django-mvp components
+  (``MVP["templates"]["compiled_components"]``, see :mod:`mvp.compiled`).
+- Whitespace compaction of django-mvp's own templates
+  (``MVP["templates"]["compact_whitespace"]``): indentation and blank lines are
+  collapsed to a single line break when a template is loaded, rather than
+  repeated in every rendered component. Line breaks are kept, so spacing
+  between inline elements is unchanged, and the content of ``<pre>``,
+  ``<textarea>`` and ``<script>`` elements and of ``{% verbatim %}`` and
+  ``{% show_code %}`` blocks is left alone.
+
+Compiled templates are stored in ``MVP["templates"]["cache_dir"]``, one file per
+template, named after a hash of the template source, the django-cotton version and
+the cache format. Entries are written atomically, so concurrent workers can share
+a directory, and stale entries are never read after an upgrade or a source edit.
+Build the cache ahead of time (e.g. during an image build) with::
+
+    python manage.py build_template_cache
+
+The loader searches the same directories as the cotton, filesystem and
+app_directories loaders combined, so it can replace all three. Because django_cotton
+only configures loaders automatically when its own loader is present, use
+``django_cotton.apps.SimpleAppConfig`` and configure the loaders and builtins
+explicitly::
+
+    INSTALLED_APPS = [..., "django_cotton.apps.SimpleAppConfig", ...]
+
+    TEMPLATES = [
+        {
+            "BACKEND": "django.template.backends.django.DjangoTemplates",
+            "OPTIONS": {
+                "loaders": [
+                    (
+                        "django.template.loaders.cached.Loader",
+                        ["mvp.loaders.Loader"],
+                    )
+                ],
+                "builtins": ["django_cotton.templatetags.cotton"],
+            },
+        }
+    ]
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+import time
+from collections import defaultdict
+from functools import cache
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+from django.apps import apps
+from django.template import Origin
+from django_cotton.cotton_loader import Loader as CottonLoader
+
+from mvp.compiled import get_compiled_component
+from mvp.conf import get_config
+from mvp.utils import write_atomic
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored format or the post-processing applied by Loader changes.
+CACHE_FORMAT = "1"
+
+# Matches the {% cotton:vars %} tags the cotton compiler emits for <c-vars>.
+VARS_TAG_RE = re.compile(r"{% cotton:vars\b.*?%}", re.DOTALL)
+
+# Whitespace-sensitive content that compact_whitespace() leaves alone.
+PRESERVED_WHITESPACE_RE = re.compile(
+    r"<(?P<tag>pre|textarea|script)\b.*?</(?P=tag)\s*>"
+    r"|{%\s*(?P<block>verbatim|show_code)\b.*?{%\s*end(?P=block)\s*%}",
+    re.DOTALL | re.IGNORECASE,
+)
+
+# Indentation and blank lines: a run of whitespace containing a line break.
+LINE_BREAK_WHITESPACE_RE = re.compile(r"[ \t\r\f\v]*\n\s*")
+
+# Minimum number of seconds between index rebuilds triggered by misses in DEBUG.
+INDEX_REFRESH_INTERVAL = 1.0
+
+
+@cache
+def get_cotton_version() -> str:
+    try:
+        return version("django-cotton")
+    except PackageNotFoundError:  # pragma: no cover - running from a source checkout
+        return "unknown"
+
+
+def get_cache_dir() -> Path | None:
+    """Return the configured compiled-template cache directory, if any."""
+    cache_dir = get_config()["templates"]["cache_dir"]
+    return Path(cache_dir) if cache_dir else None
+
+
+def get_cache_key(source: str) -> str:
+    """Return the cache key for a template source."""
+    fingerprint = f"{CACHE_FORMAT}\0{get_cotton_version()}\0{source}"
+    return hashlib.sha256(fingerprint.encode()).hexdigest()
+
+
+@cache
+def get_mvp_template_dir() -> str:
+    """Return the directory holding django-mvp's own templates."""
+    return os.path.join(apps.get_app_config("mvp").path, "templates", "")
+
+
+def build_template_index(dirs) -> dict[str, tuple[str, ...]]:
+    """Map every template name below ``dirs`` to its file paths, in directory order.
+
+    A name can exist in several directories; later paths are kept so that
+    ``{% extends %}`` of an overridden template with the same name still works.
+    """
+    index: dict[str, list[str]] = defaultdict(list)
+    for template_dir in dirs:
+        root = os.path.abspath(template_dir)
+        for dirpath, _dirnames, filenames in os.walk(root, followlinks=True):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                name = os.path.relpath(path, root).replace(os.sep, "/")
+                if path not in index[name]:
+                    index[name].append(path)
+    return {name: tuple(paths) for name, paths in index.items()}
+
+
+def compact_whitespace(template_string: str) -> str:
+    """Collapse every run of whitespace containing a line break to a single line break.
+
+    HTML renders a line break like any other whitespace, so the page looks the
+    same; whitespace-sensitive elements and blocks (``PRESERVED_WHITESPACE_RE``)
+    are kept as they are.
+    """
+    output = []
+    pos = 0
+    for match in PRESERVED_WHITESPACE_RE.finditer(template_string):
+        output.append(LINE_BREAK_WHITESPACE_RE.sub("\n", template_string[pos : match.start()]))
+        output.append(match[0])
+        pos = match.end()
+    output.append(LINE_BREAK_WHITESPACE_RE.sub("\n", template_string[pos:]))
+    return "".join(output)
+
+
+class Loader(CottonLoader):
+    """Cotton template loader with a template path index and an optional
+    persistent compiled-template cache."""
+
+    def __init__(self, engine, dirs=None):
+        super().__init__(engine, dirs)
+        self.cache_dir = get_cache_dir()
+        self.use_index = get_config()["templates"]["index"]
+        self.use_compiled_components = get_config()["templates"]["compiled_components"]
+        self.compact_whitespace = get_config()["templates"]["compact_whitespace"]
+        self._index: dict[str, tuple[str, ...]] | None = None
+        self._index_built_at = 0.0
+
+    def get_index(self) -> dict[str, tuple[str, ...]]:
+        """Return the template path index, building it on first use."""
+        if self._index is None:
+            self._index = build_template_index(self.get_dirs())
+            self._index_built_at = time.monotonic()
+        return self._index
+
+    def get_template_sources(self, template_name):
+        if not self.use_index:
+            yield from super().get_template_sources(template_name)
+            return
+
+        paths = self.get_index().get(template_name)
+        if paths is None and self.engine.debug and time.monotonic() - self._index_built_at > INDEX_REFRESH_INTERVAL:
+            # Pick up templates created since the index was built.
+            self._index = None
+            paths = self.get_index().get(template_name)
+
+        for path in paths or ():
+            yield Origin(name=path, template_name=template_name, loader=self)
+
+    def reset(self):
+        """Empty the template cache and the path index."""
+        super().reset()
+        self._index = None
+
+    def get_contents(self, origin):
+        cache_key = self.cache_handler.get_cache_key(origin)
+        cached_content = self.cache_handler.get_cached_template(cache_key)
+
+        if cached_content is not None:
+            return cached_content
+
+        compiled = self.compile(self._get_template_string(origin.name))
+        if self.use_compiled_components:
+            compiled = self.use_compiled_component(origin, compiled)
+        if self.compact_whitespace and origin.name.startswith(get_mvp_template_dir()):
+            compiled = compact_whitespace(compiled)
+        self.cache_handler.cache_template(cache_key, compiled)
+        return compiled
+
+    def is_mvp_template(self, template_name: str) -> bool:
+        """Return True if ``template_name`` resolves to django-mvp's own template."""
+        for origin in self.get_template_sources(template_name):
+            if os.path.isfile(origin.name):
+                return origin.name.startswith(get_mvp_template_dir())
+        return False
+
+    def use_compiled_component(self, origin, template_string: str) -> str:
+        """Replace a component body with its compiled render function, when one applies.
+
+        The ``{% cotton:vars %}`` tags are kept so django_cotton still extracts
+        the component's defaults.
+        """
+        component = get_compiled_component(origin.template_name)
+        if component is None or not origin.name.startswith(get_mvp_template_dir()):
+            return template_string
+        if not all(self.is_mvp_template(name) for name in component.uses):
+            return template_string
+        vars_tags = "".join(VARS_TAG_RE.findall(template_string))
+        return f'{vars_tags}{{% load mvp %}}{{% compiled_component "{component.template_name}" %}}'
+
+    def compile(self, template_string: str) -> str:
+        """Compile cotton syntax, reading from and writing to the disk cache when enabled."""
+        if "<c-" not in template_string and "{% cotton:verbatim" not in template_string:
+            return template_string
+
+        if self.cache_dir is None:
+            return self.cotton_compiler.process(template_string)
+
+        path = self.cache_dir / f"{get_cache_key(template_string)}.html"
+        try:
+            return path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            pass
+
+        compiled = self.cotton_compiler.process(template_string)
+        try:
+            write_atomic(path, compiled)
+        except OSError as exc:
+            # A read-only or full disk must never break rendering.
+            logger.warning("Could not write compiled template cache %s: %s", path, exc)
+        return compiled
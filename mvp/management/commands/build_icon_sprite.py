@@ -0,0 +1,62 @@
+"""Management command to build the SVG icon sprite."""
+
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from easy_icons.utils import resolve_icons
+
+from mvp.sprites import build_sprite, write_sprite
+from mvp.utils import get_static_output_dir
+
+
+class Command(BaseCommand):
+    """Collect the SVG of every configured icon into one content-hashed sprite."""
+
+    help = "Build a hashed SVG sprite from the icons of an easy_icons renderer"
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            "--source",
+            required=True,
+            help="Directory of SVG files, e.g. node_modules/bootstrap-icons/icons",
+        )
+        parser.add_argument(
+            "--renderer",
+            default="default",
+            help="EASY_ICONS renderer whose packs and icons are included (default: default)",
+        )
+        parser.add_argument(
+            "--output-dir",
+            help="Static files directory to write to (default: the first STATICFILES_DIRS entry)",
+        )
+        parser.add_argument(
+            "--strict",
+            action="store_true",
+            help="Fail if any icon has no SVG file",
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        source_dir = Path(options["source"])
+        if not source_dir.is_dir():
+            raise CommandError(f"{source_dir} is not a directory.")
+
+        renderer_config = getattr(settings, "EASY_ICONS", {}).get(options["renderer"])
+        if not isinstance(renderer_config, dict):
+            raise CommandError(f"EASY_ICONS has no renderer named {options['renderer']!r}.")
+
+        output_dir = get_static_output_dir(options["output_dir"])
+        if output_dir is None:
+            raise CommandError("Pass --output-dir or add a directory to STATICFILES_DIRS.")
+
+        sprite, missing = build_sprite(resolve_icons(renderer_config, options["renderer"]), source_dir)
+        if missing:
+            message = f"No SVG found for: {', '.join(missing)}"
+            if options["strict"]:
+                raise CommandError(message)
+            self.stderr.write(self.style.WARNING(message))
+
+        path = write_sprite(sprite, output_dir)
+        self.stdout.write(self.style.SUCCESS(f"✓ Wrote {path} ({sprite.count('<symbol')} icons)"))
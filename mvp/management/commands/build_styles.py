@@ -0,0 +1,31 @@
+"""Management command to compile the django-mvp stylesheets ahead of time."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from mvp.conf import get_config
+from mvp.styles import STYLES_MANIFEST, build_styles
+from mvp.utils import get_static_output_dir
+
+
+class Command(BaseCommand):
+    """Compile the package SCSS into content-hashed CSS files and a manifest."""
+
+    help = "Compile the django-mvp SCSS (with MVP['styles']['overrides']) into hashed CSS files"
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            "--output-dir",
+            help="Static files directory to write to (default: the first STATICFILES_DIRS entry)",
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        output_dir = get_static_output_dir(options["output_dir"])
+        if output_dir is None:
+            raise CommandError("Pass --output-dir or add a directory to STATICFILES_DIRS.")
+
+        manifest = build_styles(output_dir, get_config()["styles"]["overrides"])
+        for source, compiled in manifest.items():
+            self.stdout.write(self.style.SUCCESS(f"✓ {source} -> {compiled}"))
+        self.stdout.write(self.style.SUCCESS(f"✓ Wrote {output_dir / STYLES_MANIFEST}"))
@@ -0,0 +1,48 @@
+"""Management command to build the on-disk compiled template cache."""
+
+import shutil
+
+from django.core.management.base import BaseCommand, CommandError
+from django.template import TemplateDoesNotExist
+
+from mvp.loaders import Loader, get_cache_dir
+from mvp.warmup import get_component_template_names, get_django_engines, get_page_template_names
+
+
+class Command(BaseCommand):
+    """Compile cotton templates into MVP["templates"]["cache_dir"] ahead of time."""
+
+    help = "Build the compiled cotton template cache (e.g. during an image build)"
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            "--clear",
+            action="store_true",
+            help="Remove existing cache entries before building",
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        cache_dir = get_cache_dir()
+        if cache_dir is None:
+            raise CommandError('Set MVP = {"templates": {"cache_dir": "..."}} to enable the compiled template cache.')
+
+        if options["clear"] and cache_dir.exists():
+            shutil.rmtree(cache_dir)
+            self.stdout.write(self.style.SUCCESS(f"✓ Cleared {cache_dir}"))
+
+        compiled = 0
+        for engine in get_django_engines():
+            loader = Loader(engine)
+            for name in [*get_component_template_names(engine), *get_page_template_names()]:
+                for origin in loader.get_template_sources(name):
+                    try:
+                        source = loader._get_template_string(origin.name)
+                    except TemplateDoesNotExist:
+                        continue
+                    loader.compile(source)
+                    compiled += 1
+                    break
+
+        self.stdout.write(self.style.SUCCESS(f"✓ Compiled {compiled} templates into {cache_dir}"))
@@ -0,0 +1,43 @@
+"""Management command to vendor the third-party assets loaded by base.html."""
+
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from mvp.assets import ASSETS_MANIFEST, vendor_assets
+from mvp.utils import get_static_output_dir
+
+
+class Command(BaseCommand):
+    """Copy the CDN assets into the static files under content-hashed names."""
+
+    help = "Vendor the CDN fonts, stylesheets and scripts used by mvp/base.html into the static files"
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            "--source",
+            help="node_modules directory to copy the packages from (default: download from the CDN)",
+        )
+        parser.add_argument(
+            "--output-dir",
+            help="Static files directory to write to (default: the first STATICFILES_DIRS entry)",
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        source_dir = Path(options["source"]) if options["source"] else None
+        if source_dir is not None and not source_dir.is_dir():
+            raise CommandError(f"{source_dir} is not a directory.")
+
+        output_dir = get_static_output_dir(options["output_dir"])
+        if output_dir is None:
+            raise CommandError("Pass --output-dir or add a directory to STATICFILES_DIRS.")
+
+        try:
+            manifest = vendor_assets(output_dir, source_dir)
+        except (OSError, ValueError) as e:
+            raise CommandError(f"Could not vendor assets: {e}") from e
+        for name, path in manifest.items():
+            self.stdout.write(self.style.SUCCESS(f"✓ {name} -> {path}"))
+        self.stdout.write(self.style.SUCCESS(f"✓ Wrote {output_dir / ASSETS_MANIFEST}"))
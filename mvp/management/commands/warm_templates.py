@@ -0,0 +1,36 @@
+"""Management command to precompile django-mvp and project cotton components."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from mvp.warmup import warm_templates
+
+
+class Command(BaseCommand):
+    """Compile every cotton component into the cached template loader."""
+
+    help = "Precompile all cotton components and django-mvp page templates"
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            "templates",
+            nargs="*",
+            help="Template names to compile (default: all cotton components and mvp pages)",
+        )
+        parser.add_argument(
+            "--strict",
+            action="store_true",
+            help="Exit with an error if any template fails to compile",
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        result = warm_templates(options["templates"] or None)
+
+        for name, exc in result.failed.items():
+            self.stderr.write(f"✗ {name}: {exc}")
+
+        self.stdout.write(self.style.SUCCESS(f"✓ Compiled {len(result.warmed)} templates"))
+
+        if result.failed and options["strict"]:
+            raise CommandError(f"{len(result.failed)} templates failed to compile")
@@ -59,6 +59,17 @@ Active State:
     - Current view name matching menu item view_name
     - Parent menus expand when children are active
 
+Permissions:
+    Items gated with ``check=PermissionCheck("app.perm")`` are resolved in a single
+    batch per request against the user's cached permission set. The batched result
+    also yields ``get_visibility_key(request)``, a stable key for caching the
+    rendered sidebar.
+
+Badges:
+    ``extra_context["badge"]`` accepts a ``Badge(callable)`` provider. Providers are
+    evaluated lazily for visible items only, fetched in one cache batch per render,
+    and cached with a short TTL and stale-while-revalidate semantics.
+
 Rendering:
     Menus are rendered using the custom AdminLTERenderer which provides:
     - Bootstrap 5 compatible HTML structure
@@ -67,7 +78,20 @@ Rendering:
     - Badge and icon rendering support
 """
 
-from flex_menu import Menu, MenuItem
+import functools
+import hashlib
+import logging
+import time
+from collections.abc import Callable
+from typing import Any
+
+from asgiref.local import Local
+from django.core.cache import caches
+from django.core.signals import request_finished, request_started, setting_changed
+from django.dispatch import receiver
+from flex_menu import Menu, MenuItem, root
+
+logger = logging.getLogger(__name__)
 
 
 class MenuGroup(MenuItem):
@@ -128,3 +152,334 @@ class MenuCollapse(MenuItem):
 # Global menu instance for application navigation
 # Initially empty - users extend by importing and adding MenuItem instances
 AppMenu = Menu("AppMenu", children=[])
+
+
+# ---------------------------------------------------------------------------
+# Permission-based visibility
+# ---------------------------------------------------------------------------
+
+# Request attribute holding the batched permission result, as a tuple of
+# (permissions required by the menu tree, permissions granted to the user).
+_PERMISSIONS_ATTR = "_mvp_menu_permissions"
+
+
+class PermissionCheck:
+    """Visibility check that requires the user to hold all of the given permissions.
+
+    Pass an instance as the ``check`` argument of any menu item. Instead of calling
+    ``user.has_perm()`` once per item, the first check evaluated during a request
+    collects every permission required across the registered menu trees and
+    resolves them in a single batch against the user's cached permission set.
+    The result is stored on the request and reused by every other check.
+
+    Example:
+        MenuItem(
+            name="users",
+            view_name="users:list",
+            check=PermissionCheck("auth.view_user"),
+            extra_context={"label": "Users", "icon": "people"},
+        )
+    """
+
+    def __init__(self, *permissions: str):
+        self.permissions = frozenset(permissions)
+
+    def __call__(self, request, **kwargs) -> bool:
+        return self.permissions <= get_granted_permissions(request, self.permissions)
+
+    def __repr__(self) -> str:
+        return f"PermissionCheck({', '.join(sorted(self.permissions))})"
+
+
+def has_perms(*permissions: str) -> PermissionCheck:
+    """Shortcut for ``PermissionCheck(*permissions)``."""
+    return PermissionCheck(*permissions)
+
+
+def collect_permissions(menu: MenuItem = root) -> frozenset[str]:
+    """Return every permission required by ``PermissionCheck`` items below ``menu``.
+
+    Defaults to the flex_menu root so that all registered menus, including
+    ``AppMenu``, are covered by a single batch.
+    """
+    required: set[str] = set()
+    for item in (menu, *menu.descendants):
+        check = getattr(item, "_check", None)
+        if isinstance(check, PermissionCheck):
+            required.update(check.permissions)
+    return frozenset(required)
+
+
+def get_granted_permissions(request, permissions=frozenset()) -> frozenset[str]:
+    """Return the menu permissions granted to ``request.user``.
+
+    The result is computed once per request and cached on the request object.
+    ``permissions`` that were not part of the collected set (e.g. checks on
+    items that are not attached to a registered menu) trigger a single
+    recomputation that includes them.
+
+    Args:
+        request: The current HTTP request.
+        permissions: Additional permissions the caller needs resolved.
+
+    Returns:
+        frozenset[str]: Granted permissions, restricted to the required set.
+    """
+    cached = getattr(request, _PERMISSIONS_ATTR, None)
+    if cached is not None and permissions <= cached[0]:
+        return cached[1]
+
+    required = collect_permissions() | permissions
+    if cached is not None:
+        required |= cached[0]
+
+    granted = _resolve_permissions(getattr(request, "user", None), required)
+    setattr(request, _PERMISSIONS_ATTR, (required, granted))
+    return granted
+
+
+@functools.cache
+def _has_perm_only_backends() -> bool:
+    """Return whether an auth backend grants permissions that get_all_permissions() does not list.
+
+    Such backends, e.g. rule- or predicate-based ones, implement ``has_perm()``
+    without (or without matching) ``get_all_permissions()``.
+    """
+    # Imported here: the auth backends module imports models.
+    from django.contrib.auth import get_backends
+    from django.contrib.auth.backends import BaseBackend, ModelBackend
+
+    # has_perm() implementations that only check get_all_permissions().
+    set_based = (BaseBackend.has_perm, ModelBackend.has_perm)
+    return any(
+        hasattr(backend, "has_perm") and getattr(type(backend), "has_perm", None) not in set_based
+        for backend in get_backends()
+    )
+
+
+@receiver(setting_changed, dispatch_uid="mvp.menus.reset")
+def _on_setting_changed(*, setting, **kwargs) -> None:
+    if setting == "AUTHENTICATION_BACKENDS":
+        _has_perm_only_backends.cache_clear()
+
+
+def _resolve_permissions(user, required: frozenset[str]) -> frozenset[str]:
+    """Check ``required`` against the user's permission set in one pass.
+
+    Gives the same result as ``user.has_perm()`` for each permission.
+    """
+    if user is None or not required:
+        return frozenset()
+    if user.is_active and user.is_superuser:
+        # Mirrors User.has_perm(): active superusers hold every permission.
+        return required
+    # get_all_permissions() is cached on the user object by ModelBackend,
+    # so this costs at most one query per request regardless of menu size.
+    granted = required & frozenset(user.get_all_permissions())
+    if _has_perm_only_backends():
+        # get_all_permissions() skips backends that only implement has_perm().
+        granted |= frozenset(perm for perm in required - granted if user.has_perm(perm))
+    return granted
+
+
+def get_visibility_key(request) -> str:
+    """Return a stable key describing which permission-gated menu items are visible.
+
+    Two requests that resolve to the same granted permissions produce the same
+    key, which makes it suitable as part of a cache key for rendered sidebars,
+    e.g. ``{% cache 300 sidebar visibility_key %}``. Only ``PermissionCheck``
+    items are covered; custom callable checks are not reflected in the key.
+    """
+    granted = get_granted_permissions(request)
+    return hashlib.md5("|".join(sorted(granted)).encode()).hexdigest()  # noqa: S324
+
+
+# ---------------------------------------------------------------------------
+# Lazy badge providers
+# ---------------------------------------------------------------------------
+
+# Badge refreshes deferred until the current request has finished, and whether
+# a request is being handled.
+_pending_refreshes = Local()
+
+
+class Badge:
+    """Lazily evaluated, cached badge value for a menu item.
+
+    Place an instance in ``extra_context["badge"]`` instead of a precomputed value.
+    The callable is only evaluated when the item is actually rendered (i.e. it is
+    visible), and all badges in a rendered menu are fetched from the cache in one
+    batch. Values are cached for ``ttl`` seconds; for a further ``stale_ttl``
+    seconds the stale value is served while a single request refreshes it after
+    its response has been sent (stale-while-revalidate).
+
+    Args:
+        func: Callable ``func(request)`` returning the badge value. Falsy values
+            (e.g. ``0``) hide the badge.
+        ttl: Seconds a computed value is considered fresh.
+        stale_ttl: Seconds a stale value may still be served while refreshing.
+        key: Cache key fragment. Defaults to the callable's dotted path; required
+            for lambdas, nested functions, ``functools.partial`` objects and other
+            callables without a unique dotted path.
+        vary_on_user: Cache the value per user (default) or share it globally.
+        cache_alias: Name of the Django cache to use.
+
+    Example:
+        MenuItem(
+            name="tasks",
+            view_name="tasks:list",
+            extra_context={
+                "label": "Tasks",
+                "badge": Badge(lambda request: request.user.tasks.pending().count(), key="pending_tasks"),
+                "badge_classes": "text-bg-danger",
+            },
+        )
+    """
+
+    def __init__(
+        self,
+        func: Callable,
+        *,
+        ttl: int = 30,
+        stale_ttl: int = 300,
+        key: str | None = None,
+        vary_on_user: bool = True,
+        cache_alias: str = "default",
+    ):
+        self.func = func
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.key = key or self.default_key(func)
+        self.vary_on_user = vary_on_user
+        self.cache_alias = cache_alias
+
+    def __repr__(self) -> str:
+        return f"Badge({self.key})"
+
+    @staticmethod
+    def default_key(func: Callable) -> str:
+        """Return the dotted path of ``func`` as its cache key fragment.
+
+        Raises:
+            ValueError: If ``func`` has no dotted path that identifies it, e.g. a
+                lambda, whose values would share one cache entry with other lambdas.
+        """
+        module = getattr(func, "__module__", None)
+        qualname = getattr(func, "__qualname__", None)
+        if not module or not qualname or "<lambda>" in qualname or "<locals>" in qualname:
+            raise ValueError(f"Badge({func!r}) requires a key: the callable has no unique dotted path.")
+        return f"{module}.{qualname}"
+
+    def get_cache_key(self, request) -> str:
+        """Return the cache key for this badge and request."""
+        if not self.vary_on_user:
+            return f"mvp.badge:{self.key}"
+        user = getattr(request, "user", None)
+        return f"mvp.badge:{self.key}:{getattr(user, 'pk', None) or 'anon'}"
+
+    def compute(self, request) -> Any:
+        """Evaluate the badge callable, logging and hiding the badge on error."""
+        try:
+            return self.func(request)
+        except Exception:
+            logger.exception("Badge provider %s failed", self.key)
+            return None
+
+    def resolve(self, request) -> Any:
+        """Return the badge value for a single request."""
+        return resolve_badges(request, [self])[0]
+
+
+def resolve_badges(request, badges: list[Badge]) -> list[Any]:
+    """Resolve several badges with one cache round trip per cache backend.
+
+    Fresh values are returned from the cache. Missing values are computed
+    immediately and stored. Stale values are returned as-is and one refresh per
+    key is deferred until the end of the request.
+
+    Returns:
+        list: Badge values in the same order as ``badges``.
+    """
+    now = time.time()
+    keys = [badge.get_cache_key(request) for badge in badges]
+
+    entries: dict[str, tuple[Any, float]] = {}
+    for alias in {badge.cache_alias for badge in badges}:
+        entries.update(caches[alias].get_many([k for b, k in zip(badges, keys, strict=True) if b.cache_alias == alias]))
+
+    values = []
+    to_store: dict[tuple[str, int], dict[str, tuple[Any, float]]] = {}
+    for badge, key in zip(badges, keys, strict=True):
+        entry = entries.get(key)
+        if entry is None:
+            value = badge.compute(request)
+            timeout = badge.ttl + badge.stale_ttl
+            to_store.setdefault((badge.cache_alias, timeout), {})[key] = (value, now + badge.ttl)
+        else:
+            value, fresh_until = entry
+            if fresh_until < now:
+                _schedule_refresh(badge, request, key)
+        values.append(value)
+
+    for (alias, timeout), data in to_store.items():
+        caches[alias].set_many(data, timeout)
+
+    return values
+
+
+def resolve_menu_badges(menu: MenuItem) -> None:
+    """Replace ``Badge`` providers on the visible items of a processed menu with their values."""
+    items = []
+    stack = [menu]
+    while stack:
+        item = stack.pop()
+        if isinstance(item.extra_context.get("badge"), Badge):
+            items.append(item)
+        stack.extend(item.visible_children)
+
+    if not items:
+        return
+
+    values = resolve_badges(menu.request, [item.extra_context["badge"] for item in items])
+    for item, value in zip(items, values, strict=True):
+        item.extra_context["badge"] = value
+
+
+def _schedule_refresh(badge: Badge, request, key: str) -> None:
+    """Defer a refresh of a stale badge, ensuring only one request refreshes each key.
+
+    Outside a request cycle (e.g. in a management command) nothing would run the
+    deferred refresh, so the badge is refreshed right away.
+    """
+    if not caches[badge.cache_alias].add(f"{key}:refreshing", True, badge.stale_ttl):
+        return
+    if not getattr(_pending_refreshes, "active", False):
+        _refresh(badge, request, key)
+        return
+    if not hasattr(_pending_refreshes, "items"):
+        _pending_refreshes.items = []
+    _pending_refreshes.items.append((badge, request, key))
+
+
+def _refresh(badge: Badge, request, key: str) -> None:
+    cache = caches[badge.cache_alias]
+    value = badge.compute(request)
+    cache.set(key, (value, time.time() + badge.ttl), badge.ttl + badge.stale_ttl)
+    cache.delete(f"{key}:refreshing")
+
+
+@receiver(request_started, dispatch_uid="mvp.menus.track_request")
+def _on_request_started(**kwargs) -> None:
+    _pending_refreshes.active = True
+
+
+@receiver(request_finished, dispatch_uid="mvp.menus.refresh_stale_badges")
+def refresh_stale_badges(**kwargs) -> None:
+    """Recompute badges that were served stale during the finished request."""
+    _pending_refreshes.active = False
+    pending = getattr(_pending_refreshes, "items", None)
+    if not pending:
+        return
+    _pending_refreshes.items = []
+    for badge, request, key in pending:
+        _refresh(badge, request, key)
@@ -0,0 +1,171 @@
+"""Middleware for django-mvp."""
+
+from __future__ import annotations
+
+import logging
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.http import FileResponse, Http404, JsonResponse
+
+from mvp import component_profile, request_profile
+from mvp.conf import get_config
+from mvp.timing import Timings, timed, timing
+
+timing_logger = logging.getLogger("mvp.timing")
+
+
+class ServerTimingMiddleware:
+    """Report the time spent in each django-mvp stage of the request (see :mod:`mvp.timing`).
+
+    The ``Server-Timing`` header is added when the view returns; stages that run
+    later in a streamed response are only included in the log line, which is
+    emitted once the response content has been produced.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        timings = Timings()
+        with timing(timings):
+            response = self.get_response(request)
+
+        config = get_config()["timing"]
+        if config["header"]:
+            existing = response.get("Server-Timing")
+            response["Server-Timing"] = f"{existing}, {timings.header()}" if existing else timings.header()
+        if config["log"]:
+            if response.streaming:
+                response.streaming_content = self.stream(response.streaming_content, timings, request, response)
+            else:
+                self.log(timings, request, response)
+        return response
+
+    def process_template_response(self, request, response):
+        """Time the rendering of template responses, which happens after the view returns."""
+        render = response.render
+
+        def timed_render():
+            with timed("render"):
+                return render()
+
+        response.render = timed_render
+        return response
+
+    def stream(self, content, timings, request, response):
+        """Yield ``content``, recording stages, and log the timings at the end."""
+        chunks = iter(content)
+        while True:
+            with timing(timings):
+                chunk = next(chunks, None)
+            if chunk is None:
+                break
+            yield chunk
+        self.log(timings, request, response)
+
+    def log(self, timings, request, response):
+        stages = timings.as_dict()
+        timing_logger.info(
+            "%s %s %s %s",
+            request.method,
+            request.path,
+            response.status_code,
+            " ".join(f"{name}={values['dur']}ms" for name, values in stages.items()),
+            extra={
+                "server_timing": stages,
+                "method": request.method,
+                "path": request.path,
+                "status_code": response.status_code,
+            },
+        )
+
+
+class ComponentProfileMiddleware:
+    """Profile the cotton components rendered by a request (see :mod:`mvp.component_profile`).
+
+    Requests with ``?mvp_profile`` get the component tree appended to the page
+    as an HTML comment, and requests with ``?mvp_profile=json`` get it as JSON,
+    with ``DEBUG`` enabled or for staff users. Place it after
+    ``AuthenticationMiddleware``.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        component_profile.install()
+
+    def __call__(self, request):
+        mode = request.GET.get(component_profile.PROFILE_PARAM)
+        if mode is None or not (settings.DEBUG or getattr(getattr(request, "user", None), "is_staff", False)):
+            return self.get_response(request)
+
+        with component_profile.profile_components() as profile:
+            response = self.get_response(request)
+            # Streamed content is rendered while it is consumed.
+            content = b"".join(response.streaming_content) if response.streaming else response.content
+
+        if mode == "json":
+            return JsonResponse(profile.root.as_dict())
+        if "text/html" in response.get("Content-Type", ""):
+            content += f"\n<!-- mvp component profile\n{profile.root.as_text()}\n-->\n".encode()
+        if response.streaming:
+            response.streaming_content = [content]
+        else:
+            response.content = content
+            if response.has_header("Content-Length"):
+                response["Content-Length"] = str(len(content))
+        return response
+
+
+class RequestProfileMiddleware:
+    """Profile requests on demand for staff users (see :mod:`mvp.request_profile`).
+
+    Requests with ``?mvp_cprofile`` or an ``X-MVP-Profile`` header run under a
+    profiler; the profile is stored and its download URL returned in the
+    ``X-MVP-Profile`` response header, or ``rate-limited`` or ``too-large`` if
+    it was not stored. ``?mvp_cprofile_download=<name>`` downloads a profile.
+    Both are ignored for other users. Place it after ``AuthenticationMiddleware``;
+    only the middleware after it is profiled.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        download = request.GET.get(request_profile.DOWNLOAD_PARAM)
+        requested = request_profile.PROFILE_PARAM in request.GET or request_profile.PROFILE_HEADER in request.headers
+        if (download is None and not requested) or not request_profile.is_authorized(getattr(request, "user", None)):
+            return self.get_response(request)
+
+        if download is not None:
+            path = request_profile.get_profile_path(download)
+            if path is None:
+                raise Http404("Profile not found.")
+            return FileResponse(path.open("rb"), as_attachment=True, filename=path.name)
+
+        if not request_profile.acquire_rate_limit():
+            response = self.get_response(request)
+            response[request_profile.PROFILE_HEADER] = "rate-limited"
+            return response
+
+        profiler = request_profile.get_profiler()
+        try:
+            profiler.start()
+        except ValueError:
+            # Another profiler is already active in this thread.
+            return self.get_response(request)
+        try:
+            response = self.get_response(request)
+            # Streamed content is rendered while it is consumed.
+            if response.streaming:
+                response.streaming_content = [b"".join(response.streaming_content)]
+        finally:
+            profiler.stop()
+
+        name = request_profile.save_profile(profiler)
+        if name is None:
+            response[request_profile.PROFILE_HEADER] = "too-large"
+        else:
+            query = urlencode({request_profile.DOWNLOAD_PARAM: name})
+            response[request_profile.PROFILE_HEADER] = f"{request.path}?{query}"
+        return response
@@ -7,6 +7,8 @@ from typing import Any
 from flex_menu.menu import MenuItem
 from flex_menu.renderers import BaseRenderer
 
+from mvp.menus import Badge, get_visibility_key, resolve_menu_badges
+
 
 class AdminLTERenderer(BaseRenderer):
     """Renderer for AdminLTE 4 sidebar navigation.
@@ -18,8 +20,11 @@ class AdminLTERenderer(BaseRenderer):
     - MenuGroup items (section headers) sorted to bottom
     - Depth-based template selection for hierarchical menus
     - Active state detection based on current URL matching
-    - Icon and badge rendering via extra_context
+    - Icon and badge rendering via extra_context, with lazy ``Badge`` providers
+      resolved in one batch for the visible items of the menu
     - Bootstrap 5 compatible CSS classes and structure
+    - A ``visibility_key`` for the root container, derived from the batched
+      permission checks, usable as a stable cache key for the sidebar
 
     Templates are selected based on item depth and whether the item has children:
     - Depth 0: Container template (menus/container.html)
@@ -50,9 +55,20 @@ class AdminLTERenderer(BaseRenderer):
         We only add:
         - component_type for template selection
         - Child sorting (MenuGroup to bottom)
+        - visibility_key at depth 0 (stable key for caching the rendered menu)
+        - Badge resolution (batched at depth 0, per item if rendered standalone)
         """
+        if item.depth == 0 and item.request is not None:
+            resolve_menu_badges(item)
+
         context = super().get_context_data(item, **kwargs)
 
+        if item.depth == 0 and item.request is not None:
+            context["visibility_key"] = get_visibility_key(item.request)
+
+        if isinstance(context.get("badge"), Badge):
+            context["badge"] = context["badge"].resolve(item.request)
+
         # Sort children: MenuGroup to bottom, others in declaration order
         # Only sort at depth 0 (root menu container)
         children = context.get("children")
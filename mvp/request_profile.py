@@ -0,0 +1,183 @@
+"""On-demand profiles of production requests.
+
+Slow pages are hard to reproduce locally because the data differs. With
+:class:`mvp.middleware.RequestProfileMiddleware` installed, a staff user can
+profile a single request by adding ``?mvp_cprofile`` to its URL, or sending an
+``X-MVP-Profile`` header. The request runs under :mod:`cProfile`, or under the
+pyinstrument sampling profiler when it is installed, and the profile is saved
+to ``MVP["profiling"]["directory"]``:
+
+- cProfile profiles are ``.prof`` files for ``pstats``, snakeviz or gprof2dot
+- pyinstrument profiles are ``.collapsed`` stacks for flamegraph.pl or speedscope
+
+The response carries the download URL of the profile in its ``X-MVP-Profile``
+header. Downloads are restricted to the same users as profiling. Profiles
+larger than ``max_size`` are discarded, at most ``rate`` requests per minute
+are profiled, and profiles are deleted after ``max_age`` seconds or when more
+than ``max_files`` are stored.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import marshal
+import os
+import pstats
+import re
+import tempfile
+import time
+import uuid
+from importlib.util import find_spec
+from pathlib import Path
+
+from django.core.cache import cache
+
+from mvp.conf import get_config
+
+# Query parameter and header that enable the profiler for a request.
+PROFILE_PARAM = "mvp_cprofile"
+PROFILE_HEADER = "X-MVP-Profile"
+
+# Query parameter downloading a stored profile by name.
+DOWNLOAD_PARAM = "mvp_cprofile_download"
+
+# Names of stored profiles; anything else is refused by get_profile_path().
+PROFILE_NAME_RE = re.compile(r"^\d+-[0-9a-f]{32}\.(prof|collapsed)$")
+
+_RATE_KEY = "mvp.request_profile.rate.{minute}"
+
+
+def is_authorized(user) -> bool:
+    """Return whether ``user`` may profile requests and download profiles."""
+    if not getattr(user, "is_staff", False) or not user.is_active:
+        return False
+    permission = get_config()["profiling"]["permission"]
+    return permission is None or user.has_perm(permission)
+
+
+def get_profile_dir() -> Path:
+    """Return the directory profiles are stored in."""
+    directory = get_config()["profiling"]["directory"]
+    return Path(directory) if directory else Path(tempfile.gettempdir()) / "mvp-profiles"
+
+
+def get_profile_path(name: str) -> Path | None:
+    """Return the path of the stored profile ``name``, or None if there is none."""
+    if not PROFILE_NAME_RE.match(name):
+        return None
+    path = get_profile_dir() / name
+    return path if path.is_file() else None
+
+
+def acquire_rate_limit() -> bool:
+    """Count a profile against the per-minute limit; return False if it is exceeded."""
+    key = _RATE_KEY.format(minute=int(time.time() // 60))
+    cache.add(key, 0, timeout=60)
+    try:
+        return cache.incr(key) <= get_config()["profiling"]["rate"]
+    except ValueError:
+        # The key expired between add() and incr(), or the cache does not store keys
+        # (DummyCache), in which case profiles cannot be counted.
+        return True
+
+
+class CProfiler:
+    """Deterministic profiler saving ``pstats`` data."""
+
+    suffix = ".prof"
+
+    def __init__(self):
+        self.profiler = cProfile.Profile()
+
+    def start(self) -> None:
+        self.profiler.enable()
+
+    def stop(self) -> None:
+        self.profiler.disable()
+
+    def output(self) -> bytes:
+        """Return the profile in the ``pstats`` file format."""
+        return marshal.dumps(pstats.Stats(self.profiler).stats)
+
+
+class SamplingProfiler:
+    """pyinstrument sampling profiler saving collapsed stacks."""
+
+    suffix = ".collapsed"
+
+    def __init__(self):
+        from pyinstrument import Profiler
+
+        self.profiler = Profiler()
+
+    def start(self) -> None:
+        self.profiler.start()
+
+    def stop(self) -> None:
+        self.profiler.stop()
+
+    def output(self) -> bytes:
+        """Return one ``frame;frame;frame microseconds`` line per stack."""
+        lines = []
+
+        def collapse(frame, stack):
+            stack = [*stack, f"{frame.function} ({frame.file_path}:{frame.line_no})"]
+            self_time = frame.time - sum(child.time for child in frame.children)
+            if self_time > 0:
+                lines.append(f"{';'.join(stack)} {round(self_time * 1_000_000)}")
+            for child in frame.children:
+                collapse(child, stack)
+
+        root = self.profiler.last_session.root_frame()
+        if root is not None:
+            collapse(root, [])
+        return "\n".join(lines).encode()
+
+
+def get_profiler() -> CProfiler | SamplingProfiler:
+    """Return a new profiler of the kind set in ``MVP["profiling"]["profiler"]``."""
+    kind = get_config()["profiling"]["profiler"]
+    if kind == "pyinstrument" or (kind == "auto" and find_spec("pyinstrument")):
+        return SamplingProfiler()
+    return CProfiler()
+
+
+def save_profile(profiler: CProfiler | SamplingProfiler) -> str | None:
+    """Store the output of ``profiler`` and return its name, or None if it is too large."""
+    config = get_config()["profiling"]
+    data = profiler.output()
+    if len(data) > config["max_size"]:
+        return None
+
+    directory = get_profile_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    name = f"{int(time.time())}-{uuid.uuid4().hex}{profiler.suffix}"
+    # Profiles reveal code paths; mkstemp keeps them readable by their owner only.
+    fd, tmp_name = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, directory / name)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    prune_profiles()
+    return name
+
+
+def prune_profiles() -> None:
+    """Delete profiles older than ``max_age`` and all but the newest ``max_files``."""
+    config = get_config()["profiling"]
+    cutoff = time.time() - config["max_age"]
+    profiles = []
+    for path in get_profile_dir().iterdir():
+        if PROFILE_NAME_RE.match(path.name):
+            try:
+                profiles.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                # Pruned by another process.
+                continue
+    profiles.sort(reverse=True)
+    for index, (mtime, path) in enumerate(profiles):
+        if index >= config["max_files"] or mtime < cutoff:
+            path.unlink(missing_ok=True)
@@ -0,0 +1,142 @@
+"""SVG sprite icons for django-mvp.
+
+The default icon setup draws Bootstrap Icons with the webfont, which is a
+blocking cross-origin stylesheet plus a large font download on first paint.
+``manage.py build_icon_sprite`` instead collects the SVG of every icon the
+configured easy_icons renderer knows about into a single content-hashed sprite
+in the static files, and :class:`SpriteRenderer` draws icons from it with
+``<svg><use href="sprite.<hash>.svg#house"></use></svg>``.
+
+Example:
+    # settings.py
+    EASY_ICONS = {
+        "default": {
+            "renderer": "mvp.sprites.SpriteRenderer",
+            "packs": ["mvp.utils.BS5_ICONS"],
+        },
+    }
+    MVP = {"icons": {"webfont": False}}
+
+    $ python manage.py build_icon_sprite --source node_modules/bootstrap-icons/icons
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from html import escape
+from pathlib import Path
+from typing import Any
+
+from django.contrib.staticfiles import finders
+from django.core.exceptions import ImproperlyConfigured
+from django.templatetags.static import static
+from django.utils.safestring import SafeString
+from easy_icons.base import BaseRenderer
+
+from mvp.utils import write_atomic
+
+# Static path of the manifest naming the current sprite file.
+SPRITE_MANIFEST = "mvp/icons/sprite.json"
+
+SVG_RE = re.compile(r"<svg\b(?P<attrs>[^>]*)>(?P<body>.*)</svg>", re.DOTALL)
+VIEWBOX_RE = re.compile(r'viewBox="(?P<viewbox>[^"]+)"')
+
+
+def get_symbol_id(value: str) -> str:
+    """Return the sprite symbol id for an easy_icons identifier.
+
+    Bootstrap Icons classes (``"bi bi-house"``) map to the SVG file name
+    (``house``); any other value is used as the file name, without ``.svg``.
+    """
+    for token in value.split():
+        if token.startswith("bi-"):
+            return token[3:]
+    return value.strip().removesuffix(".svg")
+
+
+def build_sprite(icons: dict[str, str], source_dir: Path) -> tuple[str, list[str]]:
+    """Build an SVG sprite with one ``<symbol>`` per icon.
+
+    Args:
+        icons: Mapping of logical icon names to easy_icons identifiers.
+        source_dir: Directory containing one ``<symbol id>.svg`` file per icon,
+            e.g. the ``icons`` directory of the bootstrap-icons package.
+
+    Returns:
+        tuple: The sprite markup and the logical names whose SVG file was not found.
+    """
+    symbols = {}
+    missing = []
+    for name, value in sorted(icons.items()):
+        symbol_id = get_symbol_id(value)
+        if symbol_id in symbols:
+            continue
+        try:
+            source = (source_dir / f"{symbol_id}.svg").read_text(encoding="utf-8")
+        except FileNotFoundError:
+            missing.append(name)
+            continue
+        match = SVG_RE.search(source)
+        if match is None:
+            missing.append(name)
+            continue
+        viewbox = VIEWBOX_RE.search(match["attrs"])
+        viewbox_attr = f' viewBox="{viewbox["viewbox"]}"' if viewbox else ""
+        symbols[symbol_id] = f'<symbol id="{symbol_id}"{viewbox_attr}>{match["body"].strip()}</symbol>'
+
+    sprite = '<svg xmlns="http://www.w3.org/2000/svg">' + "".join(symbols.values()) + "</svg>\n"
+    return sprite, missing
+
+
+def write_sprite(sprite: str, output_dir: Path) -> Path:
+    """Write ``sprite`` under a content-hashed name and point the manifest at it.
+
+    Returns:
+        Path: The written sprite file.
+    """
+    digest = hashlib.sha256(sprite.encode()).hexdigest()[:12]
+    relative = f"mvp/icons/sprite.{digest}.svg"
+    path = output_dir / relative
+    write_atomic(path, sprite)
+    write_atomic(output_dir / SPRITE_MANIFEST, json.dumps({"sprite": relative}) + "\n")
+    return path
+
+
+def get_sprite_url() -> str:
+    """Return the URL of the current sprite, read from the manifest in the static files."""
+    manifest = finders.find(SPRITE_MANIFEST)
+    if manifest is None:
+        raise ImproperlyConfigured(f"{SPRITE_MANIFEST} not found; run `manage.py build_icon_sprite`.")
+    with open(manifest, encoding="utf-8") as fh:
+        return static(json.load(fh)["sprite"])
+
+
+class SpriteRenderer(BaseRenderer):
+    """easy_icons renderer that references symbols in the django-mvp icon sprite.
+
+    Args:
+        sprite_url: URL of the sprite. Defaults to the sprite written by
+            ``build_icon_sprite``, resolved on first render.
+    """
+
+    default_svg_attrs = {
+        "width": "1em",
+        "height": "1em",
+        "fill": "currentColor",
+        "aria-hidden": "true",
+    }
+
+    def __init__(self, *, sprite_url: str | None = None, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.sprite_url = sprite_url
+        self.default_attrs = {**self.default_svg_attrs, **self.default_attrs}
+
+    def render(self, name: str, **kwargs: Any) -> SafeString:
+        if self.sprite_url is None:
+            self.sprite_url = get_sprite_url()
+        symbol_id = get_symbol_id(self.get_icon(name))
+        css_class = f"bi {kwargs.pop('class', '')}".strip()
+        attrs = self.build_attrs(**{"class": css_class, **kwargs})
+        return self.safe_return(f'<svg{attrs}><use href="{escape(self.sprite_url)}#{symbol_id}"></use></svg>')
@@ -0,0 +1,74 @@
+/**
+ * Layout state cookie (see mvp.layout_state): stores the color scheme and the
+ * sidebar states in the cookie named by <html data-mvp-state-cookie>, so the
+ * server renders them on the next page load. Does nothing without the attribute.
+ * ES module, loaded by <c-app> when the state cookie is enabled.
+ */
+
+const COOKIE = document.documentElement.dataset.mvpStateCookie
+
+// One year
+const MAX_AGE = 31536000
+
+/**
+ * Read the stored state
+ * @returns {URLSearchParams} - The state as key/value pairs
+ */
+function readLayoutState() {
+  const prefix = COOKIE + '='
+  const cookie = document.cookie.split('; ').find(item => item.startsWith(prefix))
+  return new URLSearchParams(cookie ? cookie.slice(prefix.length) : '')
+}
+
+/**
+ * Store state values, keeping the others
+ * @param {Object} values - Keys and values to store
+ */
+function saveLayoutState(values) {
+  if (!COOKIE) return
+  const state = readLayoutState()
+  for (const [key, value] of Object.entries(values)) {
+    state.set(key, value)
+  }
+  document.cookie = `${COOKIE}=${state.toString()}; path=/; max-age=${MAX_AGE}; samesite=lax`
+}
+
+/**
+ * Copy the states still only kept in localStorage (by the theme switcher and
+ * AdminLTE) to the cookie, so that the server renders them from the next page
+ * on and the pre-paint script is no longer needed
+ */
+function seedLayoutState() {
+  if (!COOKIE) return
+  const state = readLayoutState()
+  const values = {}
+  try {
+    const theme = localStorage.getItem('theme')
+    if (!state.has('scheme') && theme) {
+      const dark = theme === 'dark' || (theme === 'auto' && window.matchMedia('(prefers-color-scheme: dark)').matches)
+      values.scheme = dark ? 'dark' : 'light'
+    }
+    const sidebar = localStorage.getItem('lte.sidebar.state')
+    if (!state.has('sidebar') && (sidebar === 'sidebar-collapse' || sidebar === 'sidebar-open')) {
+      values.sidebar = sidebar === 'sidebar-collapse' ? 'collapse' : 'open'
+    }
+  } catch (e) {
+    // localStorage may not be available
+  }
+  if (Object.keys(values).length) {
+    saveLayoutState(values)
+  }
+}
+
+seedLayoutState()
+
+// The AdminLTE sidebar toggle; its click handler has run by the time the click reaches the document
+document.addEventListener('click', function (event) {
+  if (event.target.closest('[data-lte-toggle="sidebar"]')) {
+    saveLayoutState({
+      sidebar: document.body.classList.contains('sidebar-collapse') ? 'collapse' : 'open',
+    })
+  }
+})
+
+export { readLayoutState, saveLayoutState }
@@ -0,0 +1,104 @@
+/**
+ * List view helpers for custom list item and page templates: expandable card
+ * text, clearing filters and the page info modal. ES module; templates that use
+ * them load it with {% require_script "js/modules/list-view.js" %}.
+ */
+
+/**
+ * Check if text element is being truncated
+ * @param {HTMLElement} element - The element to check
+ * @returns {boolean} - True if text is truncated
+ */
+function isTextTruncated(element) {
+  const computedStyle = window.getComputedStyle(element)
+  const lineHeight = parseFloat(computedStyle.lineHeight) || (parseFloat(computedStyle.fontSize) * 1.4)
+  const maxHeight = lineHeight * 6
+  return element.scrollHeight > maxHeight
+}
+
+/**
+ * Hide the expand buttons of card text that is not truncated
+ */
+function initializeExpandButtons() {
+  const buttons = document.querySelectorAll('.expand-btn')
+  if (buttons.length === 0) return
+  // Measure after layout, in one batch
+  requestAnimationFrame(() => {
+    buttons.forEach(button => {
+      const cardText = button.closest('.card-body').querySelector('.card-text')
+      if (cardText && !isTextTruncated(cardText)) {
+        button.style.display = 'none'
+      }
+    })
+  })
+}
+
+/**
+ * Toggle text expansion for card content
+ * @param {HTMLElement} button - The expand/collapse button
+ */
+function toggleExpand(button) {
+  const cardText = button.closest('.card-body').querySelector('.card-text')
+
+  if (!cardText) {
+    console.warn('Card text element not found')
+    return
+  }
+
+  const isExpanded = cardText.classList.contains('text-expanded')
+
+  if (isExpanded) {
+    cardText.classList.remove('text-expanded')
+    button.innerHTML = '<i class="bi bi-chevron-down me-1"></i>Show more'
+  } else {
+    cardText.classList.add('text-expanded')
+    button.innerHTML = '<i class="bi bi-chevron-up me-1"></i>Show less'
+  }
+}
+
+/**
+ * Clear all filters by reloading the page without query parameters
+ */
+function clearAllFilters() {
+  const url = new URL(window.location)
+  url.search = ''
+  window.location.href = url.toString()
+}
+
+/**
+ * Manage focus for the page info modal and open it with Ctrl/Cmd + I
+ */
+function initializePageInfoModal() {
+  const modal = document.getElementById('pageInfoModal')
+  const infoBtn = document.querySelector('.page-info-btn')
+  if (!modal || !infoBtn) return
+
+  modal.addEventListener('shown.bs.modal', function () {
+    // Focus the close button when modal is fully shown for accessibility
+    const closeBtn = modal.querySelector('.modal-footer .btn')
+    if (closeBtn) {
+      closeBtn.focus()
+    }
+  })
+
+  modal.addEventListener('hidden.bs.modal', function () {
+    // Return focus to the info button when modal is closed
+    infoBtn.focus()
+  })
+
+  document.addEventListener('keydown', function (event) {
+    if ((event.ctrlKey || event.metaKey) && event.key === 'i') {
+      event.preventDefault()
+      infoBtn.click()
+    }
+  })
+}
+
+initializeExpandButtons()
+initializePageInfoModal()
+
+// Make functions globally available for onclick handlers
+window.toggleExpand = toggleExpand
+window.clearAllFilters = clearAllFilters
+
+export { toggleExpand, clearAllFilters }
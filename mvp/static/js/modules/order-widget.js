@@ -0,0 +1,30 @@
+/**
+ * List ordering widget (<c-list.order-widget>): submits the chosen ordering
+ * through the filter sidebar form, or as the o parameter of the current URL.
+ * ES module, loaded by the component; clicks are delegated.
+ */
+
+document.addEventListener('click', function (event) {
+  const option = event.target.closest('.ordering-option[data-order-value]')
+  if (!option) return
+  event.preventDefault()
+
+  const orderValue = option.getAttribute('data-order-value')
+  const form = document.getElementById('sidebarFilterForm')
+  if (form) {
+    // Find or create the ordering input
+    let orderInput = form.querySelector('input[name="o"]')
+    if (!orderInput) {
+      orderInput = document.createElement('input')
+      orderInput.type = 'hidden'
+      orderInput.name = 'o'
+      form.appendChild(orderInput)
+    }
+    orderInput.value = orderValue
+    form.submit()
+    return
+  }
+  const url = new URL(window.location)
+  url.searchParams.set('o', orderValue)
+  window.location.href = url.toString()
+})
@@ -0,0 +1,52 @@
+/**
+ * List search widget (<c-list.search-widget>): keeps every search field on the
+ * page in sync and submits the search 500ms after typing stops, or on Enter.
+ * ES module, loaded by the component; events are delegated.
+ */
+
+const SEARCH_DELAY = 500
+
+let searchTimeout
+
+/**
+ * Submit the search from a field: through its form (the filter sidebar) if it
+ * has one, otherwise by setting the q parameter of the current URL.
+ * @param {HTMLInputElement} field - The search field
+ */
+function submitSearch(field) {
+  clearTimeout(searchTimeout)
+  if (field.form) {
+    field.form.submit()
+    return
+  }
+  const url = new URL(window.location)
+  if (field.value.trim()) {
+    url.searchParams.set('q', field.value)
+  } else {
+    url.searchParams.delete('q')
+  }
+  url.searchParams.delete('page')
+  window.location.href = url.toString()
+}
+
+document.addEventListener('input', function (event) {
+  const field = event.target
+  if (!field.matches('.search-field')) return
+
+  // Update other visible fields to stay in sync
+  document.querySelectorAll('.search-field').forEach(otherField => {
+    if (otherField !== field) {
+      otherField.value = field.value
+    }
+  })
+
+  clearTimeout(searchTimeout)
+  searchTimeout = setTimeout(() => submitSearch(field), SEARCH_DELAY)
+})
+
+document.addEventListener('keydown', function (event) {
+  if (event.key === 'Enter' && event.target.matches('.search-field')) {
+    event.preventDefault()
+    submitSearch(event.target)
+  }
+})
@@ -0,0 +1,121 @@
+"""Static files storage that precompresses what ``collectstatic`` writes.
+
+Static servers that support precompressed files (nginx ``gzip_static`` /
+``brotli_static``, WhiteNoise, most CDNs) can then send ``.gz`` and ``.br``
+variants straight from disk instead of compressing AdminLTE, the compiled
+django-mvp stylesheets and the vendored assets on every request, or sending
+them uncompressed.
+
+:class:`CompressedManifestStaticFilesStorage` hashes file names like Django's
+``ManifestStaticFilesStorage`` and, in the same ``collectstatic`` run, writes the
+variants for the original and hashed copy of each text file, using a pool of
+worker threads. Brotli variants require the ``brotli`` package (the ``brotli``
+extra); without it only gzip variants are written.
+
+Example:
+    STORAGES = {
+        "staticfiles": {
+            "BACKEND": "mvp.storage.CompressedManifestStaticFilesStorage",
+            "OPTIONS": {"workers": 8},
+        },
+        ...
+    }
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gzip
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+# Extensions of files worth compressing: text, and the uncompressed TrueType/OpenType and
+# EOT fonts. Raster images, WOFF/WOFF2 fonts and archives are already compressed.
+COMPRESSIBLE_EXTENSIONS = (
+    ".css",
+    ".js",
+    ".mjs",
+    ".map",
+    ".json",
+    ".svg",
+    ".html",
+    ".txt",
+    ".xml",
+    ".ttf",
+    ".eot",
+    ".otf",
+)
+
+# Files smaller than this (in bytes) fit in a single packet anyway.
+MIN_SIZE = 256
+
+# A variant is only kept if it is at most this fraction of the original size.
+MAX_RATIO = 0.95
+
+
+def compress_file(path: str, use_brotli: bool = True) -> list[str]:
+    """Write ``.gz`` (and ``.br``) variants of the file at ``path`` next to it.
+
+    Variants that would not be meaningfully smaller are skipped, and any variant
+    left next to ``path`` by an earlier run is then removed, so that servers do
+    not keep sending outdated content.
+
+    Returns:
+        list: The paths of the written variants.
+    """
+    with open(path, "rb") as fh:
+        content = fh.read()
+
+    variants = {}
+    if len(content) >= MIN_SIZE:
+        # mtime=0 keeps the output, and so caches and ETags, stable between builds.
+        variants[".gz"] = gzip.compress(content, compresslevel=9, mtime=0)
+        if use_brotli and brotli is not None:
+            variants[".br"] = brotli.compress(content, quality=11)
+
+    written = []
+    for suffix in (".gz", ".br"):
+        compressed = variants.get(suffix)
+        if compressed is not None and len(compressed) <= len(content) * MAX_RATIO:
+            with open(path + suffix, "wb") as fh:
+                fh.write(compressed)
+            written.append(path + suffix)
+        else:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path + suffix)
+    return written
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """``ManifestStaticFilesStorage`` that also writes gzip and brotli variants.
+
+    Args:
+        workers: Number of compression threads (default: the number of CPUs).
+        brotli: Write ``.br`` variants when the ``brotli`` package is installed.
+    """
+
+    def __init__(self, *args, workers: int | None = None, brotli: bool = True, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.workers = workers or os.cpu_count() or 1
+        self.use_brotli = brotli
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run, **options)
+        if dry_run:
+            return
+
+        names = {name for name in paths if name.endswith(COMPRESSIBLE_EXTENSIONS)}
+        names.update(self.stored_name(name) for name in list(names))
+        # zlib and brotli release the GIL while compressing, so the threads run in parallel.
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            written = pool.map(lambda name: compress_file(self.path(name), self.use_brotli), sorted(names))
+            for variants in written:
+                for variant in variants:
+                    yield os.path.relpath(variant, self.location), variant, True
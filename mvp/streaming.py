@@ -0,0 +1,88 @@
+"""Streaming responses for django-mvp views.
+
+Django renders a template to a single string, so nothing of a list page is sent
+until the view has counted, fetched and rendered the whole grid. With
+``stream = True`` on an MVP view, the response is a ``StreamingHttpResponse``
+instead: the page shell, from ``<head>`` (so the browser starts downloading the
+stylesheets and scripts) through the header, sidebar and the opening of the
+main area, is rendered and sent first, and the ``{% stream_content %}`` block of
+the template, where ``mvp/list_view.html`` and ``mvp/form_view.html`` put their
+page, is rendered and sent after it. List views defer their count and fetch
+queries to that block.
+
+Once the first chunk is sent, the status code, headers and cookies are final.
+Errors in the streamed block (e.g. an out of range page number) can only cut
+the response short, ``ATOMIC_REQUESTS`` transactions do not cover its queries,
+and messages displayed in it are not marked as read.
+
+Example:
+    class ProductListView(MVPListViewMixin, ListView):
+        model = Product
+        stream = True
+"""
+
+from __future__ import annotations
+
+import secrets
+from collections.abc import Iterator
+from copy import copy
+
+from django.template import TemplateSyntaxError
+
+from mvp.timing import timed
+
+# Context variable holding the ContentStream of a streamed render.
+STREAM_CONTEXT_KEY = "mvp_stream"
+
+
+class ContentStream:
+    """State of a streamed render, shared with the ``{% stream_content %}`` tag."""
+
+    def __init__(self):
+        # Random, so the page cannot contain the marker by accident or on purpose.
+        self.marker = f"<!-- mvp:stream {secrets.token_hex(8)} -->"
+        self._deferred = None
+
+    def defer(self, nodelist, context) -> str:
+        """Keep ``nodelist`` to render later and return the marker to render in its place.
+
+        The context is copied, so the nodelist renders with the variables, loaded
+        blocks and template it had at this point once the rest of the page is done.
+        """
+        if self._deferred is not None:
+            raise TemplateSyntaxError("A template can only stream one {% stream_content %} block.")
+        self._deferred = nodelist, copy(context)
+        return self.marker
+
+    def render_content(self) -> str:
+        """Render the deferred nodelist."""
+        nodelist, context = self._deferred
+        with timed("render"):
+            return nodelist.render(context)
+
+
+def stream_template(template, context: dict, request=None) -> Iterator[str]:
+    """Render ``template`` in chunks, the ``{% stream_content %}`` block last.
+
+    The rest of the page is rendered before this returns; the block is only
+    rendered when the iterator reaches it. A template without the block is
+    yielded as a single chunk.
+
+    Args:
+        template: A template from ``django.template.loader.get_template``.
+        context: The template context.
+        request: The current request, for the context processors.
+    """
+    stream = ContentStream()
+    with timed("render"):
+        shell = template.render({**context, STREAM_CONTEXT_KEY: stream}, request)
+    head, found, tail = shell.partition(stream.marker)
+    if not found:
+        return iter((shell,))
+
+    def chunks():
+        yield head
+        yield stream.render_content()
+        yield tail
+
+    return chunks()
@@ -0,0 +1,292 @@
+"""Prebuilt stylesheets for django-mvp.
+
+``mvp/base.html`` compiles the package SCSS through django-compressor and
+django-libsass, which runs libsass in the request path unless offline
+compression is set up. ``manage.py build_styles`` compiles the SCSS once, with
+any project overrides, into content-hashed CSS files plus a manifest in the
+static files. With ``MVP["styles"]["prebuilt"]`` enabled, ``base.html`` links
+those files directly and libsass is never needed at request time.
+
+The command also extracts the critical CSS of the app shell (header, sidebar,
+``.mvp-layout`` page grid and cards) from AdminLTE and the compiled stylesheets.
+With ``MVP["styles"]["critical"]`` enabled, ``base.html`` inlines it and loads
+the full stylesheets asynchronously.
+
+Overrides are SCSS files prepended to every stylesheet, typically to set the
+layout variables (declared ``!default``)::
+
+    MVP = {
+        "styles": {
+            "prebuilt": not DEBUG,
+            "overrides": [BASE_DIR / "styles" / "_mvp-variables.scss"],
+        },
+    }
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import re
+from pathlib import Path
+
+from django.contrib.staticfiles import finders
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.templatetags.static import static
+from django.utils.safestring import SafeString, mark_safe
+
+from mvp.conf import get_config
+from mvp.utils import write_atomic
+
+# Package stylesheets, as static paths, in the order base.html links them.
+STYLESHEETS = ("scss/mvp-layout.scss", "scss/mvp.scss")
+
+# Static path of the manifest mapping each stylesheet to its compiled file.
+STYLES_MANIFEST = "mvp/css/manifest.json"
+
+# Stylesheets, besides STYLESHEETS, that the critical CSS is extracted from.
+CRITICAL_SOURCES = ("css/adminlte.min.css",)
+
+# Classes of the app shell elements: the header, sidebar, main area and footer,
+# the .mvp-layout page grid and cards.
+_SHELL_CLASSES = (
+    r"app-wrapper|app-header|app-sidebar|app-main|app-content|app-footer"
+    r"|mvp-layout|mvp-header|mvp-sidebar|mvp-content|mvp-footer|card|card-body|card-header"
+)
+# Grid area codes of the .mvp-layout page grid (``layout="lhr-lpr-lfr"``), one per
+# row, as generated by scss/layout/_utils.scss.
+_GRID_LAYOUT_CLASSES = r"(?:lhr|lhh|hhr|hhh)-(?:lpr|lpp|ppr)-(?:lfr|lff|ffr|fff)"
+# Layout state classes set on the shell when the page is rendered; sidebar-open
+# is only set by scripts.
+_SHELL_STATE_CLASSES = (
+    rf"sidebar-(?!open)[\w-]+|layout-fixed|fixed-header|fixed-footer|mvp-[\w-]+|{_GRID_LAYOUT_CLASSES}"
+)
+
+# Selectors of the rules needed for the first paint: the document defaults and
+# the rules styling a shell element in a layout state, without hover or theme
+# variants. The custom properties they use are added from :root separately.
+CRITICAL_SELECTOR_RE = re.compile(
+    rf"""
+    ^(?:html|body|\*|\*?::?(?:before|after))$
+    |^(?![^\[]*\[)(?!.*:hover)  # no attribute selectors or hover states
+    (?!.*\.(?!(?:{_SHELL_CLASSES}|{_SHELL_STATE_CLASSES})(?![\w-])))  # only shell and state classes
+    .*\.(?:{_SHELL_CLASSES})(?![\w-])[^\s>+~]*$  # styling a shell element
+    """,
+    re.VERBOSE,
+)
+
+# Grouping at-rules for user preferences, left to the full stylesheets.
+_NON_CRITICAL_AT_RULES = ("@media (prefers-", "@media print")
+
+_CUSTOM_PROPERTY_RE = re.compile(r"var\((--[\w-]+)")
+
+_STRING_OR_COMMENT_RE = re.compile(r"(\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*')|/\*.*?\*/", re.DOTALL)
+
+# At-rules whose block contains rules rather than declarations.
+_GROUPING_AT_RULES = ("@media", "@supports", "@container", "@layer")
+
+
+def compile_stylesheet(path: str, overrides=()) -> str:
+    """Compile the package stylesheet at static ``path`` with ``overrides`` prepended.
+
+    Requires ``libsass``, which is only needed at build time.
+    """
+    import sass
+
+    source_path = Path(finders.find(path))
+    prelude = "".join(Path(override).read_text(encoding="utf-8") + "\n" for override in overrides)
+    return sass.compile(
+        string=prelude + source_path.read_text(encoding="utf-8"),
+        include_paths=[str(source_path.parent)],
+        output_style="compressed",
+    )
+
+
+def _split_rules(css: str):
+    """Yield ``(prelude, block)`` for each top-level rule in ``css``; ``block`` is None for statements."""
+    pos = 0
+    length = len(css)
+    while pos < length:
+        start = pos
+        while pos < length and css[pos] not in "{;":
+            if css[pos] in "\"'":
+                pos = css.index(css[pos], pos + 1)
+            pos += 1
+        if pos >= length:
+            return
+        prelude = css[start:pos].strip()
+        if css[pos] == ";":
+            pos += 1
+            yield prelude, None
+            continue
+        depth = 0
+        block_start = pos + 1
+        while pos < length:
+            char = css[pos]
+            if char in "\"'":
+                pos = css.index(char, pos + 1)
+            elif char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                if depth == 0:
+                    break
+            pos += 1
+        yield prelude, css[block_start:pos]
+        pos += 1
+
+
+def _split_selectors(prelude: str) -> list[str]:
+    """Split a selector list on the commas outside parentheses, e.g. in ``:not(a, b)``."""
+    selectors = []
+    depth = 0
+    start = 0
+    for index, char in enumerate(prelude):
+        if char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "," and depth == 0:
+            selectors.append(prelude[start:index].strip())
+            start = index + 1
+    selectors.append(prelude[start:].strip())
+    return selectors
+
+
+def extract_critical_css(css: str, selector_re: re.Pattern = CRITICAL_SELECTOR_RE) -> str:
+    """Return the rules of ``css`` with at least one selector matching ``selector_re``.
+
+    Only the matching selectors of each rule are kept. Grouping at-rules
+    (``@media``, ``@supports``, ...) are kept with the critical rules they
+    contain; fonts, keyframes and other at-rules are left to the full stylesheets.
+    """
+    css = _STRING_OR_COMMENT_RE.sub(lambda match: match[1] or "", css)
+    output = []
+    for prelude, block in _split_rules(css):
+        if block is None:
+            continue
+        if prelude.startswith(_NON_CRITICAL_AT_RULES):
+            continue
+        if prelude.startswith(_GROUPING_AT_RULES):
+            inner = extract_critical_css(block, selector_re)
+            if inner:
+                output.append(f"{prelude}{{{inner}}}")
+        elif not prelude.startswith("@"):
+            selectors = [selector for selector in _split_selectors(prelude) if selector_re.search(selector)]
+            if selectors:
+                output.append(f"{','.join(selectors)}{{{block.strip()}}}")
+    return "".join(output)
+
+
+def extract_root_variables(css: str, critical: str) -> str:
+    """Return a ``:root`` rule with the custom properties of ``css`` that ``critical`` uses.
+
+    Only the properties ``critical`` refers to through ``var()``, directly or
+    through other properties, are kept.
+    """
+    css = _STRING_OR_COMMENT_RE.sub(lambda match: match[1] or "", css)
+    declarations = {}
+    for prelude, block in _split_rules(css):
+        if block is not None and ":root" in _split_selectors(prelude):
+            for declaration in re.split(r";(?![^(]*\))", block):
+                name, _, value = declaration.partition(":")
+                if name.strip().startswith("--"):
+                    declarations[name.strip()] = value.strip()
+
+    pending = set(_CUSTOM_PROPERTY_RE.findall(critical))
+    used: set[str] = set()
+    while pending:
+        name = pending.pop()
+        used.add(name)
+        pending |= set(_CUSTOM_PROPERTY_RE.findall(declarations.get(name, ""))) - used
+    kept = [f"{name}:{declarations[name]}" for name in declarations if name in used]
+    return f":root{{{';'.join(kept)}}}" if kept else ""
+
+
+def _write_hashed(output_dir: Path, name: str, css: str) -> str:
+    digest = hashlib.sha256(css.encode()).hexdigest()[:12]
+    relative = f"mvp/css/{name}.{digest}.css"
+    write_atomic(output_dir / relative, css)
+    return relative
+
+
+def build_styles(output_dir: Path, overrides=()) -> dict[str, str]:
+    """Compile every package stylesheet into ``output_dir`` under a content-hashed name.
+
+    The critical CSS of all stylesheets, including ``CRITICAL_SOURCES``, and
+    the ``:root`` custom properties it uses are written alongside under the
+    ``"critical"`` key.
+
+    Returns:
+        dict: The manifest, mapping each stylesheet to its compiled static path.
+    """
+    manifest = {}
+    sources = [Path(finders.find(path)).read_text(encoding="utf-8") for path in CRITICAL_SOURCES]
+    for path in STYLESHEETS:
+        css = compile_stylesheet(path, overrides)
+        manifest[path] = _write_hashed(output_dir, Path(path).stem, css)
+        sources.append(css)
+    critical = "".join(extract_critical_css(css) for css in sources)
+    critical = "".join(extract_root_variables(css, critical) for css in sources) + critical
+    manifest["critical"] = _write_hashed(output_dir, "critical", critical)
+    write_atomic(output_dir / STYLES_MANIFEST, json.dumps(manifest, indent=2) + "\n")
+    return manifest
+
+
+def _read_static(path: str) -> str:
+    found = finders.find(path)
+    if found is None:
+        raise ImproperlyConfigured(f"{path} not found; run `manage.py build_styles`.")
+    with open(found, encoding="utf-8") as fh:
+        return fh.read()
+
+
+@functools.cache
+def get_manifest() -> dict[str, str]:
+    """Return the manifest written by ``build_styles``.
+
+    Raises:
+        ImproperlyConfigured: If the styles have not been built.
+    """
+    return json.loads(_read_static(STYLES_MANIFEST))
+
+
+@functools.cache
+def get_stylesheet_urls() -> tuple[str, ...]:
+    """Return the URLs of the prebuilt stylesheets, or nothing if they are not enabled.
+
+    Raises:
+        ImproperlyConfigured: If prebuilt styles are enabled but not built.
+    """
+    if not get_config()["styles"]["prebuilt"]:
+        return ()
+    manifest = get_manifest()
+    return tuple(static(manifest[path]) for path in STYLESHEETS)
+
+
+@functools.cache
+def get_critical_css() -> SafeString:
+    """Return the critical CSS to inline, or an empty string if it is not enabled.
+
+    Critical CSS is only built with the prebuilt styles; without them it is not
+    inlined (reported by the ``mvp.W002`` system check).
+
+    Raises:
+        ImproperlyConfigured: If critical CSS is enabled but not built.
+    """
+    config = get_config()["styles"]
+    if not (config["critical"] and config["prebuilt"]):
+        return mark_safe("")
+    # Keep the stylesheet from closing the <style> element.
+    return mark_safe(_read_static(get_manifest()["critical"]).replace("</", "<\\/"))
+
+
+@receiver(setting_changed, dispatch_uid="mvp.styles.reset")
+def _on_setting_changed(*, setting, **kwargs) -> None:
+    if setting in {"MVP", "STATIC_URL", "STATICFILES_DIRS", "STORAGES"}:
+        get_manifest.cache_clear()
+        get_stylesheet_urls.cache_clear()
+        get_critical_css.cache_clear()
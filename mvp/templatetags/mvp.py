@@ -1,13 +1,24 @@
 """Template tags and filters for MVP navbar widgets."""
 
+import functools
 import hashlib
 import textwrap
 
 from django import template
+from django.forms.utils import flatatt
 from django.template.loader import render_to_string
-from django.utils.html import escape
-from django.utils.safestring import mark_safe
+from django.templatetags.static import static
+from django.utils.html import escape, format_html, format_html_join
 from django_cotton.compiler_regex import CottonCompiler
+from flex_menu.templatetags import flex_menu
+
+from mvp.assets import get_asset
+from mvp.compiled import get_compiled_component
+from mvp.icons import render_icon
+from mvp.layout_state import get_layout_state
+from mvp.streaming import STREAM_CONTEXT_KEY
+from mvp.styles import get_critical_css, get_stylesheet_urls
+from mvp.timing import timed
 
 register = template.Library()
 
@@ -99,7 +110,18 @@ def render_list_item(context, item, template_name):
 
     new[name] = item
 
-    return render_to_string(template_name, new)
+    with timed("items", **{"mvp.template": str(template_name)}):
+        return render_to_string(template_name, new)
+
+
+@register.simple_tag(takes_context=True)
+def render_menu(context, menu, renderer=None, **kwargs):
+    """flex_menu's ``{% render_menu %}``, timed as the ``menu`` stage (see ``mvp.timing``).
+
+    Load ``mvp`` after ``flex_menu`` for this version to take precedence.
+    """
+    with timed("menu", **{"mvp.menu": str(getattr(menu, "name", menu))}):
+        return flex_menu.render_menu(context, menu, renderer=renderer, **kwargs)
 
 
 @register.filter
@@ -114,6 +136,162 @@ def slot_exists(*args):
     return any(not slot_is_empty(slot) for slot in args)
 
 
+@register.simple_tag
+def cached_icon(name, attrs=None, **kwargs):
+    """Render an icon once per process and reuse the HTML (see ``mvp.icons``).
+
+    Like easy_icons' ``{% icon %}``, ``attrs`` holds default attributes that
+    keyword arguments override.
+
+    Example:
+        {% cached_icon "home" class="nav-icon" %}
+        {% cached_icon name attrs.dict %}
+    """
+    return render_icon(name, **{**(attrs or {}), **kwargs})
+
+
+@register.simple_tag
+def mvp_asset(name):
+    """Return the ``url``, ``integrity`` and ``crossorigin`` of a third-party asset (see ``mvp.assets``).
+
+    The URL points to the CDN, or to the vendored copy if enabled.
+
+    Example:
+        {% mvp_asset "bootstrap" as bootstrap_js %}
+        <script src="{{ bootstrap_js.url }}"></script>
+    """
+    return get_asset(name)
+
+
+@register.simple_tag(takes_context=True)
+def mvp_layout_state(context):
+    """Return the layout state stored in the state cookie, or None if it is not enabled.
+
+    See ``mvp.layout_state``.
+
+    Example:
+        {% mvp_layout_state as layout_state %}
+    """
+    return get_layout_state(context.get("request"))
+
+
+@register.simple_tag(takes_context=True)
+def page_sidebar_collapsed(context, side, default):
+    """Return whether the page sidebar on ``side`` is collapsed, falling back to ``default``.
+
+    Example:
+        {% page_sidebar_collapsed side collapsed as collapsed %}
+    """
+    state = get_layout_state(context.get("request"))
+    return default if state is None else state.is_page_sidebar_collapsed(side, default)
+
+
+# Request attribute tracking the scripts required while rendering the page.
+SCRIPTS_ATTR = "_mvp_scripts"
+
+
+def _module_script(path):
+    return format_html('<script type="module" src="{}"></script>', static(path))
+
+
+def _script_state(request):
+    # "required" maps each script path to whether its tag has been output.
+    return request.__dict__.setdefault(SCRIPTS_ATTR, {"required": {}, "output": False})
+
+
+@register.simple_tag(takes_context=True)
+def require_script(context, path):
+    """Declare that the template needs the ES module at static ``path``.
+
+    Each module is output once per request by ``{% mvp_scripts %}``, so a page
+    only loads the JavaScript of the components it renders. Without a request in
+    the context, or once ``{% mvp_scripts %}`` has run, the ``<script>`` tag is
+    output in place; browsers still run each module only once.
+
+    Example:
+        {% require_script "js/modules/theme-switcher.js" %}
+    """
+    request = context.get("request")
+    if request is None:
+        return _module_script(path)
+    state = _script_state(request)
+    if path in state["required"]:
+        return ""
+    state["required"][path] = state["output"]
+    return _module_script(path) if state["output"] else ""
+
+
+@register.simple_tag(takes_context=True)
+def mvp_scripts(context):
+    """Output the ES modules declared with ``{% require_script %}`` so far in this request.
+
+    Example:
+        {% mvp_scripts %}
+    """
+    request = context.get("request")
+    if request is None:
+        return ""
+    state = _script_state(request)
+    pending = [path for path, output in state["required"].items() if not output]
+    state["required"].update(dict.fromkeys(pending, True))
+    state["output"] = True
+    return format_html_join("\n", "{}", ((_module_script(path),) for path in pending))
+
+
+@register.simple_tag
+def mvp_stylesheets():
+    """Return the URLs of the prebuilt django-mvp stylesheets, if enabled (see ``mvp.styles``).
+
+    Example:
+        {% mvp_stylesheets as stylesheet_urls %}
+    """
+    return get_stylesheet_urls()
+
+
+@register.simple_tag
+def mvp_critical_css():
+    """Return the critical CSS of the app shell to inline, if enabled (see ``mvp.styles``).
+
+    Example:
+        {% mvp_critical_css as critical_css %}
+        {% if critical_css %}<style>{{ critical_css }}</style>{% endif %}
+    """
+    return get_critical_css()
+
+
+@register.simple_tag
+def stylesheet_link(href, defer=False, **attrs):
+    """Render a stylesheet ``<link>``, loaded without blocking rendering if ``defer`` is truthy.
+
+    Deferred stylesheets are preloaded and applied once loaded, with a
+    ``<noscript>`` fallback.
+
+    Example:
+        {% stylesheet_link url defer=critical_css crossorigin="anonymous" %}
+    """
+    attrs = flatatt({"href": href, **attrs})
+    if not defer:
+        return format_html('<link rel="stylesheet"{} />', attrs)
+    return format_html(
+        '<link rel="preload" as="style"{} onload="this.onload=null;this.rel=\'stylesheet\'" />'
+        '<noscript><link rel="stylesheet"{} /></noscript>',
+        attrs,
+        attrs,
+    )
+
+
+BREAKPOINTS = ["xs", "sm", "md", "lg", "xl", "xxl"]
+
+
+def responsive_classes(root: str, **responsive_values) -> str:
+    """Return ``<root>-<breakpoint>-<value>`` classes for each breakpoint value that is not None."""
+    return " ".join(
+        f"{root}-{key}-{value}"
+        for key, value in responsive_values.items()
+        if value is not None
+    )
+
+
 @register.simple_tag(takes_context=True)
 def responsive(context, root: str):
     # The idea is to take a root class name (e.g., "col") and
@@ -123,14 +301,61 @@ def responsive(context, root: str):
 
     responsive_values = {
         responsive: context.get(responsive)
-        for responsive in ["xs", "sm", "md", "lg", "xl", "xxl"]
+        for responsive in BREAKPOINTS
     }
 
-    return " ".join(
-        f"{root}-{key}-{value}"
-        for key, value in responsive_values.items()
-        if value is not None
-    )
+    return responsive_classes(root, **responsive_values)
+
+
+class CompiledComponentNode(template.Node):
+    def __init__(self, component):
+        self.component = component
+
+    def render(self, context):
+        return self.component.render(context)
+
+
+@register.tag
+def compiled_component(parser, token):
+    """Render a component body with its compiled function (see ``mvp.compiled``).
+
+    Inserted by ``mvp.loaders.Loader``; not meant to be used in templates directly.
+    """
+    try:
+        _tag, template_name = token.split_contents()
+    except ValueError as exc:
+        raise template.TemplateSyntaxError("compiled_component takes one argument, the template name") from exc
+    component = get_compiled_component(template_name.strip("\"'"))
+    if component is None:
+        raise template.TemplateSyntaxError(f"No compiled component is registered for {template_name}")
+    return CompiledComponentNode(component)
+
+
+class StreamContentNode(template.Node):
+    def __init__(self, nodelist):
+        self.nodelist = nodelist
+
+    def render(self, context):
+        stream = context.get(STREAM_CONTEXT_KEY)
+        if stream is None:
+            return self.nodelist.render(context)
+        return stream.defer(self.nodelist, context)
+
+
+@register.tag
+def stream_content(parser, token):
+    """Mark the part of the page that a streamed response sends last (see ``mvp.streaming``).
+
+    Everything before the block is sent as soon as it is rendered; the block
+    itself is rendered, and its queries run, after the rest of the page. Outside
+    streamed responses the block renders in place.
+
+    Usage:
+        {% block main %}{% stream_content %}...{% endstream_content %}{% endblock main %}
+    """
+    nodelist = parser.parse(("endstream_content",))
+    parser.delete_first_token()
+    return StreamContentNode(nodelist)
 
 
 @register.tag(name="show_code")
@@ -140,28 +365,37 @@ def show_code(parser, token):
     return ShowCodeNode(nodelist)
 
 
-class ShowCodeNode(template.Node):
-    def __init__(self, nodelist):
-        self.nodelist = nodelist
+@functools.lru_cache(maxsize=256)
+def _compile_snippet(source):
+    """Compile a cotton snippet once; repeat renders reuse the Template."""
+    return template.Template(compiler.process(source))
 
-    def render(self, context):
-        raw = self.nodelist.render(context)
 
-        # 1. Normalize indentation
-        dedented = textwrap.dedent(raw)
+@functools.lru_cache(maxsize=256)
+def _prepare_snippet(raw):
+    """Return the cleaned and escaped form of a raw snippet."""
+    # 1. Normalize indentation, 2. remove leading/trailing blank lines
+    cleaned = textwrap.dedent(raw).strip("\n")
+    # 3. Escape for HTML
+    return cleaned, escape(cleaned)
 
-        # 2. Remove leading/trailing blank lines
-        cleaned = dedented.strip("\n")
 
-        # 3. Escape for HTML
-        escaped = escape(cleaned)
+class ShowCodeNode(template.Node):
+    def __init__(self, nodelist):
+        self.nodelist = nodelist
+        # Snippets without template variables or tags render to the same source
+        # every time, so they are prepared once at parse time.
+        self.static = None
+        if all(isinstance(node, template.base.TextNode) for node in nodelist):
+            self.static = _prepare_snippet(nodelist.render(template.Context()))
 
-        compiled = compiler.process(cleaned)
+    def render(self, context):
+        if self.static is not None:
+            cleaned, escaped = self.static
+        else:
+            cleaned, escaped = _prepare_snippet(self.nodelist.render(context))
 
-        t = template.Template(compiled)
-        rendered = t.render(context)
+        rendered = _compile_snippet(cleaned).render(context)
         return render_to_string(
             "cotton/documentation.html", {"code": escaped, "rendered": rendered}
         )
-        return rendered
-        return mark_safe(f"<pre><code>{escaped}</code></pre>")
@@ -0,0 +1,115 @@
+"""Server-Timing for the stages of django-mvp's request pipeline.
+
+A slow page looks the same from the outside whether the time went into search
+filtering, counting, item rendering, the menu or a context processor.
+:class:`mvp.middleware.ServerTimingMiddleware` records how long each stage of
+the request took and reports it in a ``Server-Timing`` header, shown per stage
+by browser devtools, and in a log line on the ``mvp.timing`` logger, with the
+durations in the ``server_timing`` record attribute for structured log
+pipelines::
+
+    MIDDLEWARE = ["mvp.middleware.ServerTimingMiddleware", ...]
+
+The header reveals how long internal operations take; disable it with
+``MVP["timing"]["header"]`` to keep only the log line. Each stage is also
+traced as a span when a tracer is configured (see :mod:`mvp.tracing`). Without
+the middleware or a tracer, :func:`timed` does nothing.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Any
+
+from mvp.tracing import get_tracer
+
+# Stages timed by django-mvp, with their Server-Timing descriptions.
+STAGES = {
+    "search": "Search filtering",
+    "order": "Ordering",
+    "count": "Paginator count",
+    "fetch": "Object fetch",
+    "items": "List item rendering",
+    "menu": "Menu rendering",
+    "form_renderer": "Form renderer resolution",
+    "validation": "Form validation",
+    "config": "MVP config context",
+    "render": "Template rendering",
+}
+
+
+class Timings:
+    """Durations of the stages of one request, in seconds."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages: dict[str, float] = {}
+        self.counts: dict[str, int] = {}
+
+    def add(self, name: str, seconds: float) -> None:
+        """Add ``seconds`` to stage ``name``."""
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+    @property
+    def total(self) -> float:
+        """Seconds since the request started."""
+        return time.perf_counter() - self.started
+
+    def as_dict(self) -> dict[str, dict[str, float | int]]:
+        """Return ``{stage: {"dur": milliseconds, "count": calls}}``, including ``total``."""
+        data = {
+            name: {"dur": round(seconds * 1000, 2), "count": self.counts[name]} for name, seconds in self.stages.items()
+        }
+        data["total"] = {"dur": round(self.total * 1000, 2), "count": 1}
+        return data
+
+    def header(self) -> str:
+        """Return the ``Server-Timing`` header value."""
+        metrics = []
+        for name, values in self.as_dict().items():
+            desc = STAGES.get(name)
+            metrics.append(f"{name};dur={values['dur']}" + (f';desc="{desc}"' if desc else ""))
+        return ", ".join(metrics)
+
+
+_current: ContextVar[Timings | None] = ContextVar("mvp_timings", default=None)
+
+
+def get_timings() -> Timings | None:
+    """Return the timings of the current request, or None if it is not timed."""
+    return _current.get()
+
+
+@contextmanager
+def timing(timings: Timings | None) -> Iterator[Timings | None]:
+    """Record :func:`timed` stages in ``timings`` inside the block."""
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def timed(name: str, **attributes: Any) -> Iterator[None]:
+    """Add the duration of the block to stage ``name`` of the current request.
+
+    The block is also traced as span ``mvp.<name>`` with ``attributes`` when a
+    tracer is configured.
+    """
+    timings = _current.get()
+    tracer = get_tracer()
+    if timings is None and tracer is None:
+        yield
+        return
+    with tracer.span(f"mvp.{name}", attributes) if tracer is not None else nullcontext():
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if timings is not None:
+                timings.add(name, time.perf_counter() - start)
@@ -0,0 +1,162 @@
+"""Tracing spans around django-mvp's hot paths.
+
+Exported traces show an MVP view as one opaque span. django-mvp opens a span
+for each stage of its pipeline, named after the :mod:`mvp.timing` stage:
+
+- ``mvp.search``, ``mvp.order``: search filtering and ordering of the queryset
+- ``mvp.count``, ``mvp.fetch``: the paginator's count and page queries
+- ``mvp.items``: each ``{% render_list_item %}``
+- ``mvp.menu``: each ``{% render_menu %}``
+- ``mvp.form_renderer``, ``mvp.validation``: form renderer resolution and form validation
+- ``mvp.config``, ``mvp.render``: the ``mvp_config`` context processor and template rendering
+
+Spans go to the tracer set in ``MVP["tracing"]["tracer"]``, a dotted path to a
+:class:`Tracer` subclass. The default does nothing. To export to OpenTelemetry
+(requires ``opentelemetry-api``, the ``opentelemetry`` extra)::
+
+    MVP = {"tracing": {"tracer": "mvp.tracing.OpenTelemetryTracer"}}
+
+The spans then become children of the current span, e.g. the request span of
+the OpenTelemetry Django instrumentation. Tests can record spans with
+:class:`InMemoryTracer`::
+
+    tracer = InMemoryTracer()
+    with use_tracer(tracer):
+        client.get("/products/")
+    assert "mvp.count" in tracer.names()
+"""
+
+from __future__ import annotations
+
+import functools
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+from mvp.conf import get_config
+
+
+class Tracer:
+    """Base class of the tracers django-mvp reports spans to; this one does nothing."""
+
+    def span(self, name: str, attributes: dict[str, Any]):
+        """Return a context manager that traces its block as a span named ``name``."""
+        return nullcontext()
+
+
+class OpenTelemetryTracer(Tracer):
+    """Tracer creating OpenTelemetry spans with the ``mvp`` instrumentation scope.
+
+    Args:
+        tracer_provider: Provider to get the tracer from. Defaults to the global provider.
+    """
+
+    def __init__(self, tracer_provider=None):
+        from opentelemetry import trace
+
+        self.tracer = trace.get_tracer("mvp", tracer_provider=tracer_provider)
+
+    def span(self, name: str, attributes: dict[str, Any]):
+        return self.tracer.start_as_current_span(name, attributes=attributes)
+
+
+@dataclass
+class RecordedSpan:
+    """A span finished while an :class:`InMemoryTracer` was in use."""
+
+    name: str
+    attributes: dict[str, Any]
+    parent: RecordedSpan | None = None
+    duration: float = 0.0
+    children: list[RecordedSpan] = field(default_factory=list)
+
+
+class InMemoryTracer(Tracer):
+    """Tracer keeping the finished spans in memory, for tests."""
+
+    def __init__(self):
+        self.spans: list[RecordedSpan] = []
+        self._current: ContextVar[RecordedSpan | None] = ContextVar("mvp_span", default=None)
+
+    @contextmanager
+    def span(self, name: str, attributes: dict[str, Any]) -> Iterator[RecordedSpan]:
+        parent = self._current.get()
+        recorded = RecordedSpan(name, dict(attributes), parent)
+        token = self._current.set(recorded)
+        start = time.perf_counter()
+        try:
+            yield recorded
+        finally:
+            recorded.duration = time.perf_counter() - start
+            self._current.reset(token)
+            if parent is not None:
+                parent.children.append(recorded)
+            self.spans.append(recorded)
+
+    def names(self) -> list[str]:
+        """Return the names of the finished spans, in the order they finished."""
+        return [span.name for span in self.spans]
+
+    def clear(self) -> None:
+        """Forget the finished spans."""
+        self.spans.clear()
+
+
+# Tracer set with use_tracer(), overriding the configured one.
+_override: ContextVar[Tracer | None] = ContextVar("mvp_tracer", default=None)
+
+
+@functools.cache
+def get_configured_tracer() -> Tracer | None:
+    """Return an instance of ``MVP["tracing"]["tracer"]``, or None if it is not set.
+
+    Raises:
+        ImproperlyConfigured: If the tracer, or the library it needs, cannot be imported.
+    """
+    path = get_config()["tracing"]["tracer"]
+    if not path:
+        return None
+    try:
+        return import_string(path)()
+    except ImportError as e:
+        raise ImproperlyConfigured(f"MVP['tracing']['tracer'] = {path!r} cannot be imported: {e}") from e
+
+
+def get_tracer() -> Tracer | None:
+    """Return the tracer spans are reported to, or None if tracing is disabled."""
+    return _override.get() or get_configured_tracer()
+
+
+@contextmanager
+def use_tracer(tracer: Tracer) -> Iterator[Tracer]:
+    """Report spans to ``tracer`` inside the block."""
+    token = _override.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _override.reset(token)
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[None]:
+    """Trace the block as a span named ``name``; does nothing if tracing is disabled."""
+    tracer = get_tracer()
+    if tracer is None:
+        yield
+        return
+    with tracer.span(name, attributes):
+        yield
+
+
+@receiver(setting_changed, dispatch_uid="mvp.tracing.reset")
+def _on_setting_changed(*, setting, **kwargs) -> None:
+    if setting == "MVP":
+        get_configured_tracer.cache_clear()
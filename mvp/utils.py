@@ -1,4 +1,11 @@
+import contextlib
+import os
+import tempfile
+from pathlib import Path
+
 from django.apps import apps
+from django.conf import settings
+from django.core.management import CommandError
 
 
 def app_is_installed(app_name: str) -> bool:
@@ -22,6 +29,57 @@ def app_is_installed(app_name: str) -> bool:
     return apps.is_installed(app_name)
 
 
+def get_static_output_dir(output_dir: str | None = None) -> Path | None:
+    """
+    Return the directory build commands write static files to.
+
+    Args:
+        output_dir: Explicit directory, e.g. from a ``--output-dir`` option.
+
+    Returns:
+        Path | None: ``output_dir`` if given, otherwise the first unprefixed
+        ``STATICFILES_DIRS`` entry, or None if there is none.
+
+    Raises:
+        CommandError: If ``STATICFILES_DIRS`` only has ``(prefix, path)`` entries.
+            Files written there are served under the prefix, while django-mvp
+            looks up the built manifests and files without it.
+    """
+    if output_dir is not None:
+        return Path(output_dir)
+    prefixed = None
+    for entry in settings.STATICFILES_DIRS:
+        if not isinstance(entry, (list, tuple)):
+            return Path(entry)
+        prefixed = prefixed or entry
+    if prefixed is not None:
+        raise CommandError(
+            f"STATICFILES_DIRS only has prefixed entries, such as {tuple(prefixed)!r}; files built there would be "
+            f"served under {prefixed[0]}/. Pass --output-dir or add an unprefixed directory to STATICFILES_DIRS."
+        )
+    return None
+
+
+def write_atomic(path: Path, content: str | bytes) -> None:
+    """Write ``content`` to ``path`` so readers never observe a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        if isinstance(content, bytes):
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(content)
+        else:
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp:
+                tmp.write(content)
+        # mkstemp creates the file readable by its owner only; the web server may run as another user.
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+
+
 BS5_ICONS = {
     "arrow-right": "bi bi-arrow-right",
     "arrow-left": "bi bi-arrow-left",
@@ -1,8 +1,18 @@
 """Views and view mixins for django-mvp."""
 
+from django.core.paginator import Paginator
 from django.db.models import Q
+from django.http import Http404, StreamingHttpResponse
+from django.middleware.csrf import get_token
+from django.template.loader import select_template
+from django.utils.functional import SimpleLazyObject, cached_property
+from django.utils.translation import gettext as _
 from django.views.generic import CreateView, FormView, UpdateView
 
+from mvp.form_renderers import get_form_renderer, resolve_form_renderer
+from mvp.streaming import stream_template
+from mvp.timing import timed
+
 
 class SearchMixin:
     """Mixin for handling search functionality on list views.
@@ -45,7 +55,8 @@ class SearchMixin:
         # Apply search filtering
         search_term = self.request.GET.get("q", "").strip()
         if search_term and self.get_search_fields():
-            queryset = self._apply_search(queryset, search_term)
+            with timed("search", **{"mvp.search.fields": len(self.get_search_fields())}):
+                queryset = self._apply_search(queryset, search_term)
 
         return queryset
 
@@ -132,7 +143,8 @@ class OrderMixin:
         # Apply ordering
         ordering = self.request.GET.get("o", "")
         if ordering and self.get_order_by_choices():
-            queryset = self._apply_ordering(queryset, ordering)
+            with timed("order", **{"mvp.ordering": ordering}):
+                queryset = self._apply_ordering(queryset, ordering)
 
         return queryset
 
@@ -289,9 +301,107 @@ class ListItemTemplateMixin:
         return context
 
 
-class MVPListViewMixin(SearchOrderMixin, ListItemTemplateMixin):
+class TimedPaginator(Paginator):
+    """Paginator that times its count and page fetch queries (see ``mvp.timing``).
+
+    The objects of a page are fetched when the page is created rather than when
+    they are first iterated, so the fetch is timed on its own.
+    """
+
+    @cached_property
+    def count(self):
+        with timed("count"):
+            return super().count
+
+    def page(self, number):
+        page = super().page(number)
+        with timed("fetch", **{"mvp.page": page.number}):
+            len(page.object_list)
+        return page
+
+
+class StreamingMixin:
+    """Mixin for streaming the page shell before the page content is rendered.
+
+    With ``stream`` enabled, ``render_to_response`` returns a
+    ``StreamingHttpResponse`` that sends everything up to the template's
+    ``{% stream_content %}`` block (``<head>``, header and sidebar) first, then
+    renders and sends the block. See :mod:`mvp.streaming` for the trade-offs;
+    errors raised while rendering the block, such as a list page number past the
+    last page, cut the 200 response short instead of returning an error page.
+
+    Attributes:
+        stream (bool): Stream the response. Default: False.
+
+    Example:
+        class ProductListView(MVPListViewMixin, ListView):
+            model = Product
+            stream = True
+    """
+
+    stream = False
+
+    def render_to_response(self, context, **response_kwargs):
+        """Return a streaming response if ``stream`` is enabled.
+
+        Returns:
+            StreamingHttpResponse or TemplateResponse: The response
+        """
+        if not self.stream:
+            return super().render_to_response(context, **response_kwargs)
+
+        template = select_template(self.get_template_names(), using=self.template_engine)
+        # Headers are sent with the first chunk, so any CSRF cookie the
+        # streamed content needs has to be set now.
+        get_token(self.request)
+        response_kwargs.setdefault("content_type", self.content_type)
+        return StreamingHttpResponse(stream_template(template, context, self.request), **response_kwargs)
+
+
+class MVPListViewMixin(StreamingMixin, SearchOrderMixin, ListItemTemplateMixin):
     grid: dict = {}
     page_title = ""
+    paginator_class = TimedPaginator
+
+    def paginate_queryset(self, queryset, page_size):
+        """Paginate the queryset, lazily when streaming.
+
+        When streaming, the count and fetch queries run when the content is
+        rendered, after the page shell has been sent. Page numbers that are not
+        an integer or "last", or are below 1, are rejected with a 404 first, but
+        a page past the last one is only found out while streaming, so it
+        returns a 200 response that is cut off after the shell.
+
+        Raises:
+            Http404: If streaming and the page number is invalid.
+        """
+        if not self.stream:
+            return super().paginate_queryset(queryset, page_size)
+
+        page_number = self.kwargs.get(self.page_kwarg) or self.request.GET.get(self.page_kwarg) or 1
+        if page_number != "last":
+            try:
+                valid = int(page_number) >= 1
+            except ValueError:
+                valid = False
+            if not valid:
+                raise Http404(_("Invalid page (%(page_number)s)") % {"page_number": page_number})
+
+        paginate = super().paginate_queryset
+        page = SimpleLazyObject(lambda: paginate(queryset, page_size)[1])
+        return (
+            SimpleLazyObject(lambda: page.paginator),
+            page,
+            SimpleLazyObject(lambda: page.object_list),
+            SimpleLazyObject(lambda: page.has_other_pages()),
+        )
+
+    def get_context_object_name(self, object_list):
+        # The name only depends on the model; the lazy page would run its
+        # queries to look it up.
+        if self.stream:
+            object_list = self.object_list
+        return super().get_context_object_name(object_list)
 
     def get_context_data(self, **kwargs):
         """Add grid configuration to the template context.
@@ -377,7 +487,7 @@ def layout_demo(request):
     return render(request, "mvp/layout_demo.html", context)
 
 
-class MVPFormViewMixin:
+class MVPFormViewMixin(StreamingMixin):
     """Mixin to render forms in AdminLTE layout with auto-detected renderer.
 
     This mixin provides automatic form renderer detection and a consistent
@@ -385,10 +495,12 @@ class MVPFormViewMixin:
     django-formset, or falls back to standard Django form rendering.
 
     Attributes:
-        form_renderer (str|None): Override renderer ("crispy", "formset", "django").
+        form_renderer (str|None): Override renderer ("crispy", "formset", "django",
+            or any renderer registered with ``mvp.form_renderers.register_form_renderer``).
             None enables auto-detection (default).
         page_title (str): Title displayed in the form card header.
         template_name (str): Template path for form rendering.
+        stream (bool): Stream the response (see ``StreamingMixin``).
 
     Priority Order (auto-detection):
         1. django-crispy-forms (if installed)
@@ -411,45 +523,35 @@ class MVPFormViewMixin:
         """Determine which form renderer to use.
 
         Returns:
-            str: Renderer name ("crispy", "formset", or "django")
+            str: Renderer name ("crispy", "formset", "django" or a registered
+            third-party renderer)
 
         Logic:
-            1. If form_renderer is explicitly set, validate and use it
-            2. Otherwise, auto-detect based on installed apps:
+            1. If form_renderer is explicitly set and available, use it
+            2. Otherwise, auto-detect the highest priority available renderer:
                - crispy_forms (highest priority)
                - formset (second priority)
                - django (fallback)
-            3. Log warning if explicit renderer is not available
+            3. An explicit renderer that is not available falls back to django
+               (reported once by the ``mvp.W001`` system check)
+
+        Resolution is memoized in :mod:`mvp.form_renderers`, so no install
+        detection happens per request.
         """
-        import logging
-
-        from mvp.utils import app_is_installed
-
-        logger = logging.getLogger(__name__)
-
-        # Explicit renderer override
-        if self.form_renderer:
-            # Validate explicit renderer is available
-            if self.form_renderer == "crispy" and not app_is_installed("crispy_forms"):
-                logger.warning(
-                    "MVPFormViewMixin: form_renderer='crispy' but django-crispy-forms "
-                    "is not installed. Falling back to django renderer."
-                )
-                return "django"
-            if self.form_renderer == "formset" and not app_is_installed("formset"):
-                logger.warning(
-                    "MVPFormViewMixin: form_renderer='formset' but django-formset "
-                    "is not installed. Falling back to django renderer."
-                )
-                return "django"
-            return self.form_renderer
-
-        # Auto-detection priority: crispy → formset → django
-        if app_is_installed("crispy_forms"):
-            return "crispy"
-        if app_is_installed("formset"):
-            return "formset"
-        return "django"
+        with timed("form_renderer", **{"mvp.form_renderer.requested": self.form_renderer or ""}):
+            return resolve_form_renderer(self.form_renderer).name
+
+    def get_form(self, form_class=None):
+        """Return the form, with its validation timed as the ``validation`` stage (see ``mvp.timing``)."""
+        form = super().get_form(form_class)
+        full_clean = form.full_clean
+
+        def timed_full_clean():
+            with timed("validation", **{"mvp.form": type(form).__name__}):
+                full_clean()
+
+        form.full_clean = timed_full_clean
+        return form
 
     def get_page_title(self):
         """Return the page title for the form.
@@ -463,10 +565,14 @@ class MVPFormViewMixin:
         """Inject form renderer and page title into template context.
 
         Returns:
-            dict: Context with form_renderer and page_title added
+            dict: Context with form_renderer, form_renderer_component and
+            page_title added
         """
         context = super().get_context_data(**kwargs)
-        context["form_renderer"] = self.get_form_renderer()
+        form_renderer = self.get_form_renderer()
+        renderer = get_form_renderer(form_renderer)
+        context["form_renderer"] = form_renderer
+        context["form_renderer_component"] = renderer.component if renderer else f"forms.{form_renderer}"
         context["page_title"] = self.get_page_title()
         return context
 
@@ -0,0 +1,98 @@
+"""Template warmup for django-mvp.
+
+Compiling cotton components is expensive and normally happens lazily, on the
+first request that uses each component. :func:`warm_templates` compiles every
+component up front into the cached template loader so a fresh worker serves its
+first request as fast as its thousandth.
+
+Warmup can be triggered in three ways:
+
+- ``MVP = {"templates": {"warmup": True}}`` warms at the end of app loading
+  (``django_cotton`` must be listed before ``mvp`` in ``INSTALLED_APPS``).
+- ``python manage.py warm_templates`` compiles everything and reports failures.
+- Calling :func:`warm_templates` from a server hook, e.g. gunicorn's
+  ``post_worker_init``.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from django.apps import apps
+from django.template import TemplateDoesNotExist, TemplateSyntaxError, engines
+from django.template.backends.django import DjangoTemplates
+from django.template.utils import get_app_template_dirs
+
+logger = logging.getLogger(__name__)
+
+COMPONENT_DIR = "cotton"
+
+
+@dataclass
+class WarmupResult:
+    """Outcome of a warmup run."""
+
+    warmed: list[str] = field(default_factory=list)
+    failed: dict[str, Exception] = field(default_factory=dict)
+
+
+def get_template_dirs(engine) -> list[Path]:
+    """Return every directory the engine (and the cotton loader) loads templates from."""
+    dirs = [Path(d) for d in engine.dirs]
+    dirs.extend(Path(d) for d in get_app_template_dirs("templates"))
+    return list(dict.fromkeys(dirs))
+
+
+def get_component_template_names(engine) -> list[str]:
+    """Return the template names of all cotton components visible to ``engine``.
+
+    Includes the django-mvp component library as well as project and
+    third-party components under any ``templates/cotton`` directory.
+    """
+    names = set()
+    for template_dir in get_template_dirs(engine):
+        component_dir = template_dir / COMPONENT_DIR
+        if component_dir.is_dir():
+            names.update(path.relative_to(template_dir).as_posix() for path in component_dir.rglob("*.html"))
+    return sorted(names)
+
+
+def get_page_template_names() -> list[str]:
+    """Return the django-mvp page templates (``mvp/*.html``)."""
+    page_dir = Path(apps.get_app_config("mvp").path) / "templates" / "mvp"
+    return sorted(f"mvp/{path.name}" for path in page_dir.glob("*.html"))
+
+
+def get_django_engines() -> list:
+    """Return the underlying ``Engine`` of every configured DjangoTemplates backend."""
+    return [backend.engine for backend in engines.all() if isinstance(backend, DjangoTemplates)]
+
+
+def warm_templates(template_names: list[str] | None = None) -> WarmupResult:
+    """Compile templates into each Django engine's cached loader.
+
+    Args:
+        template_names: Templates to compile. Defaults to every cotton component
+            plus the django-mvp page templates.
+
+    Returns:
+        WarmupResult: Names that were compiled and those that failed, with the error.
+        Failures (e.g. a component loading a tag library that is not installed)
+        are logged and do not stop the warmup.
+    """
+    result = WarmupResult()
+    for engine in get_django_engines():
+        names = template_names or [*get_component_template_names(engine), *get_page_template_names()]
+        for name in names:
+            try:
+                engine.get_template(name)
+            except (TemplateDoesNotExist, TemplateSyntaxError) as exc:
+                logger.debug("Could not warm template %s: %s", name, exc)
+                result.failed[name] = exc
+            else:
+                result.warmed.append(name)
+
+    logger.info("Warmed %d templates (%d failed)", len(result.warmed), len(result.failed))
+    return result
@@ -3,3 +3,23 @@ Test fixtures for django-cotton-layouts test suite.
 
 This module provides reusable fixtures for testing layout components.
 """
+
+import pytest
+
+from example.models import Category, Product
+
+
+@pytest.fixture
+def products(db):
+    category = Category.objects.create(name="Tools", slug="tools")
+    return [
+        Product.objects.create(
+            name=f"Product {index}",
+            slug=f"product-{index}",
+            category=category,
+            description="A product",
+            sku=f"SKU-{index}",
+            price=index,
+        )
+        for index in range(3)
+    ]
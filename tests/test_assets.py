@@ -0,0 +1,86 @@
+"""Tests for the vendored third-party assets."""
+
+import base64
+import hashlib
+import json
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.template.loader import render_to_string
+from django.test import RequestFactory
+
+from mvp import assets
+from mvp.assets import ASSETS, ASSETS_MANIFEST, Asset
+
+ICONS_CSS = '@font-face{src:url("./fonts/bootstrap-icons.woff2?abc") format("woff2"),url(data:font/woff2;base64,AA==)}'
+
+
+def sri(algorithm, content):
+    return f"{algorithm}-{base64.b64encode(hashlib.new(algorithm, content).digest()).decode()}"
+
+
+@pytest.fixture
+def node_modules(tmp_path, monkeypatch):
+    source = tmp_path / "node_modules"
+    files = {
+        "@fontsource/source-sans-3/index.css": b"@font-face{src:url(./files/latin-400.woff2)}",
+        "@fontsource/source-sans-3/files/latin-400.woff2": b"font",
+        "overlayscrollbars/styles/overlayscrollbars.min.css": b".os-scrollbar{}",
+        "bootstrap-icons/font/bootstrap-icons.min.css": ICONS_CSS.encode(),
+        "bootstrap-icons/font/fonts/bootstrap-icons.woff2": b"icons",
+        "bootstrap/dist/js/bootstrap.bundle.min.js": b"bootstrap()",
+    }
+    for path, content in files.items():
+        (source / path).parent.mkdir(parents=True, exist_ok=True)
+        (source / path).write_bytes(content)
+    # Pin the integrity hashes to the fixture content.
+    patched = dict(ASSETS)
+    patched["source-sans"] = Asset(
+        "@fontsource/source-sans-3", "5.0.12", "index.css", sri("sha256", files["@fontsource/source-sans-3/index.css"])
+    )
+    patched["bootstrap"] = Asset("bootstrap", "5.3.8", "dist/js/bootstrap.bundle.min.js", sri("sha384", b"bootstrap()"))
+    monkeypatch.setattr(assets, "ASSETS", patched)
+    return source
+
+
+def test_command_vendors_hashed_assets_and_their_fonts(node_modules, tmp_path):
+    output = tmp_path / "static"
+
+    call_command("vendor_assets", source=str(node_modules), output_dir=str(output))
+
+    manifest = json.loads((output / ASSETS_MANIFEST).read_text())
+    assert list(manifest) == ["source-sans", "overlayscrollbars", "bootstrap-icons", "bootstrap"]
+    assert manifest["bootstrap"].startswith("mvp/vendor/bootstrap.bundle.min.")
+    icons_css = (output / manifest["bootstrap-icons"]).read_text()
+    font = icons_css.split('url("')[1].split('")')[0]
+    assert font.startswith("files/bootstrap-icons.") and font.endswith(".woff2")
+    assert (output / "mvp/vendor" / font).read_bytes() == b"icons"
+    assert "url(data:font/woff2;base64,AA==)" in icons_css
+
+
+def test_command_rejects_integrity_mismatch(node_modules, tmp_path):
+    (node_modules / "bootstrap/dist/js/bootstrap.bundle.min.js").write_bytes(b"tampered")
+
+    with pytest.raises(CommandError, match="integrity"):
+        call_command("vendor_assets", source=str(node_modules), output_dir=str(tmp_path))
+
+
+def test_base_template_uses_cdn_by_default():
+    html = render_to_string("mvp/base.html", request=RequestFactory().get("/"))
+
+    assert f'src="{ASSETS["bootstrap"].url}"' in html
+    assert f'integrity="{ASSETS["bootstrap"].integrity}"' in html
+
+
+def test_base_template_links_vendored_assets(node_modules, tmp_path, settings):
+    output = tmp_path / "static"
+    settings.STATICFILES_DIRS = [output]
+    call_command("vendor_assets", source=str(node_modules))
+    settings.MVP = {"assets": {"vendored": True}}
+    manifest = json.loads((output / ASSETS_MANIFEST).read_text())
+
+    html = render_to_string("mvp/base.html", request=RequestFactory().get("/"))
+
+    assert "cdn.jsdelivr.net" not in html.replace("admin-lte@", "")
+    for path in manifest.values():
+        assert f"/static/{path}" in html
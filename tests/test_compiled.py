@@ -0,0 +1,79 @@
+"""Parity tests for compiled components: each must render exactly like its template."""
+
+import pytest
+from django.template import Context, Template, engines
+from django.test import override_settings
+from django_cotton.compiler_regex import CottonCompiler
+
+from mvp.loaders import Loader
+
+compiler = CottonCompiler()
+
+
+def template_settings(dirs=()):
+    return [
+        {
+            "BACKEND": "django.template.backends.django.DjangoTemplates",
+            "DIRS": list(dirs),
+            "OPTIONS": {
+                "loaders": ["mvp.loaders.Loader"],
+                "builtins": ["django_cotton.templatetags.cotton"],
+            },
+        }
+    ]
+
+
+def render(source, *, compiled, **context):
+    with override_settings(TEMPLATES=template_settings(), MVP={"templates": {"compiled_components": compiled}}):
+        return Template(compiler.process(source)).render(Context(context))
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        '<c-icon name="home" />',
+        '<c-icon name="search" class="text-muted" data-role="button" />',
+        '<c-grid cols="3" md="2" xl="4" class="mb-3" id="grid">A</c-grid>',
+        '<c-grid :cols="0" gap="3">B</c-grid>',
+        '<c-app.sidebar.menu.item label="Home" href="/" icon="home" active />',
+        '<c-app.sidebar.menu.item label="{{ label }}" href="/inbox" badge="{{ count }}" badge_classes="text-bg-danger" />',
+        '<c-app.sidebar.menu.item label="Admin" active><c-app.sidebar.menu.item label="Users" href="/u" /></c-app.sidebar.menu.item>',
+        '<c-card.body tight class="small">Body</c-card.body>',
+        "<c-card.body>{{ label }}</c-card.body>",
+        '<c-card.wrapper variant="primary" fill="card" collapsible collapsed id="card">X</c-card.wrapper>',
+        '<c-card.wrapper variant="success" fill="outline" class="h-100">Y</c-card.wrapper>',
+        '<c-card title="Title" icon="home" collapsible footer_start="Footer">Content</c-card>',
+    ],
+)
+def test_compiled_components_match_templates(source):
+    context = {"label": "<b>Inbox</b>", "count": 3}
+
+    expected = render(source, compiled=False, **context)
+    actual = render(source, compiled=True, **context)
+
+    assert actual == expected
+
+
+def make_loader(dirs=()):
+    with override_settings(TEMPLATES=template_settings(dirs), MVP={"templates": {"compiled_components": True}}):
+        return Loader(engines["django"].engine)
+
+
+def get_contents(loader, template_name):
+    origin = next(loader.get_template_sources(template_name))
+    return loader.get_contents(origin)
+
+
+def test_loader_replaces_component_body():
+    contents = get_contents(make_loader(), "cotton/icon.html")
+
+    assert contents == '{% cotton:vars name class %}{% load mvp %}{% compiled_component "cotton/icon.html" %}'
+
+
+def test_overridden_dependencies_disable_compiled_component(tmp_path):
+    (tmp_path / "cotton").mkdir()
+    (tmp_path / "cotton" / "icon.html").write_text("<i>{{ name }}</i>")
+
+    contents = get_contents(make_loader([tmp_path]), "cotton/app/sidebar/menu/item.html")
+
+    assert "compiled_component" not in contents
@@ -0,0 +1,76 @@
+"""Tests for the cotton component render profiler."""
+
+import pytest
+from django.conf import settings
+from django.template import Context, Template
+from django.test import override_settings
+from django_cotton.compiler_regex import CottonCompiler
+
+from mvp import component_profile
+from mvp.component_profile import profile_components
+
+MIDDLEWARE = [*settings.MIDDLEWARE, "mvp.middleware.ComponentProfileMiddleware"]
+
+compiler = CottonCompiler()
+
+
+@pytest.fixture(autouse=True)
+def installed():
+    component_profile.install()
+
+
+def test_components_are_aggregated_by_position_in_the_tree():
+    template = Template(
+        compiler.process(
+            '<c-card.wrapper><c-icon name="home" /><c-icon name="search" /></c-card.wrapper><c-icon name="add" />'
+        )
+    )
+
+    with profile_components() as profile:
+        template.render(Context())
+
+    tree = profile.root.as_dict()
+    wrapper = next(child for child in tree["children"] if child["name"] == "c-card.wrapper")
+    top_icon = next(child for child in tree["children"] if child["name"] == "c-icon")
+    assert wrapper["calls"] == 1
+    assert wrapper["children"][0]["name"] == "c-icon"
+    assert wrapper["children"][0]["calls"] == 2
+    assert top_icon["calls"] == 1
+    assert wrapper["time_ms"] >= wrapper["self_ms"]
+    assert tree["time_ms"] >= wrapper["time_ms"] + top_icon["time_ms"]
+
+
+def test_renders_outside_a_profile_are_not_recorded():
+    Template(compiler.process('<c-icon name="home" />')).render(Context())
+
+    with profile_components() as profile:
+        pass
+
+    assert profile.root.children == {}
+
+
+@override_settings(MIDDLEWARE=MIDDLEWARE, DEBUG=True)
+def test_json_profile_of_a_list_page(client, products):
+    response = client.get("/list-view/basic/", {"mvp_profile": "json"})
+
+    tree = response.json()
+    assert tree["name"] == "request"
+    assert tree["queries"] >= 2
+    assert "c-app" in [child["name"] for child in tree["children"]]
+
+
+@override_settings(MIDDLEWARE=MIDDLEWARE)
+def test_profile_is_appended_to_the_page_as_a_comment_for_staff(admin_client, products):
+    html = admin_client.get("/list-view/basic/", {"mvp_profile": ""}).content.decode()
+
+    assert "</html>" in html
+    comment = html[html.index("<!-- mvp component profile") :]
+    assert "  c-app " in comment
+    assert comment.rstrip().endswith("-->")
+
+
+@override_settings(MIDDLEWARE=MIDDLEWARE)
+def test_profiles_require_debug_or_staff(client, products):
+    html = client.get("/list-view/basic/", {"mvp_profile": ""}).content.decode()
+
+    assert "mvp component profile" not in html
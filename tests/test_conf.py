@@ -0,0 +1,53 @@
+"""Tests for settings-driven configuration in mvp.conf."""
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.test import RequestFactory, override_settings
+
+from mvp.conf import get_config, get_request_config, set_request_config
+from mvp.context_processors import mvp_config
+
+
+def test_defaults_are_shared_between_requests():
+    first = mvp_config(RequestFactory().get("/"))["mvp"]
+    second = mvp_config(RequestFactory().get("/"))["mvp"]
+
+    assert first is second
+    assert first["brand"]["text"] == "Django MVP"
+
+
+def test_config_is_immutable():
+    with pytest.raises(TypeError):
+        get_config()["brand"]["text"] = "Changed"
+
+
+@override_settings(MVP={"brand": {"text": "My Portal"}, "actions": ["search"]})
+def test_settings_are_deep_merged_with_defaults():
+    config = get_config()
+
+    assert config["brand"]["text"] == "My Portal"
+    assert config["brand"]["logo"] is None
+    assert config["actions"] == ("search",)
+    assert config["layout"]["sidebar_expand"] == "lg"
+
+
+@pytest.mark.parametrize(
+    "value",
+    [{"branding": {}}, {"brand": "My Portal"}, {"brand": {"colour": "red"}}, {"actions": "search"}],
+)
+def test_invalid_settings_are_rejected(value):
+    with override_settings(MVP=value), pytest.raises(ImproperlyConfigured):
+        get_config()
+
+
+def test_request_overlay_leaves_shared_config_untouched():
+    request = RequestFactory().get("/")
+    set_request_config(request, {"brand": {"text": "Tenant"}})
+    set_request_config(request, {"footer": {"text": "Footer"}})
+
+    config = get_request_config(request)
+
+    assert config["brand"]["text"] == "Tenant"
+    assert config["brand"]["logo"] is None
+    assert config["footer"]["text"] == "Footer"
+    assert get_config()["brand"]["text"] == "Django MVP"
@@ -0,0 +1,47 @@
+"""Tests for lazy context values in mvp.context_processors."""
+
+from django.template import Context, Template
+from django.test import RequestFactory
+
+from mvp.context_processors import lazy_context
+
+
+class Provider:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, request):
+        self.calls += 1
+        return ["a", "b"]
+
+
+def render(source, context):
+    return Template(source).render(Context(context))
+
+
+def test_lazy_value_is_not_evaluated_when_unused():
+    provider = Provider()
+    context = lazy_context(RequestFactory().get("/"), items=provider)
+
+    assert render("nothing here", context) == "nothing here"
+    assert provider.calls == 0
+
+
+def test_lazy_value_is_evaluated_once_per_request():
+    provider = Provider()
+    request = RequestFactory().get("/")
+
+    first = render("{% for i in items %}{{ i }}{% endfor %}", lazy_context(request, items=provider))
+    second = render("{{ items|length }}", lazy_context(request, items=provider))
+
+    assert (first, second) == ("ab", "2")
+    assert provider.calls == 1
+
+
+def test_lazy_value_is_evaluated_again_for_a_new_request():
+    provider = Provider()
+
+    render("{{ items }}", lazy_context(RequestFactory().get("/"), items=provider))
+    render("{{ items }}", lazy_context(RequestFactory().get("/"), items=provider))
+
+    assert provider.calls == 2
@@ -0,0 +1,65 @@
+"""Tests for the form renderer registry and MVPFormViewMixin integration."""
+
+import pytest
+from django.test import RequestFactory
+
+from mvp import form_renderers
+from mvp.checks import check_form_renderers
+from mvp.form_renderers import register_form_renderer, resolve_form_renderer
+from mvp.views import MVPFormView
+
+
+@pytest.fixture
+def registry():
+    saved = dict(form_renderers._registry)
+    yield
+    form_renderers._registry.clear()
+    form_renderers._registry.update(saved)
+    form_renderers._resolved.clear()
+
+
+def test_auto_detection_prefers_crispy():
+    assert resolve_form_renderer().name == "crispy"
+
+
+def test_unavailable_explicit_renderer_falls_back_to_django(registry):
+    register_form_renderer("missing", requires="not_an_app")
+
+    assert resolve_form_renderer("missing").name == "django"
+    assert resolve_form_renderer("unknown").name == "django"
+
+
+def test_resolution_is_memoized(registry, monkeypatch):
+    resolve_form_renderer("formset")
+    monkeypatch.setattr(form_renderers, "app_is_installed", lambda name: pytest.fail("install detection per call"))
+
+    resolve_form_renderer("formset")
+
+
+def test_third_party_renderer_is_used_by_views(registry):
+    register_form_renderer("custom", component="custom.form", priority=500)
+
+    view = MVPFormView()
+    view.setup(RequestFactory().get("/"))
+    view.form_class = None
+    context = view.get_context_data(form=None)
+
+    assert context["form_renderer"] == "custom"
+    assert context["form_renderer_component"] == "custom.form"
+
+
+def test_misconfigured_views_produce_a_single_warning(registry):
+    register_form_renderer("missing", requires="not_an_app")
+
+    class FirstView(MVPFormView):
+        form_renderer = "missing"
+
+    class SecondView(MVPFormView):
+        form_renderer = "missing"
+
+    warnings = [w for w in check_form_renderers() if w.obj == "missing"]
+
+    assert len(warnings) == 1
+    assert warnings[0].id == "mvp.W001"
+    assert "FirstView" in warnings[0].hint
+    assert "SecondView" in warnings[0].hint
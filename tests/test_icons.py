@@ -0,0 +1,61 @@
+"""Tests for memoized icon rendering."""
+
+import pytest
+from django.template import Context, Template
+
+from mvp import icons
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    calls = []
+    render = icons.easy_icons.icon
+
+    def counting_icon(name, **kwargs):
+        calls.append(name)
+        return render(name, **kwargs)
+
+    monkeypatch.setattr(icons.easy_icons, "icon", counting_icon)
+    icons._render_cached.cache_clear()
+    yield calls
+    icons._render_cached.cache_clear()
+
+
+def test_icons_are_rendered_once_per_name_and_attrs(settings, calls):
+    settings.DEBUG = False
+
+    first = icons.render_icon("home", **{"class": "nav-icon", "title": "Home"})
+    again = icons.render_icon("home", **{"title": "Home", "class": "nav-icon", "name": "home"})
+    other = icons.render_icon("home", **{"class": "text-muted"})
+
+    assert first == again
+    assert 'class="bi bi-house nav-icon"' in first
+    assert "text-muted" in other
+    assert calls == ["home", "home"]
+
+
+def test_cache_is_bypassed_in_debug(settings, calls):
+    settings.DEBUG = True
+
+    icons.render_icon("home")
+    icons.render_icon("home")
+
+    assert calls == ["home", "home"]
+
+
+def test_unhashable_attrs_are_rendered_uncached(settings, calls):
+    settings.DEBUG = False
+
+    icons.render_icon("home", data=["a"])
+
+    assert calls == ["home"]
+    assert icons._render_cached.cache_info().currsize == 0
+
+
+def test_cached_icon_tag_matches_easy_icons_tag():
+    context = Context({"attrs": {"name": "search", "class": "nav-icon"}})
+
+    cached = Template('{% load mvp %}{% cached_icon "search" attrs %}').render(context)
+    plain = Template('{% load easy_icons %}{% icon "search" defaults=attrs %}').render(context)
+
+    assert cached == plain
@@ -0,0 +1,115 @@
+"""Tests that the Jinja2 layout macros and helpers match their Django counterparts."""
+
+import copy
+import re
+from types import SimpleNamespace
+
+import pytest
+from django.core.paginator import Paginator
+from django.template import Context, Template
+from django.template.backends.jinja2 import Jinja2
+from django_cotton.compiler_regex import CottonCompiler
+
+from mvp.templatetags import mvp as mvp_tags
+
+compiler = CottonCompiler()
+
+jinja = Jinja2(
+    {
+        "NAME": "jinja2",
+        "DIRS": [],
+        "APP_DIRS": True,
+        "OPTIONS": {"environment": "mvp.jinja.environment"},
+    }
+)
+
+
+def normalize(html):
+    """Collapse whitespace and drop it around tags, where it is insignificant."""
+    html = re.sub(r"\s+", " ", html)
+    return re.sub(r"\s*([<>])\s*", r"\1", html).strip()
+
+
+def render_django(source, **context):
+    return Template(compiler.process(source)).render(Context(context))
+
+
+def render_jinja(source, **context):
+    return jinja.from_string('{% import "mvp/components.html" as mvp %}' + source).render(context)
+
+
+def assert_same(django_source, jinja_source, **context):
+    assert normalize(render_jinja(jinja_source, **context)) == normalize(render_django(django_source, **context))
+
+
+@pytest.mark.parametrize(
+    ("django_source", "jinja_source"),
+    [
+        ("<c-app>Body</c-app>", "{% call mvp.app() %}Body{% endcall %}"),
+        (
+            '<c-app fixed_sidebar fixed_header sidebar_collapsible collapsed fill sidebar_expand="md" class="x">B</c-app>',
+            '{% call mvp.app(fixed_sidebar=True, fixed_header=True, sidebar_collapsible=True, collapsed=True, fill=True, sidebar_expand="md", class="x") %}B{% endcall %}',
+        ),
+        ("<c-page>Content</c-page>", "{% call mvp.page() %}Content{% endcall %}"),
+        (
+            '<c-page layout="lhr-lpr" fixed_header fixed_footer fixed_sidebar sidebar_expand="xl" class="y">C</c-page>',
+            '{% call mvp.page(layout="lhr-lpr", fixed_header=True, fixed_footer=True, fixed_sidebar=True, sidebar_expand="xl", class="y") %}C{% endcall %}',
+        ),
+    ],
+)
+def test_layout_macros_match_components(django_source, jinja_source):
+    assert_same(django_source, jinja_source)
+
+
+@pytest.mark.parametrize(("number", "count"), [(1, 5), (1, 200), (6, 200), (20, 200)])
+def test_pagination_macro_matches_component(number, count):
+    page_obj = Paginator(range(count), 10).page(number)
+
+    assert_same(
+        '<c-page.footer.pagination :page_obj="page_obj" page_info />',
+        "{{ mvp.footer_pagination(page_obj, page_info=True) }}",
+        page_obj=page_obj,
+    )
+
+
+@pytest.fixture
+def item_template(tmp_path, settings):
+    (tmp_path / "item.html").write_text('<p class="{{ object.name|avatar_color }}">{{ simplenamespace.name }}</p>')
+    templates = copy.deepcopy(settings.TEMPLATES)
+    templates[0]["DIRS"] = [tmp_path]
+    templates[0]["OPTIONS"].setdefault("builtins", []).append("mvp.templatetags.mvp")
+    settings.TEMPLATES = templates
+    return "item.html"
+
+
+@pytest.mark.parametrize("names", [["Ada", "Grace <3"], []])
+def test_list_grid_macro_matches_list_view(item_template, names):
+    object_list = [SimpleNamespace(name=name) for name in names]
+    grid_config = {"cols": 1, "md": 2, "xl": 3, "id": "results"}
+
+    assert_same(
+        """{% load mvp %}<c-grid :attrs="grid_config">
+             {% for object in object_list %}
+               <div class="col">{% render_list_item object list_item_template %}</div>
+             {% empty %}
+               <c-list.empty />
+             {% endfor %}
+           </c-grid>""",
+        "{{ mvp.list_grid(object_list, list_item_template, grid_config) }}",
+        object_list=object_list,
+        list_item_template=item_template,
+        grid_config=grid_config,
+    )
+
+
+def test_helpers_match_template_tags():
+    context = {"name": "Ada Lovelace", "slot": "  ", "other": "x", "md": 2, "lg": 4}
+
+    assert render_jinja(
+        '{{ name|avatar_color }}|{{ responsive("col") }}|{{ slot_exists(slot) }}|{{ slot_exists(slot, other) }}',
+        **context,
+    ) == render_django(
+        '{% load mvp %}{{ name|avatar_color }}|{% responsive "col" %}|{% slot_exists slot %}|{% slot_exists slot other %}',
+        **context,
+    )
+    assert mvp_tags.responsive_classes("col", md=2, lg=None) == "col-md-2"
@@ -0,0 +1,108 @@
+"""Tests for the server-rendered layout state."""
+
+import pytest
+from django.template import Context, Template
+from django.template.loader import render_to_string
+from django.test import RequestFactory
+from django_cotton.compiler_regex import CottonCompiler
+
+from mvp.layout_state import LayoutState, get_layout_state
+from mvp.templatetags.mvp import SCRIPTS_ATTR
+
+compiler = CottonCompiler()
+
+
+@pytest.fixture
+def state_cookie(settings):
+    settings.MVP = {"layout": {"state_cookie": "mvp_layout"}}
+    return "mvp_layout"
+
+
+def request_with_cookie(value=None):
+    request = RequestFactory().get("/")
+    if value is not None:
+        request.COOKIES["mvp_layout"] = value
+    return request
+
+
+def render(source, request):
+    return Template(compiler.process(source)).render(Context({"request": request}))
+
+
+def test_cookie_values_are_validated():
+    state = LayoutState.from_cookie("scheme=dark&sidebar=bogus&sidebar_right=collapsed&other=1")
+
+    assert state == LayoutState(scheme="dark", sidebar_right="collapsed")
+    assert state.is_page_sidebar_collapsed("right", False) is True
+    assert state.is_page_sidebar_collapsed("left", "default") == "default"
+
+
+def test_state_is_false_until_a_value_is_stored():
+    assert not LayoutState.from_cookie("")
+    assert not LayoutState.from_cookie("sidebar=bogus")
+    assert LayoutState.from_cookie("sidebar=open")
+
+
+def test_state_is_disabled_by_default():
+    assert get_layout_state(request_with_cookie("scheme=dark")) is None
+
+
+def test_base_template_renders_state_without_pre_paint_script(state_cookie):
+    html = render_to_string("mvp/base.html", request=request_with_cookie("scheme=dark&sidebar=collapse"))
+
+    assert '<html lang="en"\n      data-mvp-state-cookie="mvp_layout" data-bs-theme="dark">' in html
+    assert "localStorage.getItem('theme')" not in html
+    assert 'src="/static/js/modules/layout-state.js"' in html
+
+
+@pytest.mark.parametrize("cookie", [None, "", "scheme=bogus"])
+def test_base_template_keeps_pre_paint_script_until_state_is_stored(state_cookie, cookie):
+    html = render_to_string("mvp/base.html", request=request_with_cookie(cookie))
+
+    assert "localStorage.getItem('theme')" in html
+    assert 'data-mvp-state-cookie="mvp_layout"' in html
+    assert "data-bs-theme" not in html.split("<head>")[0]
+
+
+def test_base_template_keeps_pre_paint_script_without_state_cookie():
+    html = render_to_string("mvp/base.html", request=request_with_cookie())
+
+    assert "localStorage.getItem('theme')" in html
+    assert "data-mvp-state-cookie" not in html
+
+
+@pytest.mark.parametrize(
+    ("cookie", "collapsed"),
+    [(None, True), ("", True), ("sidebar=collapse", True), ("sidebar=open", False)],
+)
+def test_app_sidebar_state(state_cookie, cookie, collapsed):
+    html = render("<c-app sidebar_collapsible collapsed>B</c-app>", request_with_cookie(cookie))
+
+    assert ("sidebar-collapse" in html) is collapsed
+
+
+def test_app_loads_state_script_before_state_is_stored(state_cookie):
+    request = request_with_cookie()
+    render("<c-app>B</c-app>", request)
+
+    assert "js/modules/layout-state.js" in getattr(request, SCRIPTS_ATTR)["required"]
+
+
+def test_app_sidebar_collapsed_from_cookie(state_cookie):
+    html = render("<c-app>B</c-app>", request_with_cookie("sidebar=collapse"))
+
+    assert "sidebar-collapse" in html
+
+
+@pytest.mark.parametrize(
+    ("source", "cookie", "shown"),
+    [
+        ('<c-page.sidebar side="right">S</c-page.sidebar>', "sidebar_right=collapsed", False),
+        ('<c-page.sidebar side="right" collapsed>S</c-page.sidebar>', "sidebar_right=shown", True),
+        ('<c-page.sidebar side="right" collapsed>S</c-page.sidebar>', "sidebar_left=shown", False),
+    ],
+)
+def test_page_sidebar_state(state_cookie, source, cookie, shown):
+    html = render(source, request_with_cookie(cookie))
+
+    assert ("collapse show" in html) is shown
@@ -0,0 +1,126 @@
+"""Tests for the mvp template loader."""
+
+import pytest
+from django.conf import settings
+from django.core.management import call_command
+from django.template import engines
+from django.test import override_settings
+
+from mvp.loaders import Loader, build_template_index, compact_whitespace, get_cache_key
+
+COMPONENT = '<c-vars title="x" /><div><c-icon name="home" /></div>'
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    with override_settings(MVP={"templates": {"cache_dir": str(tmp_path)}}):
+        yield tmp_path
+
+
+def make_loader():
+    return Loader(engines["django"].engine)
+
+
+def test_compiled_templates_are_written_to_disk(cache_dir):
+    compiled = make_loader().compile(COMPONENT)
+
+    assert (cache_dir / f"{get_cache_key(COMPONENT)}.html").read_text() == compiled
+
+
+def test_new_loaders_reuse_the_disk_cache(cache_dir, monkeypatch):
+    expected = make_loader().compile(COMPONENT)
+
+    loader = make_loader()
+    monkeypatch.setattr(loader.cotton_compiler, "process", lambda source: pytest.fail("recompiled"))
+
+    assert loader.compile(COMPONENT) == expected
+
+
+def test_plain_templates_bypass_the_cache(cache_dir):
+    assert make_loader().compile("<p>{{ value }}</p>") == "<p>{{ value }}</p>"
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_build_template_cache_command(cache_dir):
+    call_command("build_template_cache")
+
+    assert len(list(cache_dir.glob("*.html"))) > 50
+
+
+def test_index_maps_names_to_paths_in_directory_order(tmp_path):
+    first, second = tmp_path / "first", tmp_path / "second"
+    (first / "app").mkdir(parents=True)
+    (second / "app").mkdir(parents=True)
+    (first / "app" / "page.html").write_text("first")
+    (second / "app" / "page.html").write_text("second")
+    (second / "app" / "other.html").write_text("other")
+
+    index = build_template_index([first, second])
+
+    assert index["app/page.html"] == (str(first / "app" / "page.html"), str(second / "app" / "page.html"))
+    assert index["app/other.html"] == (str(second / "app" / "other.html"),)
+
+
+def test_indexed_loader_finds_templates():
+    sources = list(make_loader().get_template_sources("cotton/icon.html"))
+
+    assert sources
+    assert sources[0].name.endswith("cotton/icon.html")
+
+
+def test_misses_do_not_touch_the_filesystem(monkeypatch):
+    loader = make_loader()
+    loader.get_index()
+    monkeypatch.setattr("os.walk", lambda *args, **kwargs: pytest.fail("index rebuilt"))
+
+    assert list(loader.get_template_sources("cotton/missing.html")) == []
+
+
+def test_reset_discards_the_index():
+    loader = make_loader()
+    loader.get_index()
+    loader.reset()
+
+    assert loader._index is None
+
+
+def get_contents(loader, template_name):
+    return loader.get_contents(next(loader.get_template_sources(template_name)))
+
+
+def test_compact_whitespace_collapses_indentation_to_line_breaks():
+    source = "<ul>\n    <li>\n      <a>One</a>\n\n      <a>Two</a>\n    </li>\n</ul>\n"
+
+    assert compact_whitespace(source) == "<ul>\n<li>\n<a>One</a>\n<a>Two</a>\n</li>\n</ul>\n"
+
+
+def test_compact_whitespace_keeps_inline_spacing():
+    assert compact_whitespace("<b>a</b> <i>b</i>\n  <i>c</i>") == "<b>a</b> <i>b</i>\n<i>c</i>"
+
+
+@pytest.mark.parametrize(
+    "block",
+    [
+        "<pre class='code'>\n  a\n    b\n</pre>",
+        "<textarea>\n  a\n</textarea>",
+        "<script>\n  const a = `\n    b`;\n</script>",
+        "{% verbatim %}\n  {{ a }}\n{% endverbatim %}",
+        "{% show_code %}\n  <c-icon />\n{% endshow_code %}",
+    ],
+)
+def test_compact_whitespace_preserves_whitespace_sensitive_blocks(block):
+    assert compact_whitespace(f"<div>\n  {block}\n  </div>") == f"<div>\n{block}\n</div>"
+
+
+def test_loader_compacts_mvp_templates_only(tmp_path):
+    (tmp_path / "page.html").write_text("<div>\n  <p>Hi</p>\n</div>")
+    with override_settings(TEMPLATES=[{**settings.TEMPLATES[0], "DIRS": [tmp_path]}]):
+        loader = make_loader()
+
+        assert "\n  " not in get_contents(loader, "cotton/card/index.html")
+        assert get_contents(loader, "page.html") == "<div>\n  <p>Hi</p>\n</div>"
+
+
+def test_whitespace_compaction_can_be_disabled():
+    with override_settings(MVP={"templates": {"compact_whitespace": False}}):
+        assert "\n  " in get_contents(make_loader(), "cotton/card/index.html")
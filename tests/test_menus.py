@@ -0,0 +1,213 @@
+"""Tests for batched permission checks in mvp.menus."""
+
+import functools
+
+import pytest
+from django.contrib.auth.models import AnonymousUser, Permission, User
+from django.core.cache import cache
+from django.core.signals import request_started
+from django.test import RequestFactory, override_settings
+from flex_menu import Menu, MenuItem
+
+from mvp.menus import (
+    Badge,
+    PermissionCheck,
+    get_granted_permissions,
+    get_visibility_key,
+    refresh_stale_badges,
+    resolve_badges,
+)
+from mvp.renderers import AdminLTERenderer
+
+
+@pytest.fixture
+def perms_menu():
+    menu = Menu(
+        "PermsTestMenu",
+        children=[
+            MenuItem(name="public", url="/public/"),
+            MenuItem(name="users", url="/users/", check=PermissionCheck("auth.view_user")),
+            MenuItem(
+                name="groups",
+                url="/groups/",
+                check=PermissionCheck("auth.view_group", "auth.change_group"),
+            ),
+        ],
+    )
+    yield menu
+    menu.pop()
+
+
+def make_request(user):
+    request = RequestFactory().get("/")
+    request.user = user
+    return request
+
+
+def visible_names(menu, request):
+    return [child.name for child in menu.process(request).visible_children]
+
+
+@pytest.mark.django_db
+def test_permission_check_hides_items_without_permission(perms_menu):
+    user = User.objects.create_user("alice")
+    user.user_permissions.add(Permission.objects.get(codename="view_user"))
+
+    assert visible_names(perms_menu, make_request(user)) == ["public", "users"]
+
+
+def test_anonymous_user_sees_only_ungated_items(perms_menu):
+    assert visible_names(perms_menu, make_request(AnonymousUser())) == ["public"]
+
+
+@pytest.mark.django_db
+def test_active_superuser_sees_everything_without_queries(perms_menu, django_assert_num_queries):
+    user = User(username="root", is_superuser=True, is_active=True)
+
+    with django_assert_num_queries(0):
+        names = visible_names(perms_menu, make_request(user))
+
+    assert names == ["public", "users", "groups"]
+
+
+@pytest.mark.django_db
+def test_permissions_resolved_once_per_request(perms_menu, django_assert_num_queries):
+    user = User.objects.create_user("bob")
+    request = make_request(user)
+
+    # ModelBackend loads user and group permissions once, regardless of item count.
+    with django_assert_num_queries(2):
+        perms_menu.process(request)
+        perms_menu.process(request)
+        get_granted_permissions(request)
+
+
+class ViewUserBackend:
+    """Backend granting auth.view_user through has_perm() only, like rule-based backends."""
+
+    def authenticate(self, request, **credentials):
+        return None
+
+    def has_perm(self, user_obj, perm, obj=None):
+        return perm == "auth.view_user"
+
+
+@pytest.mark.django_db
+@override_settings(
+    AUTHENTICATION_BACKENDS=["django.contrib.auth.backends.ModelBackend", "tests.test_menus.ViewUserBackend"]
+)
+def test_permissions_granted_by_has_perm_only_backends(perms_menu):
+    user = User.objects.create_user("frank")
+
+    assert visible_names(perms_menu, make_request(user)) == ["public", "users"]
+
+
+@pytest.mark.django_db
+def test_visibility_key_depends_only_on_granted_permissions(perms_menu):
+    first = User.objects.create_user("carol")
+    second = User.objects.create_user("dave")
+    third = User.objects.create_user("erin")
+    third.user_permissions.add(Permission.objects.get(codename="view_user"))
+
+    assert get_visibility_key(make_request(first)) == get_visibility_key(make_request(second))
+    assert get_visibility_key(make_request(first)) != get_visibility_key(make_request(third))
+
+
+def test_renderer_exposes_visibility_key(perms_menu):
+    request = make_request(AnonymousUser())
+    processed = perms_menu.process(request)
+
+    context = AdminLTERenderer().get_context_data(processed)
+
+    assert context["visibility_key"] == get_visibility_key(request)
+
+
+@pytest.fixture
+def locmem_cache():
+    with override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}):
+        cache.clear()
+        yield cache
+        cache.clear()
+
+
+class Counter:
+    def __init__(self, value=3):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self, request):
+        self.calls += 1
+        return self.value
+
+
+def test_badges_are_only_evaluated_for_visible_items(locmem_cache):
+    visible, hidden = Counter(), Counter()
+    menu = Menu(
+        "BadgeTestMenu",
+        children=[
+            MenuItem(name="shown", url="/shown/", extra_context={"badge": Badge(visible, key="shown")}),
+            MenuItem(name="hidden", url="/hidden/", check=False, extra_context={"badge": Badge(hidden, key="hidden")}),
+        ],
+    )
+    try:
+        processed = menu.process(make_request(AnonymousUser()))
+        AdminLTERenderer().get_context_data(processed)
+    finally:
+        menu.pop()
+
+    assert processed.visible_children[0].extra_context["badge"] == 3
+    assert (visible.calls, hidden.calls) == (1, 0)
+
+
+def test_badges_are_cached_between_requests(locmem_cache):
+    counter = Counter()
+    badge = Badge(counter, key="cached")
+
+    assert resolve_badges(make_request(AnonymousUser()), [badge]) == [3]
+    assert resolve_badges(make_request(AnonymousUser()), [badge]) == [3]
+    assert counter.calls == 1
+
+
+@pytest.mark.django_db
+def test_stale_badges_are_served_then_refreshed_once(locmem_cache):
+    counter = Counter()
+    badge = Badge(counter, key="stale", ttl=0)
+    resolve_badges(make_request(AnonymousUser()), [badge])
+    counter.value = 7
+    request_started.send(sender=None)
+
+    assert resolve_badges(make_request(AnonymousUser()), [badge]) == [3]
+    assert resolve_badges(make_request(AnonymousUser()), [badge]) == [3]
+    assert counter.calls == 1
+
+    refresh_stale_badges()
+
+    assert counter.calls == 2
+    assert cache.get(badge.get_cache_key(make_request(AnonymousUser())))[0] == 7
+
+
+def test_stale_badges_are_refreshed_right_away_outside_a_request(locmem_cache):
+    counter = Counter()
+    badge = Badge(counter, key="stale-command", ttl=0)
+    resolve_badges(make_request(AnonymousUser()), [badge])
+    counter.value = 7
+
+    assert resolve_badges(make_request(AnonymousUser()), [badge]) == [3]
+    assert counter.calls == 2
+    assert resolve_badges(make_request(AnonymousUser()), [badge]) == [7]
+
+
+def badge_count(request):
+    return 1
+
+
+@pytest.mark.parametrize("func", [lambda request: 1, functools.partial(badge_count), Counter()])
+def test_badges_of_anonymous_callables_require_a_key(func):
+    with pytest.raises(ValueError, match="requires a key"):
+        Badge(func)
+
+    assert Badge(func, key="explicit").key == "explicit"
+
+
+def test_badge_key_defaults_to_the_dotted_path():
+    assert Badge(badge_count).key == "tests.test_menus.badge_count"
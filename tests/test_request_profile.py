@@ -0,0 +1,90 @@
+"""Tests for the on-demand request profiling middleware."""
+
+import pstats
+
+import pytest
+from django.conf import settings
+from django.test import override_settings
+
+from mvp.request_profile import get_profile_dir
+
+MIDDLEWARE = [*settings.MIDDLEWARE, "mvp.middleware.RequestProfileMiddleware"]
+
+# The test settings use the dummy cache, which cannot count profiles.
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@pytest.fixture(autouse=True)
+def profiling(tmp_path):
+    def configure(**options):
+        return override_settings(
+            MIDDLEWARE=MIDDLEWARE,
+            MVP={"profiling": {"profiler": "cprofile", "directory": str(tmp_path), **options}},
+        )
+
+    with configure():
+        yield configure
+
+
+def stored_profiles():
+    return sorted(path.name for path in get_profile_dir().iterdir())
+
+
+def test_staff_can_profile_and_download_a_request(admin_client, products, tmp_path):
+    response = admin_client.get("/list-view/basic/", {"mvp_cprofile": ""})
+
+    assert response.status_code == 200
+    url = response["X-MVP-Profile"]
+    assert url.startswith("/list-view/basic/?mvp_cprofile_download=")
+    download = admin_client.get(url)
+    assert download["Content-Disposition"].startswith('attachment; filename="')
+    downloaded = tmp_path / "downloaded.prof"
+    downloaded.write_bytes(b"".join(download.streaming_content))
+    stats = pstats.Stats(str(downloaded))
+    assert any(function == "get_queryset" for _, _, function in stats.stats)
+
+
+def test_the_profile_header_enables_profiling(admin_client):
+    response = admin_client.get("/", headers={"X-MVP-Profile": "1"})
+
+    assert "X-MVP-Profile" in response
+    assert len(stored_profiles()) == 1
+
+
+def test_other_users_are_not_profiled(client, django_user_model):
+    client.force_login(django_user_model.objects.create_user("visitor"))
+
+    response = client.get("/", {"mvp_cprofile": ""})
+
+    assert "X-MVP-Profile" not in response
+    assert stored_profiles() == []
+
+
+def test_downloads_only_serve_stored_profiles(admin_client):
+    assert admin_client.get("/", {"mvp_cprofile_download": "../settings.py"}).status_code == 404
+    assert admin_client.get("/", {"mvp_cprofile_download": "1-" + "0" * 32 + ".prof"}).status_code == 404
+
+
+def test_profiles_are_rate_limited(admin_client, profiling):
+    with profiling(rate=1), override_settings(CACHES=LOCMEM_CACHES):
+        admin_client.get("/", {"mvp_cprofile": ""})
+        response = admin_client.get("/", {"mvp_cprofile": ""})
+
+    assert response["X-MVP-Profile"] == "rate-limited"
+    assert len(stored_profiles()) == 1
+
+
+def test_large_profiles_are_discarded(admin_client, profiling):
+    with profiling(max_size=10):
+        response = admin_client.get("/", {"mvp_cprofile": ""})
+
+    assert response["X-MVP-Profile"] == "too-large"
+    assert stored_profiles() == []
+
+
+def test_old_profiles_are_pruned(admin_client, profiling):
+    with profiling(max_files=1):
+        admin_client.get("/", {"mvp_cprofile": ""})
+        newest = admin_client.get("/", {"mvp_cprofile": ""})["X-MVP-Profile"]
+
+    assert stored_profiles() == [newest.rsplit("=", 1)[1]]
@@ -0,0 +1,77 @@
+"""Tests for the SVG icon sprite."""
+
+import json
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from mvp.sprites import SPRITE_MANIFEST, SpriteRenderer, build_sprite, get_symbol_id
+
+HOUSE = '<svg xmlns="http://www.w3.org/2000/svg" width="16" height="16" class="bi bi-house" viewBox="0 0 16 16"><path d="M8 1"/></svg>'
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    source = tmp_path / "icons"
+    source.mkdir()
+    (source / "house.svg").write_text(HOUSE)
+    (source / "search.svg").write_text(HOUSE.replace("M8 1", "M1 8"))
+    return source
+
+
+def test_symbol_ids_follow_bootstrap_icon_file_names():
+    assert get_symbol_id("bi bi-house") == "house"
+    assert get_symbol_id("custom.svg") == "custom"
+
+
+def test_build_sprite_deduplicates_aliases_and_reports_missing(source_dir):
+    sprite, missing = build_sprite({"home": "bi bi-house", "house": "bi bi-house", "gear": "bi bi-gear"}, source_dir)
+
+    assert sprite.count("<symbol") == 1
+    assert '<symbol id="house" viewBox="0 0 16 16"><path d="M8 1"/></symbol>' in sprite
+    assert missing == ["gear"]
+
+
+def test_command_writes_hashed_sprite_and_manifest(source_dir, tmp_path, settings):
+    settings.EASY_ICONS = {"default": {"renderer": "mvp.sprites.SpriteRenderer", "icons": {"home": "bi bi-house"}}}
+    output = tmp_path / "static"
+
+    call_command("build_icon_sprite", source=str(source_dir), output_dir=str(output))
+
+    manifest = json.loads((output / SPRITE_MANIFEST).read_text())
+    assert manifest["sprite"].startswith("mvp/icons/sprite.")
+    assert "house" in (output / manifest["sprite"]).read_text()
+
+
+def test_command_skips_prefixed_static_dirs(source_dir, tmp_path, settings):
+    settings.EASY_ICONS = {"default": {"renderer": "mvp.sprites.SpriteRenderer", "icons": {"home": "bi bi-house"}}}
+    output = tmp_path / "static"
+    settings.STATICFILES_DIRS = [("vendor", tmp_path / "vendor"), output]
+
+    call_command("build_icon_sprite", source=str(source_dir))
+
+    assert (output / SPRITE_MANIFEST).is_file()
+    assert not (tmp_path / "vendor").exists()
+
+
+def test_command_refuses_prefixed_static_dirs(source_dir, tmp_path, settings):
+    settings.EASY_ICONS = {"default": {"renderer": "mvp.sprites.SpriteRenderer", "icons": {"home": "bi bi-house"}}}
+    settings.STATICFILES_DIRS = [("vendor", tmp_path / "vendor")]
+
+    with pytest.raises(CommandError, match="only has prefixed entries"):
+        call_command("build_icon_sprite", source=str(source_dir))
+    assert not (tmp_path / "vendor").exists()
+
+
+def test_command_strict_fails_on_missing_icons(source_dir, tmp_path):
+    with pytest.raises(CommandError, match="No SVG found"):
+        call_command("build_icon_sprite", source=str(source_dir), output_dir=str(tmp_path), strict=True)
+
+
+def test_sprite_renderer_references_symbols():
+    renderer = SpriteRenderer(icons={"home": "bi bi-house"}, sprite_url="/static/sprite.abc.svg")
+
+    html = renderer("home", **{"class": "nav-icon"})
+
+    assert html.startswith('<svg aria-hidden="true" class="bi nav-icon"')
+    assert '<use href="/static/sprite.abc.svg#house"></use>' in html
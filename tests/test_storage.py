@@ -0,0 +1,76 @@
+"""Tests for the precompressing static files storage."""
+
+import gzip
+import os
+
+import pytest
+from django.core.management import call_command
+
+from mvp import storage
+
+CSS = ".app-sidebar{display:block}\n" * 100
+
+
+@pytest.fixture
+def collect(tmp_path, settings):
+    source = tmp_path / "source"
+    (source / "css").mkdir(parents=True)
+    (source / "css/app.css").write_text(CSS)
+    (source / "css/tiny.css").write_text("a{}")
+    (source / "logo.png").write_bytes(b"\x89PNG" * 200)
+    settings.STATICFILES_DIRS = [source]
+    settings.STATICFILES_FINDERS = ["django.contrib.staticfiles.finders.FileSystemFinder"]
+    settings.STATIC_ROOT = tmp_path / "static"
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "staticfiles": {"BACKEND": "mvp.storage.CompressedManifestStaticFilesStorage", "OPTIONS": {"workers": 2}},
+    }
+
+    def run():
+        call_command("collectstatic", interactive=False, verbosity=0)
+        return settings.STATIC_ROOT
+
+    return run
+
+
+def test_collectstatic_writes_gzip_variants_of_original_and_hashed_files(collect):
+    root = collect()
+
+    hashed = next((root / "css").glob("app.*.css"))
+    for path in (root / "css/app.css", hashed):
+        assert gzip.decompress(path.with_name(path.name + ".gz").read_bytes()).decode() == CSS
+
+
+def test_small_and_binary_files_are_not_compressed(collect):
+    root = collect()
+
+    assert not list(root.rglob("tiny*.gz"))
+    assert not list(root.rglob("*.png.gz"))
+
+
+@pytest.mark.parametrize(
+    ("name", "content"),
+    [("css/app.css", b"a{}"), ("notes.txt", os.urandom(1024))],
+    ids=["small", "incompressible"],
+)
+def test_outdated_variants_are_removed(collect, tmp_path, name, content):
+    source = tmp_path / "source" / name
+    source.write_text(CSS)
+    root = collect()
+    assert (root / f"{name}.gz").exists()
+
+    source.write_bytes(content)
+    # collectstatic only copies files newer than the collected copy.
+    os.utime(source, (source.stat().st_atime, source.stat().st_mtime + 10))
+    collect()
+
+    assert (root / name).read_bytes() == content
+    assert not (root / f"{name}.gz").exists()
+    assert not (root / f"{name}.br").exists()
+
+
+@pytest.mark.skipif(storage.brotli is None, reason="brotli is not installed")
+def test_collectstatic_writes_brotli_variants(collect):
+    root = collect()
+
+    assert storage.brotli.decompress((root / "css/app.css.br").read_bytes()).decode() == CSS
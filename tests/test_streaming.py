@@ -0,0 +1,78 @@
+"""Tests for streamed view responses."""
+
+import re
+
+import pytest
+from django.db import connection
+from django.http import Http404, StreamingHttpResponse
+from django.template import Context, Template, TemplateSyntaxError
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from example.views import BasicListViewDemo, ContactFormView
+from mvp.streaming import STREAM_CONTEXT_KEY, ContentStream
+
+
+def test_stream_content_renders_in_place_without_a_stream():
+    html = Template("{% load mvp %}a{% stream_content %}{{ value }}{% endstream_content %}c").render(
+        Context({"value": "b"})
+    )
+
+    assert html == "abc"
+
+
+def test_stream_content_only_streams_one_block():
+    source = "{% load mvp %}{% stream_content %}{% endstream_content %}{% stream_content %}{% endstream_content %}"
+    context = Context({STREAM_CONTEXT_KEY: ContentStream()})
+
+    with pytest.raises(TemplateSyntaxError):
+        Template(source).render(context)
+
+
+def test_list_view_streams_the_shell_before_querying(products):
+    view = BasicListViewDemo.as_view(stream=True)
+
+    with CaptureQueriesContext(connection) as queries:
+        response = view(RequestFactory().get("/"))
+        chunks = iter(response.streaming_content)
+        shell = next(chunks).decode()
+    assert isinstance(response, StreamingHttpResponse)
+    assert "</head>" in shell
+    assert "app-sidebar" in shell
+    assert "Product 0" not in shell
+    assert not queries.captured_queries
+
+    content = next(chunks).decode()
+    assert all(f"Product {index}" in content for index in range(3))
+    assert next(chunks).decode().rstrip().endswith("</html>")
+
+
+def test_streamed_list_view_matches_the_rendered_one(products):
+    def get(**initkwargs):
+        return BasicListViewDemo.as_view(**initkwargs)(RequestFactory().get("/", {"o": "-name"}))
+
+    rendered = get().render().content.decode()
+    streamed = b"".join(get(stream=True).streaming_content).decode()
+
+    # Scripts required by the streamed content are loaded where it requires them.
+    assert streamed.index("search-widget.js") < streamed.index('class="input-group"')
+    scripts_and_space = re.compile(r'<script type="module" src="[^"]+"></script>|\s+')
+    assert scripts_and_space.sub("", streamed) == scripts_and_space.sub("", rendered)
+
+
+@pytest.mark.parametrize("page", ["two", "0", "-1"])
+def test_invalid_page_numbers_are_rejected_before_streaming(products, page):
+    view = BasicListViewDemo.as_view(stream=True)
+
+    with pytest.raises(Http404):
+        view(RequestFactory().get("/", {"page": page}))
+
+
+@pytest.mark.django_db
+def test_form_view_streams():
+    response = ContactFormView.as_view(stream=True)(RequestFactory().get("/"))
+
+    html = b"".join(response.streaming_content).decode()
+    assert isinstance(response, StreamingHttpResponse)
+    assert "<form" in html
+    assert "csrfmiddlewaretoken" in html
@@ -0,0 +1,134 @@
+"""Tests for the prebuilt stylesheets."""
+
+import json
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.template.loader import render_to_string
+from django.test import RequestFactory
+
+from mvp.checks import check_styles
+from mvp.styles import (
+    STYLES_MANIFEST,
+    STYLESHEETS,
+    extract_critical_css,
+    extract_root_variables,
+    get_critical_css,
+    get_stylesheet_urls,
+)
+
+CRITICAL_CSS_BUDGET = 14 * 1024
+
+
+@pytest.fixture
+def built_styles(tmp_path, settings):
+    output = tmp_path / "static"
+    settings.STATICFILES_DIRS = [output]
+    call_command("build_styles")
+    return output
+
+
+def test_command_writes_hashed_css_and_manifest(built_styles):
+    manifest = json.loads((built_styles / STYLES_MANIFEST).read_text())
+
+    assert list(manifest) == ["scss/mvp-layout.scss", "scss/mvp.scss", "critical"]
+    for compiled in manifest.values():
+        assert compiled.startswith("mvp/css/") and compiled.endswith(".css")
+        assert "$" not in (built_styles / compiled).read_text()
+
+
+def test_overrides_are_compiled_in(tmp_path, settings):
+    overrides = tmp_path / "_overrides.scss"
+    overrides.write_text("$mvp-sidebar-width: 321px;")
+    settings.MVP = {"styles": {"overrides": [str(overrides)]}}
+    output = tmp_path / "static"
+
+    call_command("build_styles", output_dir=str(output))
+
+    manifest = json.loads((output / STYLES_MANIFEST).read_text())
+    assert "321px" in (output / manifest["scss/mvp-layout.scss"]).read_text()
+
+
+def test_base_template_links_prebuilt_styles(built_styles, settings):
+    settings.MVP = {"styles": {"prebuilt": True}}
+    manifest = json.loads((built_styles / STYLES_MANIFEST).read_text())
+
+    html = render_to_string("mvp/base.html", request=RequestFactory().get("/"))
+
+    for path in STYLESHEETS:
+        assert f'<link rel="stylesheet" href="/static/{manifest[path]}" />' in html
+    assert "<style>" not in html
+    assert "text/x-scss" not in html
+
+
+def test_prebuilt_styles_require_a_build(tmp_path, settings):
+    settings.STATICFILES_DIRS = [tmp_path]
+    settings.MVP = {"styles": {"prebuilt": True}}
+
+    with pytest.raises(ImproperlyConfigured, match="build_styles"):
+        get_stylesheet_urls()
+
+
+def test_extract_critical_css_keeps_app_shell_rules():
+    css = (
+        '@charset "UTF-8";/* .app-header */:root{--x:1}'
+        ".btn,.app-header{height:3rem}.table{width:100%}"
+        "@media (min-width:992px){.sidebar-expand-lg .app-sidebar{display:block}.btn{color:red}}"
+        "@media print{.btn{display:none}}@keyframes spin{to{transform:rotate(1turn)}}"
+        '.app-main:not(.sidebar-mini,.layout-fixed){content:"}"}'
+    )
+
+    assert extract_critical_css(css) == (
+        ".app-header{height:3rem}"
+        "@media (min-width:992px){.sidebar-expand-lg .app-sidebar{display:block}}"
+        '.app-main:not(.sidebar-mini,.layout-fixed){content:"}"}'
+    )
+
+
+def test_extract_critical_css_skips_content_hover_and_theme_rules():
+    css = (
+        ".app-sidebar .nav-link{color:red}.sidebar-mini .app-sidebar:hover{width:1px}"
+        "[data-bs-theme=dark] .app-sidebar{color:#fff}.card-group>.card{flex:1}"
+        "@media (prefers-reduced-motion:reduce){.app-main{transition:none}}.card{display:flex}"
+    )
+
+    assert extract_critical_css(css) == ".card{display:flex}"
+
+
+def test_extract_critical_css_keeps_grid_layouts_only():
+    css = ".mvp-layout.lhr-lpr-lfr{grid-template-areas:none}.mvp-layout.abc-def-ghi{gap:0}"
+
+    assert extract_critical_css(css) == ".mvp-layout.lhr-lpr-lfr{grid-template-areas:none}"
+
+
+def test_extract_root_variables_keeps_the_custom_properties_in_use():
+    css = ":root,[data-bs-theme=light]{--a:1;--b:var(--a);--c:2}.x{--d:3}"
+
+    assert extract_root_variables(css, ".app-main{margin:var(--b)}") == ":root{--a:1;--b:var(--a)}"
+    assert extract_root_variables(css, ".app-main{margin:0}") == ""
+
+
+def test_base_template_inlines_critical_css(built_styles, settings):
+    settings.MVP = {"styles": {"prebuilt": True, "critical": True}}
+
+    html = render_to_string("mvp/base.html", request=RequestFactory().get("/"))
+
+    assert f"<style>{get_critical_css()}</style>" in html
+    assert ".mvp-layout{" in get_critical_css()
+    assert '<link rel="preload" as="style" href="/static/css/adminlte.min.css"' in html
+    assert '<noscript><link rel="stylesheet" href="/static/css/adminlte.min.css" /></noscript>' in html
+
+
+def test_critical_css_requires_prebuilt_styles(settings):
+    settings.MVP = {"styles": {"critical": True}}
+
+    assert get_critical_css() == ""
+    assert [warning.id for warning in check_styles()] == ["mvp.W002"]
+
+
+def test_critical_css_fits_the_budget(built_styles):
+    manifest = json.loads((built_styles / STYLES_MANIFEST).read_text())
+
+    # Inlined into every page, so it must stay small: roughly the first round trip.
+    assert (built_styles / manifest["critical"]).stat().st_size <= CRITICAL_CSS_BUDGET
@@ -0,0 +1,76 @@
+"""Tests for the mvp template tag library."""
+
+from django.template import Context, Template
+from django.template.loader import render_to_string
+from django.test import RequestFactory
+from django_cotton.compiler_regex import CottonCompiler
+
+from mvp.templatetags import mvp as mvp_tags
+
+
+def render(source, **context):
+    return Template("{% load mvp %}" + source).render(Context(context))
+
+
+def test_show_code_renders_escaped_source_and_output():
+    html = render("{% show_code %}\n    <b>bold</b>\n{% endshow_code %}")
+
+    assert "&lt;b&gt;bold&lt;/b&gt;" in html
+    assert "<b>bold</b>" in html
+
+
+def test_show_code_compiles_each_snippet_once():
+    mvp_tags._compile_snippet.cache_clear()
+    source = "{% show_code %}<i>{{ name }}</i>{% endshow_code %}"
+
+    first = render(source, name="one")
+    again = render(source, name="one")
+    other = render(source, name="two")
+
+    info = mvp_tags._compile_snippet.cache_info()
+    assert (info.misses, info.hits) == (2, 1)
+    assert first == again
+    assert "<i>two</i>" in other
+
+
+def test_show_code_prepares_static_snippets_at_parse_time():
+    template = Template("{% load mvp %}{% show_code %}  <p>static</p>{% endshow_code %}")
+    node = template.nodelist[-1]
+
+    assert node.static == ("<p>static</p>", "&lt;p&gt;static&lt;/p&gt;")
+
+
+def test_required_scripts_are_output_once_by_mvp_scripts():
+    request = RequestFactory().get("/")
+    html = render(
+        '{% require_script "js/a.js" %}{% require_script "js/b.js" %}{% require_script "js/a.js" %}|{% mvp_scripts %}|'
+        '{% require_script "js/c.js" %}{% require_script "js/a.js" %}',
+        request=request,
+    )
+
+    assert html == (
+        '|<script type="module" src="/static/js/a.js"></script>\n'
+        '<script type="module" src="/static/js/b.js"></script>|'
+        '<script type="module" src="/static/js/c.js"></script>'
+    )
+
+
+def test_required_scripts_render_in_place_without_a_request():
+    assert render('{% require_script "js/a.js" %}|{% mvp_scripts %}') == (
+        '<script type="module" src="/static/js/a.js"></script>|'
+    )
+
+
+def test_base_template_loads_only_the_scripts_of_rendered_components():
+    html = render_to_string("mvp/base.html", request=RequestFactory().get("/"))
+
+    assert "js/modules/layout-toggle.js" not in html
+    assert "js/modules/search-widget.js" not in html
+
+
+def test_components_declare_their_scripts():
+    compiled = CottonCompiler().process("<c-list.search-widget />{% load mvp %}{% mvp_scripts %}")
+
+    html = Template(compiled).render(Context({"request": RequestFactory().get("/"), "is_searchable": True}))
+
+    assert html.count('<script type="module" src="/static/js/modules/search-widget.js"></script>') == 1
@@ -0,0 +1,81 @@
+"""Tests for the Server-Timing middleware and stage timings."""
+
+import logging
+
+import pytest
+from django.conf import settings
+from django.test import RequestFactory, override_settings
+
+from example.views import BasicListViewDemo
+from mvp.middleware import ServerTimingMiddleware
+from mvp.timing import Timings, get_timings, timed, timing
+
+MIDDLEWARE = ["mvp.middleware.ServerTimingMiddleware", *settings.MIDDLEWARE]
+
+
+def parse_header(value):
+    return {metric.split(";")[0]: metric for metric in value.split(", ")}
+
+
+def test_timed_does_nothing_outside_a_timed_request():
+    with timed("search"):
+        pass
+
+    assert get_timings() is None
+
+
+def test_timed_adds_up_durations_and_calls():
+    timings = Timings()
+    with timing(timings):
+        for _ in range(3):
+            with timed("items"):
+                pass
+
+    assert timings.counts == {"items": 3}
+    assert timings.as_dict()["items"]["count"] == 3
+    assert parse_header(timings.header())["items"].startswith("items;dur=")
+    assert 'desc="List item rendering"' in timings.header()
+
+
+@override_settings(MIDDLEWARE=MIDDLEWARE)
+def test_list_page_reports_each_stage(client, products, caplog):
+    with caplog.at_level(logging.INFO, logger="mvp.timing"):
+        response = client.get("/list-view/basic/", {"q": "product"})
+
+    metrics = parse_header(response["Server-Timing"])
+    assert {"search", "count", "fetch", "items", "menu", "config", "render", "total"} <= metrics.keys()
+    (record,) = caplog.records
+    assert record.getMessage().startswith("GET /list-view/basic/ 200 search=")
+    assert record.server_timing["items"]["count"] == 3
+    assert record.path == "/list-view/basic/"
+
+
+@override_settings(MIDDLEWARE=MIDDLEWARE, MVP={"timing": {"header": False, "log": False}})
+def test_header_and_log_can_be_disabled(client, products, caplog):
+    with caplog.at_level(logging.INFO, logger="mvp.timing"):
+        response = client.get("/list-view/basic/")
+
+    assert "Server-Timing" not in response
+    assert not caplog.records
+
+
+def test_streamed_stages_are_logged_when_the_stream_ends(products, caplog):
+    middleware = ServerTimingMiddleware(BasicListViewDemo.as_view(stream=True))
+
+    with caplog.at_level(logging.INFO, logger="mvp.timing"):
+        response = middleware(RequestFactory().get("/"))
+        assert "count" not in parse_header(response["Server-Timing"])
+        assert not caplog.records
+        b"".join(response.streaming_content)
+
+    (record,) = caplog.records
+    assert {"count", "fetch", "items"} <= record.server_timing.keys()
+
+
+@pytest.mark.parametrize("stage", ["count", "fetch"])
+def test_paginator_stages_run_once(products, stage):
+    timings = Timings()
+    with timing(timings):
+        BasicListViewDemo.as_view()(RequestFactory().get("/")).render()
+
+    assert timings.counts[stage] == 1
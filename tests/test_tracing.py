@@ -0,0 +1,91 @@
+"""Tests for the tracing spans around django-mvp's stages."""
+
+import pytest
+from django.test import override_settings
+
+from mvp.timing import timed
+from mvp.tracing import InMemoryTracer, get_tracer, span, use_tracer
+
+
+@pytest.fixture
+def tracer():
+    with use_tracer(InMemoryTracer()) as tracer:
+        yield tracer
+
+
+def test_tracing_is_disabled_by_default():
+    assert get_tracer() is None
+    with span("mvp.search"), timed("search"):
+        pass
+
+
+def test_nested_spans_record_their_parent(tracer):
+    with timed("render"), timed("items", **{"mvp.template": "item.html"}):
+        pass
+
+    items, render = tracer.spans
+    assert tracer.names() == ["mvp.items", "mvp.render"]
+    assert items.parent is render
+    assert render.children == [items]
+    assert items.attributes == {"mvp.template": "item.html"}
+    assert render.duration >= items.duration
+
+
+@override_settings(MVP={"tracing": {"tracer": "mvp.tracing.InMemoryTracer"}})
+def test_tracer_is_configured_by_dotted_path():
+    assert isinstance(get_tracer(), InMemoryTracer)
+    assert get_tracer() is get_tracer()
+
+
+def test_list_view_stages_are_traced(client, products, tracer):
+    client.get("/list-view/", {"q": "product", "o": "-price"})
+
+    names = set(tracer.names())
+    assert {"mvp.search", "mvp.order", "mvp.count", "mvp.fetch", "mvp.items", "mvp.menu", "mvp.config"} <= names
+    order = next(recorded for recorded in tracer.spans if recorded.name == "mvp.order")
+    assert order.attributes == {"mvp.ordering": "-price"}
+
+
+def test_form_view_stages_are_traced(client, tracer):
+    client.post("/contact/", {"name": "", "email": "not-an-email"})
+
+    names = tracer.names()
+    assert "mvp.form_renderer" in names
+    validation = next(recorded for recorded in tracer.spans if recorded.name == "mvp.validation")
+    assert validation.attributes == {"mvp.form": "ContactForm"}
+
+
+def test_opentelemetry_tracer_creates_spans():
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    from mvp.tracing import OpenTelemetryTracer
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+
+    with use_tracer(OpenTelemetryTracer(provider)), timed("count"):
+        pass
+
+    (exported,) = exporter.get_finished_spans()
+    assert exported.name == "mvp.count"
+
+
+@override_settings(MVP={"tracing": {"tracer": "mvp.tracing.Tracer"}})
+def test_base_tracer_does_nothing():
+    with timed("search"):
+        pass
+
+
+def test_unimportable_tracer_fails_at_startup():
+    from django.apps import apps
+    from django.core.exceptions import ImproperlyConfigured
+
+    with (
+        override_settings(MVP={"tracing": {"tracer": "mvp.tracing.MissingTracer"}}),
+        pytest.raises(ImproperlyConfigured, match="MissingTracer"),
+    ):
+        apps.get_app_config("mvp").ready()
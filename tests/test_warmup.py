@@ -0,0 +1,32 @@
+"""Tests for cotton component warmup."""
+
+from django.core.management import call_command
+from django.template import engines
+
+from mvp.warmup import get_component_template_names, get_django_engines, warm_templates
+
+
+def test_discovers_mvp_and_project_components():
+    names = get_component_template_names(get_django_engines()[0])
+
+    assert "cotton/app/index.html" in names
+    assert "cotton/card/index.html" in names
+    assert "cotton/documentation.html" in names  # example project component
+
+
+def test_warmup_fills_the_cached_loader():
+    engine = engines["django"].engine
+    cached_loader = engine.template_loaders[0]
+    cached_loader.reset()
+
+    result = warm_templates(["cotton/grid.html", "cotton/does_not_exist.html"])
+
+    assert result.warmed == ["cotton/grid.html"]
+    assert list(result.failed) == ["cotton/does_not_exist.html"]
+    assert "cotton/grid.html" in {key.split("-")[0] for key in cached_loader.get_template_cache}
+
+
+def test_management_command_reports_compiled_templates(capsys):
+    call_command("warm_templates", "cotton/icon.html")
+
+    assert "Compiled 1 templates" in capsys.readouterr().out